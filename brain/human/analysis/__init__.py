@@ -10,12 +10,18 @@ Quick usage:
     run_all.generate_action_items() # Priority actions
 """
 
+from .aggregate import NetworkAggregate, aggregate_network
+from .columnar import ColumnarNetwork
+from .context import AnalysisContext
+from .intro_graph import IntroGraph, IntroPath
+from .topic_match import TopicMatcher, match_topics
 from .network_intel import (
     stale_relationships,
     domain_matches,
     reconnection_suggestions,
     network_gaps,
     intro_paths,
+    best_intro_paths,
     network_summary,
     # New trust/energy functions
     high_trust_connections,
@@ -39,12 +45,22 @@ from .goal_alignment import (
 )
 
 __all__ = [
+    # Shared run context
+    "AnalysisContext",
+    "NetworkAggregate",
+    "aggregate_network",
+    "ColumnarNetwork",
+    "IntroGraph",
+    "IntroPath",
+    "TopicMatcher",
     # Network intelligence
     "stale_relationships",
     "domain_matches",
+    "match_topics",
     "reconnection_suggestions",
     "network_gaps",
     "intro_paths",
+    "best_intro_paths",
     "network_summary",
     # Trust & energy
     "high_trust_connections",
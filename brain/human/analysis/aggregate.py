@@ -0,0 +1,180 @@
+"""
+Network Aggregate
+Single-pass statistics over network.yaml shared by every analysis.
+
+aggregate_network() walks the connections exactly once and collects all
+per-connection counters the analyses need: strength/trust/energy
+histograms, domain histograms, company trust, assessment word counts and
+the candidate lists for date-based checks (staleness, trajectory,
+unassessed connections). Date cutoffs are applied by the analyses on those
+short candidate lists, so one aggregate serves any threshold.
+
+Usage:
+    agg = network_aggregate(context=context)
+    agg.domain_counts  # {"sales": 12, ...}
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .context import AnalysisContext, resolve_context
+
+
+def _strength_counts() -> dict:
+    return {"close": 0, "warm": 0, "cold": 0}
+
+
+@dataclass
+class NetworkAggregate:
+    """Counters collected in one pass over the connections."""
+
+    total: int = 0
+
+    # Histograms, seeded with the known levels so they always report them
+    by_strength: dict = field(default_factory=_strength_counts)
+    by_trust: dict = field(default_factory=lambda: {"high": 0, "medium": 0, "low": 0, "unknown": 0})
+    by_energy: dict = field(default_factory=lambda: {"energizing": 0, "neutral": 0, "draining": 0})
+
+    # Domains (in first-seen order)
+    domain_counts: dict = field(default_factory=dict)  # as written
+    domain_counts_lower: dict = field(default_factory=dict)  # case-folded
+    domain_by_strength: dict = field(default_factory=dict)  # domain -> strength counts
+    energy_by_domain: dict = field(default_factory=dict)  # domain -> energy counts + total
+
+    # Trust / energy cross-tabs
+    company_trust: dict = field(default_factory=dict)  # company -> high/low/total
+    trust_by_strength: dict = field(default_factory=dict)  # strength -> trust counts + total
+    energy_by_trust: dict = field(default_factory=dict)  # trust -> energizing/draining
+
+    # Assessments
+    with_positives: int = 0
+    with_negatives: int = 0
+    only_positive: int = 0
+    only_negative: int = 0
+    balanced: int = 0
+    positive_words: Counter = field(default_factory=Counter)
+    negative_words: Counter = field(default_factory=Counter)
+    low_trust_negative_words: Counter = field(default_factory=Counter)
+    undocumented_trust: list = field(default_factory=list)  # names
+
+    # Communication
+    message_counts_by_name: dict = field(default_factory=dict)
+    silent: list = field(default_factory=list)  # names with no messages
+
+    # Date-check candidates, filtered against a cutoff by the analyses
+    touch_candidates: list = field(default_factory=list)  # (conn, strength, last_touch)
+    cooling_candidates: list = field(default_factory=list)  # warm/close with last_message
+    warming_candidates: list = field(default_factory=list)  # cold, >= 2 messages, last_message
+    unassessed: list = field(default_factory=list)  # (name, connected_date)
+
+
+def aggregate_network(network: dict) -> NetworkAggregate:
+    """Collect every network counter in a single pass."""
+    agg = NetworkAggregate()
+
+    for conn in network.get("connections", []):
+        agg.total += 1
+
+        name = conn.get("name")
+        strength = conn.get("relationship_strength", "cold")
+        trust = conn.get("trust_level")
+        energy = conn.get("energy")
+        positives = conn.get("positives", [])
+        negatives = conn.get("negatives", [])
+        company = conn.get("company", "Unknown")
+        message_count = conn.get("message_count", 0)
+        last_message = conn.get("last_message")
+
+        # Histograms
+        agg.by_strength[strength] = agg.by_strength.get(strength, 0) + 1
+        trust_key = conn.get("trust_level", "unknown")
+        agg.by_trust[trust_key] = agg.by_trust.get(trust_key, 0) + 1
+        energy_key = conn.get("energy", "neutral")
+        agg.by_energy[energy_key] = agg.by_energy.get(energy_key, 0) + 1
+
+        # Domains
+        for domain in conn.get("domains", []):
+            agg.domain_counts[domain] = agg.domain_counts.get(domain, 0) + 1
+            domain_lower = domain.lower()
+            agg.domain_counts_lower[domain_lower] = agg.domain_counts_lower.get(domain_lower, 0) + 1
+
+            strengths = agg.domain_by_strength.setdefault(domain, _strength_counts())
+            strengths[strength] = strengths.get(strength, 0) + 1
+
+            energies = agg.energy_by_domain.setdefault(domain, {"energizing": 0, "draining": 0, "total": 0})
+            energies["total"] += 1
+            if energy:
+                energies[energy] = energies.get(energy, 0) + 1
+
+        # Trust by company and strength
+        company_stats = agg.company_trust.setdefault(company, {"high": 0, "low": 0, "total": 0})
+        if trust == "high":
+            company_stats["high"] += 1
+        elif trust == "low":
+            company_stats["low"] += 1
+            for reason in negatives:
+                agg.low_trust_negative_words.update(reason.lower().split())
+        company_stats["total"] += 1
+
+        strength_stats = agg.trust_by_strength.setdefault(strength, {"high": 0, "low": 0, "total": 0})
+        strength_stats["total"] += 1
+        if trust:
+            strength_stats[trust] = strength_stats.get(trust, 0) + 1
+
+        # Energy by trust
+        if energy in ("energizing", "draining"):
+            energy_trust = agg.energy_by_trust.setdefault(trust_key, {"energizing": 0, "draining": 0})
+            energy_trust[energy] += 1
+
+        # Assessments
+        if positives:
+            agg.with_positives += 1
+        if negatives:
+            agg.with_negatives += 1
+        if positives and not negatives:
+            agg.only_positive += 1
+        elif negatives and not positives:
+            agg.only_negative += 1
+        elif positives and negatives:
+            agg.balanced += 1
+
+        for p in positives:
+            agg.positive_words.update(w.lower() for w in p.split() if len(w) > 3)
+        for n in negatives:
+            agg.negative_words.update(w.lower() for w in n.split() if len(w) > 3)
+
+        if trust == "high" and not positives:
+            agg.undocumented_trust.append(name)
+
+        connected = conn.get("connected_date")
+        if connected and not trust and not positives and not negatives:
+            agg.unassessed.append((name, connected))
+
+        # Communication
+        if message_count > 0:
+            contact = conn.get("name", "")
+            agg.message_counts_by_name[contact] = agg.message_counts_by_name.get(contact, 0) + message_count
+        if message_count == 0:
+            agg.silent.append(name)
+
+        # Staleness and trajectory candidates
+        if strength in ("warm", "close"):
+            last_touch = conn.get("last_contact") or last_message
+            if last_touch:
+                agg.touch_candidates.append((conn, strength, last_touch))
+            if last_message:
+                agg.cooling_candidates.append((conn, strength, last_message))
+        if strength == "cold" and last_message and message_count >= 2:
+            agg.warming_candidates.append((conn, last_message))
+
+    return agg
+
+
+def network_aggregate(
+    network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
+) -> NetworkAggregate:
+    """Get the aggregate for a network, computed once per context."""
+    context = resolve_context(context, network=network)
+    return context.memo("network_aggregate", lambda: aggregate_network(context.network))
@@ -0,0 +1,186 @@
+"""
+Columnar Network View
+Optional NumPy representation of network.yaml for vectorized analysis.
+
+The dict-per-connection network is converted once into typed columns:
+categorical codes for strength/trust/energy, datetime64 arrays for the
+date fields, an int array of message counts and CSR-style arrays for
+domains. Staleness, trajectory and histogram analyses then run as
+vectorized masks instead of per-row string compares.
+
+Requires numpy (optional dependency):
+    pip install numpy
+
+Usage:
+    view = ColumnarNetwork.from_network(network)
+    stale = view.ids[view.stale_mask(threshold_days=180)]
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore[assignment]
+
+from .context import AnalysisContext, resolve_context
+
+# Category order defines the codes; -1 means missing or unrecognised
+STRENGTH_LEVELS = ("cold", "warm", "close")
+TRUST_LEVELS = ("high", "medium", "low", "unknown")
+ENERGY_LEVELS = ("energizing", "neutral", "draining")
+
+COLD, WARM, CLOSE = range(3)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Columnar analysis requires numpy: pip install numpy")
+
+
+def _codes(values: list[Any], levels: tuple[str, ...]) -> "np.ndarray":
+    lookup = {level: code for code, level in enumerate(levels)}
+    return np.fromiter((lookup.get(v, -1) for v in values), dtype=np.int8, count=len(values))
+
+
+def _dates(values: list[Any]) -> "np.ndarray":
+    """Convert ISO date strings (or dates) to datetime64[D]; others become NaT."""
+    cleaned = [v if v else None for v in values]
+    try:
+        return np.array(cleaned, dtype="datetime64[D]")
+    except ValueError:
+        out = np.full(len(cleaned), np.datetime64("NaT"), dtype="datetime64[D]")
+        for i, v in enumerate(cleaned):
+            try:
+                out[i] = np.datetime64(v, "D")
+            except (ValueError, TypeError):
+                pass
+        return out
+
+
+def _cutoff(days: int, today: Optional[date] = None) -> "np.datetime64":
+    day = np.datetime64(today or date.today(), "D")
+    return day - np.timedelta64(days, "D")
+
+
+@dataclass
+class ColumnarNetwork:
+    """Typed column arrays for a network, one row per connection."""
+
+    ids: "np.ndarray"  # object array of connection ids
+    names: "np.ndarray"  # object array of names
+    strength: "np.ndarray"  # int8 codes into STRENGTH_LEVELS
+    trust: "np.ndarray"  # int8 codes into TRUST_LEVELS
+    energy: "np.ndarray"  # int8 codes into ENERGY_LEVELS
+    message_count: "np.ndarray"  # int64
+    last_message: "np.ndarray"  # datetime64[D], NaT when missing
+    last_contact: "np.ndarray"  # datetime64[D], NaT when missing
+    connected_date: "np.ndarray"  # datetime64[D], NaT when missing
+    domain_vocab: list[str]  # domain strings, index = domain code
+    domain_indptr: "np.ndarray"  # int64, row i's domains are domain_indices[indptr[i]:indptr[i+1]]
+    domain_indices: "np.ndarray"  # int32 codes into domain_vocab
+
+    @classmethod
+    def from_network(cls, network: dict[str, Any]) -> "ColumnarNetwork":
+        """Build the columnar view in one pass over the connections."""
+        _require_numpy()
+        connections = network.get("connections", [])
+
+        ids, names, strengths, trusts, energies = [], [], [], [], []
+        counts, last_messages, last_contacts, connected = [], [], [], []
+        vocab: dict[str, int] = {}
+        indptr = [0]
+        indices: list[int] = []
+
+        for conn in connections:
+            ids.append(conn.get("id"))
+            names.append(conn.get("name"))
+            strengths.append(conn.get("relationship_strength", "cold"))
+            trusts.append(conn.get("trust_level", "unknown"))
+            energies.append(conn.get("energy", "neutral"))
+            counts.append(conn.get("message_count") or 0)
+            last_messages.append(conn.get("last_message"))
+            last_contacts.append(conn.get("last_contact"))
+            connected.append(conn.get("connected_date"))
+            for domain in conn.get("domains", []):
+                indices.append(vocab.setdefault(domain, len(vocab)))
+            indptr.append(len(indices))
+
+        return cls(
+            ids=np.array(ids, dtype=object),
+            names=np.array(names, dtype=object),
+            strength=_codes(strengths, STRENGTH_LEVELS),
+            trust=_codes(trusts, TRUST_LEVELS),
+            energy=_codes(energies, ENERGY_LEVELS),
+            message_count=np.array(counts, dtype=np.int64),
+            last_message=_dates(last_messages),
+            last_contact=_dates(last_contacts),
+            connected_date=_dates(connected),
+            domain_vocab=list(vocab),
+            domain_indptr=np.array(indptr, dtype=np.int64),
+            domain_indices=np.array(indices, dtype=np.int32),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # === MASKS ===
+
+    def stale_mask(self, threshold_days: int = 180, today: Optional[date] = None) -> "np.ndarray":
+        """Warm/close connections whose last touch is older than the threshold."""
+        last_touch = np.where(np.isnat(self.last_contact), self.last_message, self.last_contact)
+        warm_or_close = np.isin(self.strength, (WARM, CLOSE))
+        # NaT compares False, so connections never touched are excluded
+        return warm_or_close & (last_touch < _cutoff(threshold_days, today))
+
+    def cooling_mask(self, lookback_days: int = 90, today: Optional[date] = None) -> "np.ndarray":
+        """Warm/close connections with no message inside the lookback window."""
+        warm_or_close = np.isin(self.strength, (WARM, CLOSE))
+        return warm_or_close & (self.last_message < _cutoff(lookback_days, today))
+
+    def warming_mask(self, lookback_days: int = 90, today: Optional[date] = None) -> "np.ndarray":
+        """Cold connections with 2+ messages and a message inside the lookback window."""
+        cold = np.isin(self.strength, (COLD,))
+        return cold & (self.message_count >= 2) & (self.last_message >= _cutoff(lookback_days, today))
+
+    def domain_mask(self, domain: str) -> "np.ndarray":
+        """Connections tagged with exactly this domain."""
+        mask = np.zeros(len(self), dtype=bool)
+        if domain not in self.domain_vocab:
+            return mask
+        code = self.domain_vocab.index(domain)
+        hits = np.flatnonzero(self.domain_indices == code)
+        rows = np.searchsorted(self.domain_indptr, hits, side="right") - 1
+        mask[rows] = True
+        return mask
+
+    # === HISTOGRAMS ===
+
+    def _histogram(self, codes: "np.ndarray", levels: tuple[str, ...]) -> dict[str, int]:
+        counts = np.bincount(codes[codes >= 0], minlength=len(levels))
+        return {level: int(counts[i]) for i, level in enumerate(levels)}
+
+    def strength_histogram(self) -> dict[str, int]:
+        return self._histogram(self.strength, STRENGTH_LEVELS)
+
+    def trust_histogram(self) -> dict[str, int]:
+        return self._histogram(self.trust, TRUST_LEVELS)
+
+    def energy_histogram(self) -> dict[str, int]:
+        return self._histogram(self.energy, ENERGY_LEVELS)
+
+    def domain_histogram(self) -> dict[str, int]:
+        """Connections per domain, in first-seen order."""
+        counts = np.bincount(self.domain_indices, minlength=len(self.domain_vocab))
+        return {domain: int(counts[i]) for i, domain in enumerate(self.domain_vocab)}
+
+
+def columnar_view(
+    network: Optional[dict[str, Any]] = None,
+    context: Optional[AnalysisContext] = None,
+) -> ColumnarNetwork:
+    """Get the columnar view of a network, built once per context."""
+    context = resolve_context(context, network=network)
+    return context.memo("columnar_view", lambda: ColumnarNetwork.from_network(context.network))
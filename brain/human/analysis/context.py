@@ -0,0 +1,148 @@
+"""
+Analysis Context
+Shared inputs and memoized results for one analysis run.
+
+A report touches the same network, goals and interactions from many
+analyses. AnalysisContext loads each file once, on first use, and caches
+derived results so that e.g. network_summary() and generate_action_items()
+share one stale_relationships() computation.
+
+Files are read through the brain SDK's loader (fastest parser backend plus
+compiled snapshots) when the SDK is importable, and with libyaml directly
+otherwise. With a brain SDK SQLite store (passed in, or named by the
+BRAIN_STORE environment variable) data comes from the store instead and
+analyses can hand queries to it as SQL.
+
+Usage:
+    context = AnalysisContext()
+    network_intel.generate_report(context=context)
+    pattern_detect.generate_report(context=context)
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+import yaml
+
+try:
+    from brain.loaders import load_file
+except ImportError:  # brain SDK not installed
+    load_file = None
+
+T = TypeVar("T")
+
+HUMAN_ROOT = Path(__file__).parent.parent
+
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load_yaml(path: Path, default: dict) -> dict:
+    if not path.exists():
+        return default
+    if load_file is not None:
+        return load_file(path) or default
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_YamlLoader) or default
+
+
+def load_network(path: Optional[Path] = None) -> dict:
+    """Load network.yaml."""
+    return _load_yaml(path or HUMAN_ROOT / "network.yaml", {"connections": [], "stats": {}})
+
+
+def load_goals(path: Optional[Path] = None) -> dict:
+    """Load goals.yaml."""
+    return _load_yaml(path or HUMAN_ROOT / "goals.yaml", {})
+
+
+def load_interactions(path: Optional[Path] = None) -> dict:
+    """Load interactions.yaml."""
+    return _load_yaml(path or HUMAN_ROOT / "interactions.yaml", {"interactions": []})
+
+
+_stores: dict[str, Any] = {}
+
+
+def default_store() -> Optional[Any]:
+    """The brain SDK store named by BRAIN_STORE, opened once per process (None if unset)."""
+    path = os.environ.get("BRAIN_STORE")
+    if not path:
+        return None
+    if path not in _stores:
+        from brain.store import BrainStore
+
+        _stores[path] = BrainStore(path)
+    return _stores[path]
+
+
+class AnalysisContext:
+    """
+    Inputs and memoized results shared by the analyses of one run.
+
+    Data passed in is used as-is; anything omitted is loaded the first time
+    it is needed, from the store if there is one and from the human layer
+    files otherwise.
+    """
+
+    def __init__(
+        self,
+        network: Optional[dict] = None,
+        goals: Optional[dict] = None,
+        interactions: Optional[dict] = None,
+        store: Optional[Any] = None,
+    ):
+        self._data: dict[str, dict] = {}
+        for name, value in (("network", network), ("goals", goals), ("interactions", interactions)):
+            if value is not None:
+                self._data[name] = value
+        self._explicit = set(self._data)
+        self.store = store if store is not None else default_store()
+        self._memo: dict[str, Any] = {}
+
+    def _get(self, name: str, loader: Callable[[], dict]) -> dict:
+        if name not in self._data:
+            self._data[name] = self.store.section(name) if self.store is not None else loader()
+        return self._data[name]
+
+    def store_for(self, name: str) -> Optional[Any]:
+        """The store, if it (not explicitly passed data) is the source of `name`."""
+        return None if name in self._explicit else self.store
+
+    @property
+    def network(self) -> dict:
+        return self._get("network", load_network)
+
+    @property
+    def goals(self) -> dict:
+        return self._get("goals", load_goals)
+
+    @property
+    def interactions(self) -> dict:
+        return self._get("interactions", load_interactions)
+
+    def memo(self, key: str, compute: Callable[[], T]) -> T:
+        """Return the cached result for key, computing it on first request."""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+
+def resolve_context(
+    context: Optional[AnalysisContext] = None,
+    network: Optional[dict] = None,
+    goals: Optional[dict] = None,
+    interactions: Optional[dict] = None,
+) -> AnalysisContext:
+    """
+    Get a context that matches the explicitly passed data.
+
+    The given context is reused when it holds the same objects (or nothing
+    was passed explicitly); otherwise a fresh context is created so cached
+    results never leak between different inputs.
+    """
+    if context is not None:
+        explicit = (("network", network), ("goals", goals), ("interactions", interactions))
+        if all(value is None or value is context._data.get(name) for name, value in explicit):
+            return context
+    return AnalysisContext(network=network, goals=goals, interactions=interactions)
@@ -7,11 +7,26 @@ Functions:
 - network_goal_fit: Does your network support your goals
 """
 
-from dataclasses import dataclass
-from pathlib import Path
+from dataclasses import dataclass, field
 from typing import Optional
 
-import yaml
+from .context import AnalysisContext, load_goals, load_interactions, resolve_context
+from .term_index import term_index
+
+# goals.yaml stated goals by time horizon, after primary and secondary
+GOAL_HORIZONS = ("this_week", "this_month", "this_quarter", "this_year")
+
+# Tie-breaks when ranking people for a goal
+STRENGTH_RANK = {"close": 3, "warm": 2, "cold": 1}
+TRUST_RANK = {"high": 3, "medium": 2, "unknown": 1, "low": 0}
+
+# Goal words too common to say whether the network fits a goal
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "get", "in",
+    "into", "is", "it", "more", "my", "new", "of", "on", "or", "our", "out", "the",
+    "their", "this", "to", "up", "with", "who",
+})
+MIN_KEYWORD_LENGTH = 3
 
 
 @dataclass
@@ -22,36 +37,7 @@ class AlignmentInsight:
     stated: str
     actual: str
     suggestion: Optional[str] = None
-
-
-def load_goals(path: Optional[Path] = None) -> dict:
-    """Load goals.yaml."""
-    if path is None:
-        path = Path(__file__).parent.parent / "goals.yaml"
-    if not path.exists():
-        return {}
-    with open(path, 'r') as f:
-        return yaml.safe_load(f) or {}
-
-
-def load_network(path: Optional[Path] = None) -> dict:
-    """Load network.yaml."""
-    if path is None:
-        path = Path(__file__).parent.parent / "network.yaml"
-    if not path.exists():
-        return {"connections": []}
-    with open(path, 'r') as f:
-        return yaml.safe_load(f) or {"connections": []}
-
-
-def load_interactions(path: Optional[Path] = None) -> dict:
-    """Load interactions.yaml."""
-    if path is None:
-        path = Path(__file__).parent.parent / "interactions.yaml"
-    if not path.exists():
-        return {"interactions": []}
-    with open(path, 'r') as f:
-        return yaml.safe_load(f) or {"interactions": []}
+    people: list = field(default_factory=list)  # connection ids, best fit first
 
 
 def stated_vs_revealed(goals: Optional[dict] = None) -> list[AlignmentInsight]:
@@ -107,31 +93,46 @@ def stated_vs_revealed(goals: Optional[dict] = None) -> list[AlignmentInsight]:
     return insights
 
 
+def stated_goal_list(goals: dict) -> list[str]:
+    """Stated goals: primary, secondary, then each time horizon."""
+    stated = goals.get("stated") or {}
+    all_goals = [stated.get("primary")] + list(stated.get("secondary") or [])
+    for horizon in GOAL_HORIZONS:
+        all_goals += stated.get(horizon) or []
+    return [g for g in all_goals if isinstance(g, str) and g]  # Filter empty
+
+
+def goal_keywords(goal_words: set[str]) -> set[str]:
+    """The goal words worth matching against the network, or all of them if none qualify."""
+    keywords = {
+        word for word in goal_words
+        if len(word) >= MIN_KEYWORD_LENGTH and word not in STOPWORDS and any(ch.isalpha() for ch in word)
+    }
+    return keywords or goal_words
+
+
 def network_goal_fit(
     goals: Optional[dict] = None,
     network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
 ) -> list[AlignmentInsight]:
     """
     Analyze whether your network supports your stated goals.
 
     Cross-references:
-    - Stated goals with network domains
+    - Stated goals (primary, secondary and this_week ... this_year) with
+      network domains and can_ask_for
     - Goal keywords with connection expertise
-    """
-    if goals is None:
-        goals = load_goals()
-    if network is None:
-        network = load_network()
 
-    insights = []
-
-    # Get stated goals
-    stated = goals.get("stated", {})
-    primary = stated.get("primary", "")
-    secondary = stated.get("secondary", [])
-
-    all_goals = [primary] + secondary if primary else secondary
-    all_goals = [g for g in all_goals if g]  # Filter empty
+    A goal is supported when one of its keywords (its words less stopwords,
+    short and non-alphabetic words, unless that leaves none) occurs in a
+    domain or can_ask_for term. Keywords are looked up in the network's
+    term index (built once per context), and relevant people are ranked by
+    how many of the goal's keywords they cover, then by relationship
+    strength and trust.
+    """
+    context = resolve_context(context, network=network, goals=goals)
+    all_goals = stated_goal_list(context.goals)
 
     if not all_goals:
         return [AlignmentInsight(
@@ -142,29 +143,33 @@ def network_goal_fit(
             suggestion="Add goals to goals.yaml",
         )]
 
-    # Collect all domains and expertise in network
-    network_domains = set()
-    for conn in network.get("connections", []):
-        for domain in conn.get("domains", []):
-            network_domains.add(domain.lower())
-        for skill in conn.get("can_ask_for", []):
-            network_domains.add(skill.lower())
+    index = term_index(context=context)
+    connections = index.connections
+
+    insights = []
 
     # Check each goal for network support
     for goal in all_goals:
-        goal_lower = goal.lower()
-        goal_words = set(goal_lower.split())
-
-        # Find overlapping domains
-        matching_domains = [d for d in network_domains if any(w in d for w in goal_words)]
-
-        if matching_domains:
-            # Find specific people
-            relevant_people = []
-            for conn in network.get("connections", []):
-                conn_domains = [d.lower() for d in conn.get("domains", [])]
-                if any(d in conn_domains for d in matching_domains):
-                    relevant_people.append(conn.get("name"))
+        goal_words = set(goal.lower().split())
+        keywords = goal_keywords(goal_words)
+
+        # Count, per connection, the goal keywords its terms cover
+        covered: dict[int, int] = {}
+        supported = False
+        for word in keywords:
+            if index.terms_containing(word):
+                supported = True
+                for i in index.connections_with(word):
+                    covered[i] = covered.get(i, 0) + 1
+
+        if supported:
+            ranked = sorted(covered, key=lambda i: (
+                -covered[i],
+                -STRENGTH_RANK.get(connections[i].get("relationship_strength"), 0),
+                -TRUST_RANK.get(connections[i].get("trust_level"), 0),
+                i,
+            ))
+            relevant_people = [connections[i].get("name") for i in ranked]
 
             insights.append(AlignmentInsight(
                 type="aligned",
@@ -172,6 +177,7 @@ def network_goal_fit(
                 stated=goal,
                 actual=f"{len(relevant_people)} relevant connections",
                 suggestion=f"Talk to: {', '.join(relevant_people[:3])}" if relevant_people else None,
+                people=[connections[i].get("id") for i in ranked],
             ))
         else:
             insights.append(AlignmentInsight(
@@ -188,8 +194,11 @@ def network_goal_fit(
 def generate_report(
     goals: Optional[dict] = None,
     network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
 ) -> str:
     """Generate a text report of goal alignment analysis."""
+    context = resolve_context(context, network=network, goals=goals)
+
     report = []
     report.append("=" * 50)
     report.append("GOAL ALIGNMENT REPORT")
@@ -197,7 +206,7 @@ def generate_report(
     report.append("")
 
     # Stated vs revealed
-    alignment = stated_vs_revealed(goals)
+    alignment = context.memo("stated_vs_revealed", lambda: stated_vs_revealed(context.goals))
     if alignment:
         report.append("STATED VS REVEALED:")
         for insight in alignment:
@@ -211,7 +220,7 @@ def generate_report(
         report.append("")
 
     # Network-goal fit
-    fit = network_goal_fit(goals, network)
+    fit = context.memo("network_goal_fit", lambda: network_goal_fit(context=context))
     if fit:
         report.append("NETWORK-GOAL FIT:")
         for insight in fit:
@@ -0,0 +1,328 @@
+"""
+Introduction Graph
+Multi-hop intro routes through network.yaml.
+
+Who can get you to whom, as a graph built once per network:
+- you reach every connection directly, at a cost set by relationship
+  strength and trust (a close, high-trust friend is the cheapest ask);
+- a connection reaches another through an explicit introduces_to entry
+  naming them, through a shared company or through a shared domain;
+- introduces_to entries that name no connection ("vc investors") and
+  roles that imply access (a partner knows investors) end a route at
+  people outside the network.
+
+Companies and domains are hub nodes rather than cliques, so a domain with
+thousands of members adds thousands of edges, not millions. Each hop costs
+its link kind's weight divided by the introducer's trust.
+
+best_paths() is a k-best Dijkstra (every node settled at most k times,
+paths kept simple, at most max_hops hops) and between() a bidirectional
+BFS for the fewest-hop chain between two connections. intro_graph()
+memoizes the graph in the AnalysisContext, so queries in one run (or in
+the resident server) share a single build. Connections without an id
+cannot be named on a route and are left out of the graph.
+
+Usage:
+    graph = intro_graph(context=context)
+    graph.best_paths("fundraising", k=3, max_hops=3)
+    graph.between("conn.jane-doe", "conn.john-smith")
+"""
+
+import heapq
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Optional
+
+from .context import AnalysisContext, resolve_context
+
+# Weight in (0, 1] of asking someone yourself, by relationship strength and trust
+STRENGTH_WEIGHTS = {"close": 1.0, "warm": 0.6, "cold": 0.25}
+TRUST_WEIGHTS = {"high": 1.0, "medium": 0.7, "unknown": 0.5, "low": 0.25}
+DEFAULT_TRUST_WEIGHT = 0.5
+
+# Cost of one introduction per kind of link, before dividing by the introducer's trust
+LINK_COSTS = {"introduces_to": 1.0, "company": 1.5, "role": 2.0, "domain": 3.0}
+
+# Positions that suggest access to people in a domain
+ROLE_ACCESS = {
+    "vc": ("partner", "principal", "investor", "founder"),
+    "fundraising": ("partner", "principal", "investor", "founder"),
+    "investors": ("partner", "principal", "investor", "founder"),
+    "sales": ("sales", "growth", "marketing", "bd"),
+    "distribution": ("sales", "growth", "marketing", "bd"),
+}
+
+
+@dataclass
+class IntroPath:
+    """One route from you to a target."""
+    people: list[str]  # connection ids, the person you ask first
+    links: list[str]  # how each person after the first is reached, plus the final link if target is not a connection
+    target: str  # connection id, or the introduces_to entry / role the route ends with
+    cost: float
+
+    @property
+    def hops(self) -> int:
+        return len(self.links) + 1
+
+
+# best_paths() heap entry: (cost, tie, node, hops, link, parent); node >= n is a hub, None ends a route
+_Entry = tuple[float, int, Optional[int], int, Optional[str], Optional["_Entry"]]
+
+
+def _lower(value: Any) -> str:
+    return value.lower() if isinstance(value, str) else ""
+
+
+class IntroGraph:
+    """Introduction graph over one network's connections (those with an id)."""
+
+    def __init__(self, network: dict[str, Any]):
+        self.connections = [c for c in network.get("connections", []) if c.get("id")]
+        n = len(self.connections)
+        self.ids = [c["id"] for c in self.connections]
+        self._index = {conn_id: i for i, conn_id in enumerate(self.ids)}
+
+        by_name = dict(self._index)
+        for i, conn in enumerate(self.connections):
+            by_name.setdefault(_lower(conn.get("name")).strip(), i)
+        by_name.pop("", None)
+
+        self._first_cost: list[float] = []
+        self._trust: list[float] = []
+        self._search: list[str] = []  # lowercased domains, position and company
+        self._position: list[str] = []
+        self._intro_text: list[list[str]] = []  # lowercased introduces_to entries
+        self._intros: list[list[int]] = [[] for _ in range(n)]
+        self._intros_in: list[list[int]] = [[] for _ in range(n)]
+        self._hubs_of: list[list[int]] = [[] for _ in range(n)]
+        self.hub_labels: list[str] = []
+        self._hub_costs: list[float] = []
+        self._members: list[list[int]] = []
+        hub_ids: dict[tuple[str, str], int] = {}
+
+        for i, conn in enumerate(self.connections):
+            trust = TRUST_WEIGHTS.get(conn.get("trust_level"), DEFAULT_TRUST_WEIGHT)
+            strength = STRENGTH_WEIGHTS.get(conn.get("relationship_strength"), STRENGTH_WEIGHTS["cold"])
+            self._trust.append(trust)
+            self._first_cost.append(1.0 / (strength * trust))
+
+            domains = [_lower(d) for d in conn.get("domains") or []]
+            position, company = _lower(conn.get("position")), _lower(conn.get("company"))
+            self._search.append("\n".join([*domains, position, company]))
+            self._position.append(position)
+
+            intros = [_lower(entry) for entry in conn.get("introduces_to") or []]
+            self._intro_text.append(intros)
+            for entry in intros:
+                j = by_name.get(entry.strip())
+                if j is not None and j != i and j not in self._intros[i]:
+                    self._intros[i].append(j)
+                    self._intros_in[j].append(i)
+
+            # Hubs match case-insensitively and keep the first spelling seen
+            labels = [("company", conn.get("company"))] + [("domain", d) for d in conn.get("domains") or []]
+            for kind, name in labels:
+                if not isinstance(name, str) or not name.strip():
+                    continue
+                key = (kind, name.strip().lower())
+                hub = hub_ids.get(key)
+                if hub is None:
+                    hub = hub_ids[key] = len(self.hub_labels)
+                    self.hub_labels.append(f"{kind}:{name.strip()}")
+                    self._hub_costs.append(LINK_COSTS[kind])
+                    self._members.append([])
+                elif self._members[hub][-1] == i:
+                    continue
+                self._members[hub].append(i)
+                self._hubs_of[i].append(hub)
+
+        # First hops, sorted by cost: already a heap, copied per query
+        self._seeds: list[_Entry] = sorted((cost, i, i, 1, None, None) for i, cost in enumerate(self._first_cost))
+
+    def __len__(self) -> int:
+        return len(self.connections)
+
+    # === MATCHING ===
+
+    def targets(self, query: str) -> set[int]:
+        """Connections whose domains, position or company mention query."""
+        query = query.lower()
+        return {i for i, text in enumerate(self._search) if query in text}
+
+    def access(self, query: str) -> list[tuple[int, str, str]]:
+        """
+        Connections who can reach query outside the network, in file order.
+
+        (index, link kind, what matched): an introduces_to entry mentioning
+        query, or else a position that suggests access to it.
+        """
+        query = query.lower()
+        roles = ROLE_ACCESS.get(query, ())
+        found = []
+        for i, intros in enumerate(self._intro_text):
+            entry = next((e for e in intros if query in e), None)
+            if entry is not None:
+                found.append((i, "introduces_to", entry))
+            elif roles and any(term in self._position[i] for term in roles):
+                found.append((i, "role", query))
+        return found
+
+    # === PATHS ===
+
+    def best_paths(self, query: str, k: int = 3, max_hops: int = 3) -> list[IntroPath]:
+        """
+        The k cheapest routes to someone matching query, at most max_hops hops long.
+
+        A route ends at a connection matching query (targets()) or one step
+        past a connection with access to it (access()). Every person asked
+        is a hop, and so is that last step to someone outside the network:
+        a route's IntroPath.hops never exceeds max_hops.
+        """
+        if k <= 0 or max_hops <= 0:
+            return []
+        n = len(self.connections)
+        targets = self.targets(query)
+        exits = {i: (kind, matched) for i, kind, matched in self.access(query)}
+        if not targets and not exits:
+            return []
+
+        tie = count(n)
+        heap = list(self._seeds)
+        settled: dict[int, int] = {}
+        paths: list[IntroPath] = []
+        while heap and len(paths) < k:
+            entry = heapq.heappop(heap)
+            cost, _, node, hops, link, parent = entry
+            if node is None:
+                paths.append(self._path(entry))
+                continue
+            if settled.get(node, 0) >= k:
+                continue
+            settled[node] = settled.get(node, 0) + 1
+
+            if node >= n:  # Hub: on to its other members
+                if hops < max_hops:
+                    on_path = self._people(parent)
+                    for j in self._members[node - n]:
+                        if j not in on_path:
+                            heapq.heappush(heap, (cost, next(tie), j, hops + 1, link, entry))
+                continue
+
+            if node in targets:
+                paths.append(self._path(entry))
+                continue
+            trust = self._trust[node]
+            if node in exits and hops < max_hops:
+                kind, matched = exits[node]
+                heapq.heappush(heap, (cost + LINK_COSTS[kind] / trust, next(tie), None, hops + 1, f"{kind}:{matched}", entry))
+            if hops < max_hops:
+                on_path = self._people(entry)
+                for j in self._intros[node]:
+                    if j not in on_path:
+                        heapq.heappush(heap, (cost + LINK_COSTS["introduces_to"] / trust, next(tie), j, hops + 1, "introduces_to", entry))
+                for hub in self._hubs_of[node]:
+                    heapq.heappush(heap, (cost + self._hub_costs[hub] / trust, next(tie), n + hub, hops, self.hub_labels[hub], entry))
+        return paths
+
+    def _people(self, entry: Optional[_Entry]) -> set[int]:
+        people = set()
+        n = len(self.connections)
+        while entry is not None:
+            if entry[2] is not None and entry[2] < n:
+                people.add(entry[2])
+            entry = entry[5]
+        return people
+
+    def _path(self, final: _Entry) -> IntroPath:
+        n = len(self.connections)
+        people: list[str] = []
+        links: list[str] = []
+        entry: Optional[_Entry] = final
+        while entry is not None:
+            node, link = entry[2], entry[4]
+            if node is None or node < n:
+                if node is not None:
+                    people.append(self.ids[node])
+                if link is not None:
+                    links.append(link)
+            entry = entry[5]
+        people.reverse()
+        links.reverse()
+        target = links[-1].split(":", 1)[1] if final[2] is None else people[-1]
+        cost = final[0]
+        return IntroPath(people=people, links=links, target=target, cost=round(cost, 3))
+
+    def between(self, source: str, target: str) -> Optional[list[str]]:
+        """
+        Fewest-hop chain of connection ids from source to target (both ends included).
+
+        Bidirectional BFS: explicit intros are followed forward from source
+        and backward from target, shared companies and domains both ways.
+        None if no chain exists or either id is unknown.
+        """
+        start, goal = self._index.get(source), self._index.get(target)
+        if start is None or goal is None:
+            return None
+
+        # node -> (parent, depth)
+        forward: dict[int, tuple[Optional[int], int]] = {start: (None, 0)}
+        backward: dict[int, tuple[Optional[int], int]] = {goal: (None, 0)}
+        forward_hubs: set[int] = set()
+        backward_hubs: set[int] = set()
+        forward_frontier, backward_frontier = [start], [goal]
+        meet = start if start == goal else None
+        while meet is None and forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier = self._expand(forward_frontier, forward, forward_hubs, self._intros)
+                reached = [node for node in forward_frontier if node in backward]
+            else:
+                backward_frontier = self._expand(backward_frontier, backward, backward_hubs, self._intros_in)
+                reached = [node for node in backward_frontier if node in forward]
+            if reached:
+                meet = min(reached, key=lambda node: forward[node][1] + backward[node][1])
+        if meet is None:
+            return None
+
+        chain = []
+        node: Optional[int] = meet
+        while node is not None:
+            chain.append(node)
+            node = forward[node][0]
+        chain.reverse()
+        node = backward[meet][0]
+        while node is not None:
+            chain.append(node)
+            node = backward[node][0]
+        return [self.ids[node] for node in chain]
+
+    def _expand(
+        self,
+        frontier: list[int],
+        parents: dict[int, tuple[Optional[int], int]],
+        hubs_used: set[int],
+        intros: list[list[int]],
+    ) -> list[int]:
+        """One BFS level over intros and shared hubs; returns the next frontier."""
+        following = []
+        for node in frontier:
+            depth = parents[node][1] + 1
+            neighbors = list(intros[node])
+            for hub in self._hubs_of[node]:
+                if hub not in hubs_used:  # A hub's members are all one hop from whoever reaches it first
+                    hubs_used.add(hub)
+                    neighbors += self._members[hub]
+            for neighbor in neighbors:
+                if neighbor not in parents:
+                    parents[neighbor] = (node, depth)
+                    following.append(neighbor)
+        return following
+
+
+def intro_graph(
+    network: Optional[dict[str, Any]] = None,
+    context: Optional[AnalysisContext] = None,
+) -> IntroGraph:
+    """Get the intro graph for a network, built once per context."""
+    context = resolve_context(context, network=network)
+    return context.memo("intro_graph", lambda: IntroGraph(context.network))
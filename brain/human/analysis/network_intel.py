@@ -5,9 +5,10 @@ Analyzes network.yaml and provides proactive suggestions.
 Functions:
 - stale_relationships: Find connections going cold
 - domain_matches: Find people who know about a topic
-- reconnection_suggestions: Match threads to people who could help
+- reconnection_suggestions: Match threads to people who could help (one batched pass)
 - network_gaps: Identify missing network areas
 - intro_paths: Find who can intro you to whom
+- best_intro_paths: Best multi-hop intro routes to a domain
 - high_trust_connections: Find your most trusted people
 - energizing_connections: Find people who give you energy
 - watch_outs: Surface connections with known negatives
@@ -20,7 +21,10 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
-import yaml
+from .aggregate import network_aggregate
+from .context import AnalysisContext, load_network, resolve_context
+from .intro_graph import intro_graph
+from .topic_match import match_topics
 
 
 @dataclass
@@ -33,18 +37,6 @@ class NetworkInsight:
     action: Optional[str] = None
 
 
-def load_network(path: Optional[Path] = None) -> dict:
-    """Load network.yaml."""
-    if path is None:
-        path = Path(__file__).parent.parent / "network.yaml"
-
-    if not path.exists():
-        return {"connections": [], "stats": {}}
-
-    with open(path, 'r') as f:
-        return yaml.safe_load(f) or {"connections": [], "stats": {}}
-
-
 def load_threads(path: Optional[Path] = None) -> list:
     """Load active threads from context library."""
     if path is None:
@@ -64,7 +56,8 @@ def load_threads(path: Optional[Path] = None) -> list:
 
 def stale_relationships(
     network: Optional[dict] = None,
-    threshold_days: int = 180
+    threshold_days: int = 180,
+    context: Optional[AnalysisContext] = None,
 ) -> list[NetworkInsight]:
     """
     Find relationships that are going cold.
@@ -73,30 +66,30 @@ def stale_relationships(
     - Were warm/close (had messages)
     - Haven't been contacted in threshold_days
     """
-    if network is None:
-        network = load_network()
+    context = resolve_context(context, network=network)
 
     insights = []
     cutoff = (datetime.now() - timedelta(days=threshold_days)).strftime("%Y-%m-%d")
 
-    for conn in network.get("connections", []):
-        strength = conn.get("relationship_strength", "cold")
-        last_message = conn.get("last_message")
-        last_contact = conn.get("last_contact")
-
+    store = context.store_for("network")
+    if store is not None:
+        # Indexed query on (relationship_strength, last_touch)
+        stale = store.stale_connections(cutoff)
+    else:
+        agg = network_aggregate(context=context)
         # Check if relationship is going stale
-        if strength in ("warm", "close"):
-            last_touch = last_contact or last_message
-            if last_touch and last_touch < cutoff:
-                days_ago = (datetime.now() - datetime.strptime(last_touch, "%Y-%m-%d")).days
-
-                insights.append(NetworkInsight(
-                    type="stale",
-                    priority="high" if strength == "close" else "medium",
-                    message=f"{conn['name']} ({conn.get('company', 'Unknown')}) - {strength} relationship, no contact in {days_ago} days",
-                    connections=[conn['id']],
-                    action=f"Consider reaching out. Last topic: {conn.get('notes', 'N/A')}",
-                ))
+        stale = [c for c in agg.touch_candidates if c[2] < cutoff]
+
+    for conn, strength, last_touch in stale:
+        days_ago = (datetime.now() - datetime.strptime(last_touch, "%Y-%m-%d")).days
+
+        insights.append(NetworkInsight(
+            type="stale",
+            priority="high" if strength == "close" else "medium",
+            message=f"{conn['name']} ({conn.get('company', 'Unknown')}) - {strength} relationship, no contact in {days_ago} days",
+            connections=[conn['id']],
+            action=f"Consider reaching out. Last topic: {conn.get('notes', 'N/A')}",
+        ))
 
     return sorted(insights, key=lambda x: x.priority == "high", reverse=True)
 
@@ -156,6 +149,7 @@ def domain_matches(
 def reconnection_suggestions(
     network: Optional[dict] = None,
     threads: Optional[list] = None,
+    context: Optional[AnalysisContext] = None,
 ) -> list[NetworkInsight]:
     """
     Match current threads to people who could help.
@@ -163,27 +157,29 @@ def reconnection_suggestions(
     Cross-references:
     - Active threads (what you're thinking about)
     - Network domains (what people know)
-    """
-    if network is None:
-        network = load_network()
 
+    All thread topics are matched in one pass over the network (see
+    topic_match), with the same rule as domain_matches(min_strength="warm").
+    """
     if threads is None:
         threads = load_threads()
 
+    # Use thread name as topic
+    topics = {thread['id']: thread['name'].replace('-', ' ') for thread in threads}
+    matches = match_topics(topics.values(), network, min_strength="warm", context=context)
+
     insights = []
 
     for thread in threads:
-        # Use thread name as topic
-        topic = thread['name'].replace('-', ' ')
-        matches = domain_matches(topic, network, min_strength="warm")
+        people = matches[topics[thread['id']]]
 
-        if matches:
+        if people:
             insights.append(NetworkInsight(
                 type="reconnection",
                 priority="medium",
                 message=f"Thread '{thread['id']}' - you know people who might help",
-                connections=matches[0].connections,
-                action=matches[0].action,
+                connections=[m['id'] for m in people],
+                action=f"People to talk to: {', '.join(m['name'] for m in people[:5])}",
             ))
 
     return insights
@@ -192,6 +188,7 @@ def reconnection_suggestions(
 def network_gaps(
     network: Optional[dict] = None,
     target_domains: Optional[list] = None,
+    context: Optional[AnalysisContext] = None,
 ) -> list[NetworkInsight]:
     """
     Identify domains where you lack connections.
@@ -199,9 +196,6 @@ def network_gaps(
     If target_domains provided, checks against those.
     Otherwise, suggests based on common needs.
     """
-    if network is None:
-        network = load_network()
-
     # Default domains to check if none provided
     if target_domains is None:
         target_domains = [
@@ -216,11 +210,7 @@ def network_gaps(
         ]
 
     # Count connections per domain
-    domain_counts = {}
-    for conn in network.get("connections", []):
-        for domain in conn.get("domains", []):
-            domain_lower = domain.lower()
-            domain_counts[domain_lower] = domain_counts.get(domain_lower, 0) + 1
+    domain_counts = network_aggregate(network, context).domain_counts_lower
 
     insights = []
     for domain in target_domains:
@@ -248,6 +238,7 @@ def network_gaps(
 def intro_paths(
     target_domain: str,
     network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
 ) -> list[NetworkInsight]:
     """
     Find who might be able to introduce you to people in target_domain.
@@ -255,31 +246,11 @@ def intro_paths(
     Looks at:
     - introduces_to field
     - Position/company that suggests access
-    """
-    if network is None:
-        network = load_network()
 
-    paths = []
-    target_lower = target_domain.lower()
-
-    for conn in network.get("connections", []):
-        # Check explicit intro list
-        intros = conn.get("introduces_to", [])
-        if any(target_lower in intro.lower() for intro in intros):
-            paths.append(conn)
-            continue
-
-        # Check if position suggests they know people in domain
-        position = conn.get("position", "").lower()
-        company = conn.get("company", "").lower()
-
-        # Heuristics: certain roles know certain people
-        if target_lower in ("vc", "fundraising", "investors"):
-            if any(term in position for term in ["partner", "principal", "investor", "founder"]):
-                paths.append(conn)
-        elif target_lower in ("sales", "distribution"):
-            if any(term in position for term in ["sales", "growth", "marketing", "bd"]):
-                paths.append(conn)
+    For routes through other connections, see best_intro_paths().
+    """
+    graph = intro_graph(network, context)
+    paths = [graph.connections[i] for i, _, _ in graph.access(target_domain)]
 
     if paths:
         return [NetworkInsight(
@@ -293,6 +264,39 @@ def intro_paths(
     return []
 
 
+def best_intro_paths(
+    target: str,
+    k: int = 3,
+    max_hops: int = 3,
+    network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
+) -> list[NetworkInsight]:
+    """
+    Find the k best intro routes (up to max_hops people) to someone in target.
+
+    Routes run through introduces_to entries, shared companies and shared
+    domains, and are ranked by relationship strength and trust along the way.
+    """
+    graph = intro_graph(network, context)
+    names = {conn['id']: conn.get('name', conn['id']) for conn in graph.connections}
+
+    insights = []
+    for path in graph.best_paths(target, k=k, max_hops=max_hops):
+        steps = [names[path.people[0]]]
+        for person, link in zip(path.people[1:], path.links):
+            steps.append(f"{names[person]} ({link.replace(':', ' ', 1)})")
+        if path.target not in names:
+            steps.append(f"'{path.target}' ({path.links[-1].split(':', 1)[0]})")
+        insights.append(NetworkInsight(
+            type="intro_route",
+            priority="high" if path.hops == 1 else "medium",
+            message=f"{path.hops}-hop route to '{target}': {' -> '.join(steps)}",
+            connections=path.people,
+            action=f"Ask {names[path.people[0]]}" + (" for an intro" if path.hops > 1 else ""),
+        ))
+    return insights
+
+
 def high_trust_connections(
     network: Optional[dict] = None,
     for_domain: Optional[str] = None,
@@ -330,6 +334,7 @@ def high_trust_connections(
 
 def energizing_connections(
     network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
 ) -> list[NetworkInsight]:
     """
     Find people who give you energy.
@@ -337,13 +342,12 @@ def energizing_connections(
     These are good people to reach out to when you need a boost,
     or to prioritize when scheduling meetings.
     """
-    if network is None:
-        network = load_network()
+    context = resolve_context(context, network=network)
 
     energizing = []
     draining = []
 
-    for conn in network.get("connections", []):
+    for conn in context.network.get("connections", []):
         energy = conn.get("energy")
         if energy == "energizing":
             energizing.append(conn)
@@ -438,53 +442,41 @@ def connection_assessment(
     return {"error": f"Connection {connection_id} not found"}
 
 
-def network_summary(network: Optional[dict] = None) -> dict:
+def network_summary(
+    network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
+) -> dict:
     """
     Generate a summary of the network for display.
+
+    With a context, the summary and the analyses it uses are computed once
+    per run and shared with other callers of the same context.
     """
-    if network is None:
-        network = load_network()
+    context = resolve_context(context, network=network)
+    return context.memo("network_summary", lambda: _network_summary(context))
+
 
-    connections = network.get("connections", [])
+def _network_summary(context: AnalysisContext) -> dict:
+    network = context.network
+    agg = network_aggregate(context=context)
     stats = network.get("stats", {})
 
     # Compute if not present
     if not stats.get("total"):
         stats = {
-            "total": len(connections),
-            "by_relationship": {"close": 0, "warm": 0, "cold": 0},
-            "by_domain": {},
+            "total": agg.total,
+            "by_relationship": agg.by_strength,
+            "by_domain": agg.domain_counts,
         }
-        for conn in connections:
-            strength = conn.get("relationship_strength", "cold")
-            stats["by_relationship"][strength] = stats["by_relationship"].get(strength, 0) + 1
-            for domain in conn.get("domains", []):
-                stats["by_domain"][domain] = stats["by_domain"].get(domain, 0) + 1
-
-    # Compute trust and energy stats
-    trust_stats = {"high": 0, "medium": 0, "low": 0, "unknown": 0}
-    energy_stats = {"energizing": 0, "neutral": 0, "draining": 0}
-    with_positives = 0
-    with_negatives = 0
-
-    for conn in connections:
-        trust = conn.get("trust_level", "unknown")
-        trust_stats[trust] = trust_stats.get(trust, 0) + 1
-
-        energy = conn.get("energy", "neutral")
-        energy_stats[energy] = energy_stats.get(energy, 0) + 1
-
-        if conn.get("positives"):
-            with_positives += 1
-        if conn.get("negatives"):
-            with_negatives += 1
-
-    stale = stale_relationships(network)
-    gaps = network_gaps(network)
-    energy_insights = energizing_connections(network)
+
+    trust_stats = agg.by_trust
+    energy_stats = agg.by_energy
+
+    stale = context.memo("stale_relationships", lambda: stale_relationships(context=context))
+    gaps = context.memo("network_gaps", lambda: network_gaps(context=context))
 
     return {
-        "total_connections": stats.get("total", len(connections)),
+        "total_connections": stats.get("total", agg.total),
         "close": stats.get("by_relationship", {}).get("close", 0),
         "warm": stats.get("by_relationship", {}).get("warm", 0),
         "cold": stats.get("by_relationship", {}).get("cold", 0),
@@ -497,19 +489,22 @@ def network_summary(network: Optional[dict] = None) -> dict:
         "stale_high_priority": [s for s in stale if s.priority == "high"],
         "gaps": [g.message for g in gaps if g.priority == "high"],
         # Trust & Energy
-        "trust": trust_stats,
-        "energy": energy_stats,
-        "with_positives": with_positives,
-        "with_negatives": with_negatives,
+        "trust": dict(trust_stats),
+        "energy": dict(energy_stats),
+        "with_positives": agg.with_positives,
+        "with_negatives": agg.with_negatives,
         "high_trust_count": trust_stats["high"],
         "energizing_count": energy_stats["energizing"],
         "draining_count": energy_stats["draining"],
     }
 
 
-def generate_report(network: Optional[dict] = None) -> str:
+def generate_report(
+    network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
+) -> str:
     """Generate a text report of network intelligence."""
-    summary = network_summary(network)
+    summary = network_summary(network, context=context)
 
     report = []
     report.append("=" * 50)
@@ -15,10 +15,10 @@ Functions:
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Optional
 
-import yaml
+from .aggregate import network_aggregate
+from .context import AnalysisContext, load_interactions, load_network, resolve_context
 
 
 @dataclass
@@ -30,29 +30,10 @@ class Pattern:
     suggestion: Optional[str] = None
 
 
-def load_network(path: Optional[Path] = None) -> dict:
-    """Load network.yaml."""
-    if path is None:
-        path = Path(__file__).parent.parent / "network.yaml"
-    if not path.exists():
-        return {"connections": []}
-    with open(path, 'r') as f:
-        return yaml.safe_load(f) or {"connections": []}
-
-
-def load_interactions(path: Optional[Path] = None) -> dict:
-    """Load interactions.yaml."""
-    if path is None:
-        path = Path(__file__).parent.parent / "interactions.yaml"
-    if not path.exists():
-        return {"interactions": []}
-    with open(path, 'r') as f:
-        return yaml.safe_load(f) or {"interactions": []}
-
-
 def communication_patterns(
     network: Optional[dict] = None,
     interactions: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
 ) -> list[Pattern]:
     """
     Analyze who you communicate with and how often.
@@ -62,10 +43,9 @@ def communication_patterns(
     - Communication gaps
     - Medium preferences
     """
-    if network is None:
-        network = load_network()
-    if interactions is None:
-        interactions = load_interactions()
+    context = resolve_context(context, network=network, interactions=interactions)
+    agg = network_aggregate(context=context)
+    interactions = context.interactions
 
     patterns = []
 
@@ -82,11 +62,8 @@ def communication_patterns(
         medium_counts[medium] += 1
 
     # Also use message counts from network
-    for conn in network.get("connections", []):
-        name = conn.get("name", "")
-        msg_count = conn.get("message_count", 0)
-        if msg_count > 0:
-            contact_counts[name] += msg_count
+    for name, msg_count in agg.message_counts_by_name.items():
+        contact_counts[name] += msg_count
 
     # Find top contacts
     if contact_counts:
@@ -107,10 +84,7 @@ def communication_patterns(
         ))
 
     # Find people you connected with but never talked to
-    silent_connections = []
-    for conn in network.get("connections", []):
-        if conn.get("message_count", 0) == 0:
-            silent_connections.append(conn.get("name"))
+    silent_connections = agg.silent
 
     if silent_connections:
         patterns.append(Pattern(
@@ -123,7 +97,10 @@ def communication_patterns(
     return patterns
 
 
-def domain_clusters(network: Optional[dict] = None) -> list[Pattern]:
+def domain_clusters(
+    network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
+) -> list[Pattern]:
     """
     Analyze domain distribution in network.
 
@@ -132,20 +109,13 @@ def domain_clusters(network: Optional[dict] = None) -> list[Pattern]:
     - Underrepresented areas
     - Domain/strength correlations
     """
-    if network is None:
-        network = load_network()
+    agg = network_aggregate(network, context)
 
     patterns = []
 
     # Count domains
-    domain_counts = defaultdict(int)
-    domain_by_strength = defaultdict(lambda: {"close": 0, "warm": 0, "cold": 0})
-
-    for conn in network.get("connections", []):
-        strength = conn.get("relationship_strength", "cold")
-        for domain in conn.get("domains", []):
-            domain_counts[domain] += 1
-            domain_by_strength[domain][strength] += 1
+    domain_counts = agg.domain_counts
+    domain_by_strength = agg.domain_by_strength
 
     if not domain_counts:
         patterns.append(Pattern(
@@ -185,6 +155,7 @@ def domain_clusters(network: Optional[dict] = None) -> list[Pattern]:
 def relationship_trajectory(
     network: Optional[dict] = None,
     lookback_days: int = 90,
+    context: Optional[AnalysisContext] = None,
 ) -> list[Pattern]:
     """
     Analyze which relationships are warming or cooling.
@@ -193,38 +164,32 @@ def relationship_trajectory(
     - Message recency vs historical frequency
     - Explicit contact tracking
     """
-    if network is None:
-        network = load_network()
+    agg = network_aggregate(network, context)
 
     patterns = []
     cutoff = (datetime.now() - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
 
-    warming = []
-    cooling = []
-
-    for conn in network.get("connections", []):
-        name = conn.get("name", "Unknown")
-        strength = conn.get("relationship_strength", "cold")
-        last_message = conn.get("last_message")
-        message_count = conn.get("message_count", 0)
-
-        # Cooling: was warm/close but no recent contact
-        if strength in ("warm", "close") and last_message:
-            if last_message < cutoff:
-                cooling.append({
-                    "name": name,
-                    "strength": strength,
-                    "last": last_message,
-                })
-
-        # Warming: cold but has recent messages
-        if strength == "cold" and last_message:
-            if last_message >= cutoff and message_count >= 2:
-                warming.append({
-                    "name": name,
-                    "messages": message_count,
-                    "last": last_message,
-                })
+    # Cooling: was warm/close but no recent contact
+    cooling = [
+        {
+            "name": conn.get("name", "Unknown"),
+            "strength": strength,
+            "last": last_message,
+        }
+        for conn, strength, last_message in agg.cooling_candidates
+        if last_message < cutoff
+    ]
+
+    # Warming: cold but has recent messages
+    warming = [
+        {
+            "name": conn.get("name", "Unknown"),
+            "messages": conn.get("message_count", 0),
+            "last": last_message,
+        }
+        for conn, last_message in agg.warming_candidates
+        if last_message >= cutoff
+    ]
 
     if cooling:
         patterns.append(Pattern(
@@ -245,7 +210,10 @@ def relationship_trajectory(
     return patterns
 
 
-def trust_patterns(network: Optional[dict] = None) -> list[Pattern]:
+def trust_patterns(
+    network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
+) -> list[Pattern]:
     """
     Analyze what correlates with trust in your network.
 
@@ -254,33 +222,13 @@ def trust_patterns(network: Optional[dict] = None) -> list[Pattern]:
     - Do you trust people you've known longer?
     - Is trust correlated with relationship strength?
     """
-    if network is None:
-        network = load_network()
+    agg = network_aggregate(network, context)
 
     patterns = []
 
     # Gather trust data
-    high_trust = []
-    low_trust = []
-    trust_by_company = defaultdict(lambda: {"high": 0, "low": 0, "total": 0})
-    trust_by_strength = defaultdict(lambda: {"high": 0, "low": 0, "total": 0})
-
-    for conn in network.get("connections", []):
-        trust = conn.get("trust_level")
-        company = conn.get("company", "Unknown")
-        strength = conn.get("relationship_strength", "cold")
-
-        if trust == "high":
-            high_trust.append(conn)
-            trust_by_company[company]["high"] += 1
-        elif trust == "low":
-            low_trust.append(conn)
-            trust_by_company[company]["low"] += 1
-
-        trust_by_company[company]["total"] += 1
-        trust_by_strength[strength]["total"] += 1
-        if trust:
-            trust_by_strength[strength][trust] = trust_by_strength[strength].get(trust, 0) + 1
+    trust_by_company = agg.company_trust
+    trust_by_strength = defaultdict(lambda: {"high": 0, "low": 0, "total": 0}, agg.trust_by_strength)
 
     # Pattern: Companies with high trust concentration
     high_trust_companies = []
@@ -320,34 +268,24 @@ def trust_patterns(network: Optional[dict] = None) -> list[Pattern]:
             ))
 
     # Pattern: Low trust signals
-    if low_trust:
-        low_trust_reasons = []
-        for conn in low_trust:
-            negatives = conn.get("negatives", [])
-            if negatives:
-                low_trust_reasons.extend(negatives)
-
-        if low_trust_reasons:
-            # Find common patterns in negatives
-            from collections import Counter
-            word_counts = Counter()
-            for reason in low_trust_reasons:
-                words = reason.lower().split()
-                word_counts.update(words)
-
-            common_words = [w for w, c in word_counts.most_common(10) if c >= 2 and len(w) > 3]
-            if common_words:
-                patterns.append(Pattern(
-                    type="low_trust_patterns",
-                    description="Common themes in low-trust connections",
-                    evidence=[f"Recurring terms: {', '.join(common_words[:5])}"],
-                    suggestion="These might be your trust dealbreakers",
-                ))
+    word_counts = agg.low_trust_negative_words
+    if word_counts:
+        common_words = [w for w, c in word_counts.most_common(10) if c >= 2 and len(w) > 3]
+        if common_words:
+            patterns.append(Pattern(
+                type="low_trust_patterns",
+                description="Common themes in low-trust connections",
+                evidence=[f"Recurring terms: {', '.join(common_words[:5])}"],
+                suggestion="These might be your trust dealbreakers",
+            ))
 
     return patterns
 
 
-def energy_patterns(network: Optional[dict] = None) -> list[Pattern]:
+def energy_patterns(
+    network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
+) -> list[Pattern]:
     """
     Analyze what correlates with energy in your network.
 
@@ -356,31 +294,12 @@ def energy_patterns(network: Optional[dict] = None) -> list[Pattern]:
     - Is energy correlated with trust?
     - Time-based patterns in draining relationships
     """
-    if network is None:
-        network = load_network()
+    agg = network_aggregate(network, context)
 
     patterns = []
 
-    energizing = []
-    draining = []
-    energy_by_domain = defaultdict(lambda: {"energizing": 0, "draining": 0, "total": 0})
-    energy_by_trust = defaultdict(lambda: {"energizing": 0, "draining": 0})
-
-    for conn in network.get("connections", []):
-        energy = conn.get("energy")
-        trust = conn.get("trust_level", "unknown")
-
-        for domain in conn.get("domains", []):
-            energy_by_domain[domain]["total"] += 1
-            if energy:
-                energy_by_domain[domain][energy] = energy_by_domain[domain].get(energy, 0) + 1
-
-        if energy == "energizing":
-            energizing.append(conn)
-            energy_by_trust[trust]["energizing"] += 1
-        elif energy == "draining":
-            draining.append(conn)
-            energy_by_trust[trust]["draining"] += 1
+    energy_by_domain = agg.energy_by_domain
+    energy_by_trust = agg.energy_by_trust
 
     # Pattern: Domains that energize
     energizing_domains = []
@@ -434,7 +353,10 @@ def energy_patterns(network: Optional[dict] = None) -> list[Pattern]:
     return patterns
 
 
-def positive_negative_insights(network: Optional[dict] = None) -> list[Pattern]:
+def positive_negative_insights(
+    network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
+) -> list[Pattern]:
     """
     Analyze patterns in how you assess people.
 
@@ -444,30 +366,13 @@ def positive_negative_insights(network: Optional[dict] = None) -> list[Pattern]:
     - Common negative traits you notice
     - Assessment blind spots
     """
-    if network is None:
-        network = load_network()
+    agg = network_aggregate(network, context)
 
     patterns = []
 
-    all_positives = []
-    all_negatives = []
-    only_positive = 0
-    only_negative = 0
-    balanced = 0
-
-    for conn in network.get("connections", []):
-        positives = conn.get("positives", [])
-        negatives = conn.get("negatives", [])
-
-        all_positives.extend(positives)
-        all_negatives.extend(negatives)
-
-        if positives and not negatives:
-            only_positive += 1
-        elif negatives and not positives:
-            only_negative += 1
-        elif positives and negatives:
-            balanced += 1
+    only_positive = agg.only_positive
+    only_negative = agg.only_negative
+    balanced = agg.balanced
 
     # Pattern: Assessment balance
     total_assessed = only_positive + only_negative + balanced
@@ -488,43 +393,32 @@ def positive_negative_insights(network: Optional[dict] = None) -> list[Pattern]:
             ))
 
     # Pattern: Common positive traits
-    if all_positives:
-        from collections import Counter
-        positive_words = Counter()
-        for p in all_positives:
-            words = [w.lower() for w in p.split() if len(w) > 3]
-            positive_words.update(words)
-
-        top_positive = positive_words.most_common(10)
-        if top_positive:
-            patterns.append(Pattern(
-                type="valued_traits",
-                description="Traits you frequently value",
-                evidence=[f"{w}: {c}x" for w, c in top_positive[:5] if c >= 2],
-                suggestion="These reveal what you prioritize in people",
-            ))
+    top_positive = agg.positive_words.most_common(10)
+    if top_positive:
+        patterns.append(Pattern(
+            type="valued_traits",
+            description="Traits you frequently value",
+            evidence=[f"{w}: {c}x" for w, c in top_positive[:5] if c >= 2],
+            suggestion="These reveal what you prioritize in people",
+        ))
 
     # Pattern: Common negative traits
-    if all_negatives:
-        from collections import Counter
-        negative_words = Counter()
-        for n in all_negatives:
-            words = [w.lower() for w in n.split() if len(w) > 3]
-            negative_words.update(words)
-
-        top_negative = negative_words.most_common(10)
-        if top_negative:
-            patterns.append(Pattern(
-                type="watched_traits",
-                description="Traits you frequently watch for",
-                evidence=[f"{w}: {c}x" for w, c in top_negative[:5] if c >= 2],
-                suggestion="These reveal your dealbreakers or sensitivities",
-            ))
+    top_negative = agg.negative_words.most_common(10)
+    if top_negative:
+        patterns.append(Pattern(
+            type="watched_traits",
+            description="Traits you frequently watch for",
+            evidence=[f"{w}: {c}x" for w, c in top_negative[:5] if c >= 2],
+            suggestion="These reveal your dealbreakers or sensitivities",
+        ))
 
     return patterns
 
 
-def blind_spot_detection(network: Optional[dict] = None) -> list[Pattern]:
+def blind_spot_detection(
+    network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
+) -> list[Pattern]:
     """
     Detect potential blind spots in how you see your network.
 
@@ -533,19 +427,12 @@ def blind_spot_detection(network: Optional[dict] = None) -> list[Pattern]:
     - Long relationships without assessment
     - Potential echo chambers
     """
-    if network is None:
-        network = load_network()
+    agg = network_aggregate(network, context)
 
     patterns = []
 
     # Blind spot: High trust without positives documented
-    undocumented_trust = []
-    for conn in network.get("connections", []):
-        trust = conn.get("trust_level")
-        positives = conn.get("positives", [])
-
-        if trust == "high" and not positives:
-            undocumented_trust.append(conn.get("name"))
+    undocumented_trust = agg.undocumented_trust
 
     if undocumented_trust:
         patterns.append(Pattern(
@@ -556,18 +443,8 @@ def blind_spot_detection(network: Optional[dict] = None) -> list[Pattern]:
         ))
 
     # Blind spot: Long relationships without assessment
-    old_unassessed = []
     one_year_ago = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
-
-    for conn in network.get("connections", []):
-        connected = conn.get("connected_date")
-        trust = conn.get("trust_level")
-        positives = conn.get("positives", [])
-        negatives = conn.get("negatives", [])
-
-        if connected and connected < one_year_ago:
-            if not trust and not positives and not negatives:
-                old_unassessed.append(conn.get("name"))
+    old_unassessed = [name for name, connected in agg.unassessed if connected < one_year_ago]
 
     if old_unassessed:
         patterns.append(Pattern(
@@ -578,10 +455,7 @@ def blind_spot_detection(network: Optional[dict] = None) -> list[Pattern]:
         ))
 
     # Blind spot: Echo chamber detection
-    domain_counts = defaultdict(int)
-    for conn in network.get("connections", []):
-        for domain in conn.get("domains", []):
-            domain_counts[domain] += 1
+    domain_counts = agg.domain_counts
 
     total = sum(domain_counts.values())
     if total > 0:
@@ -600,8 +474,11 @@ def blind_spot_detection(network: Optional[dict] = None) -> list[Pattern]:
 def generate_report(
     network: Optional[dict] = None,
     interactions: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
 ) -> str:
     """Generate a text report of pattern analysis."""
+    context = resolve_context(context, network=network, interactions=interactions)
+
     report = []
     report.append("=" * 50)
     report.append("PATTERN DETECTION REPORT")
@@ -609,7 +486,10 @@ def generate_report(
     report.append("")
 
     # Communication patterns
-    comm = communication_patterns(network, interactions)
+    comm = context.memo(
+        "communication_patterns",
+        lambda: communication_patterns(context=context),
+    )
     if comm:
         report.append("COMMUNICATION PATTERNS:")
         for pattern in comm:
@@ -621,7 +501,7 @@ def generate_report(
         report.append("")
 
     # Domain clusters
-    domains = domain_clusters(network)
+    domains = context.memo("domain_clusters", lambda: domain_clusters(context=context))
     if domains:
         report.append("DOMAIN CLUSTERS:")
         for pattern in domains:
@@ -633,7 +513,7 @@ def generate_report(
         report.append("")
 
     # Relationship trajectory
-    trajectory = relationship_trajectory(network)
+    trajectory = context.memo("relationship_trajectory", lambda: relationship_trajectory(context=context))
     if trajectory:
         report.append("RELATIONSHIP TRAJECTORY:")
         for pattern in trajectory:
@@ -645,7 +525,7 @@ def generate_report(
         report.append("")
 
     # Trust patterns
-    trust = trust_patterns(network)
+    trust = context.memo("trust_patterns", lambda: trust_patterns(context=context))
     if trust:
         report.append("TRUST PATTERNS:")
         for pattern in trust:
@@ -657,7 +537,7 @@ def generate_report(
         report.append("")
 
     # Energy patterns
-    energy = energy_patterns(network)
+    energy = context.memo("energy_patterns", lambda: energy_patterns(context=context))
     if energy:
         report.append("ENERGY PATTERNS:")
         for pattern in energy:
@@ -669,7 +549,7 @@ def generate_report(
         report.append("")
 
     # Positive/negative insights
-    assessments = positive_negative_insights(network)
+    assessments = context.memo("positive_negative_insights", lambda: positive_negative_insights(context=context))
     if assessments:
         report.append("ASSESSMENT PATTERNS:")
         for pattern in assessments:
@@ -681,7 +561,7 @@ def generate_report(
         report.append("")
 
     # Blind spots
-    blind_spots = blind_spot_detection(network)
+    blind_spots = context.memo("blind_spot_detection", lambda: blind_spot_detection(context=context))
     if blind_spots:
         report.append("POTENTIAL BLIND SPOTS:")
         for pattern in blind_spots:
@@ -9,17 +9,33 @@ Generates insights across:
 - Network intelligence (stale relationships, domain matches, gaps)
 - Pattern detection (communication, trust, energy, blind spots)
 - Goal alignment (stated vs revealed, network-goal fit)
+
+From asyncio code, await agenerate_full_report(), aquick_summary() or
+abefore_meeting() instead: they run on worker threads so other coroutines
+keep running.
 """
 
+import asyncio
 import sys
 from datetime import datetime
 from pathlib import Path
 
+from typing import Optional
+
 from . import goal_alignment, network_intel, pattern_detect
+from .context import AnalysisContext
+
 
+def generate_full_report(context: Optional[AnalysisContext] = None) -> str:
+    """
+    Generate comprehensive human intelligence report.
+
+    All sections share one AnalysisContext, so each input file is parsed
+    once and shared analyses run once per report.
+    """
+    if context is None:
+        context = AnalysisContext()
 
-def generate_full_report() -> str:
-    """Generate comprehensive human intelligence report."""
     report = []
 
     report.append("=" * 60)
@@ -32,19 +48,19 @@ def generate_full_report() -> str:
     report.append("-" * 60)
     report.append("SECTION 1: NETWORK INTELLIGENCE")
     report.append("-" * 60)
-    report.append(network_intel.generate_report())
+    report.append(network_intel.generate_report(context=context))
 
     # Section 2: Pattern Detection
     report.append("-" * 60)
     report.append("SECTION 2: PATTERN DETECTION")
     report.append("-" * 60)
-    report.append(pattern_detect.generate_report())
+    report.append(pattern_detect.generate_report(context=context))
 
     # Section 3: Goal Alignment
     report.append("-" * 60)
     report.append("SECTION 3: GOAL ALIGNMENT")
     report.append("-" * 60)
-    report.append(goal_alignment.generate_report())
+    report.append(goal_alignment.generate_report(context=context))
 
     # Section 4: Actionable Insights
     report.append("-" * 60)
@@ -52,7 +68,7 @@ def generate_full_report() -> str:
     report.append("-" * 60)
     report.append("")
 
-    actions = generate_action_items()
+    actions = generate_action_items(context)
     if actions:
         report.append("Priority actions based on analysis:")
         for i, action in enumerate(actions, 1):
@@ -71,12 +87,15 @@ def generate_full_report() -> str:
     return "\n".join(report)
 
 
-def generate_action_items() -> list[dict]:
+def generate_action_items(context: Optional[AnalysisContext] = None) -> list[dict]:
     """Generate prioritized action items from all analyses."""
+    if context is None:
+        context = AnalysisContext()
+
     actions = []
 
     # Get network insights
-    network = network_intel.load_network()
+    network = context.network
 
     # Check if network is populated
     connections = network.get("connections", [])
@@ -89,7 +108,7 @@ def generate_action_items() -> list[dict]:
         return actions
 
     # Stale relationships
-    stale = network_intel.stale_relationships(network)
+    stale = context.memo("stale_relationships", lambda: network_intel.stale_relationships(context=context))
     for s in stale[:3]:  # Top 3
         if s.priority == "high":
             actions.append({
@@ -99,7 +118,7 @@ def generate_action_items() -> list[dict]:
             })
 
     # Network gaps
-    gaps = network_intel.network_gaps(network)
+    gaps = context.memo("network_gaps", lambda: network_intel.network_gaps(context=context))
     for g in gaps[:2]:
         if g.priority == "high":
             actions.append({
@@ -109,7 +128,7 @@ def generate_action_items() -> list[dict]:
             })
 
     # Draining relationships
-    energy = network_intel.energizing_connections(network)
+    energy = context.memo("energizing_connections", lambda: network_intel.energizing_connections(context=context))
     for e in energy:
         if e.type == "draining" and len(e.connections) > 3:
             actions.append({
@@ -119,7 +138,7 @@ def generate_action_items() -> list[dict]:
             })
 
     # Blind spots
-    blind_spots = pattern_detect.blind_spot_detection(network)
+    blind_spots = context.memo("blind_spot_detection", lambda: pattern_detect.blind_spot_detection(context=context))
     for b in blind_spots[:2]:
         if "undocumented" in b.type or "echo" in b.type:
             actions.append({
@@ -129,8 +148,7 @@ def generate_action_items() -> list[dict]:
             })
 
     # Goal alignment
-    goals = goal_alignment.load_goals()
-    alignment = goal_alignment.stated_vs_revealed(goals)
+    alignment = context.memo("stated_vs_revealed", lambda: goal_alignment.stated_vs_revealed(context.goals))
     for a in alignment:
         if a.type == "misaligned":
             actions.append({
@@ -146,9 +164,12 @@ def generate_action_items() -> list[dict]:
     return actions[:10]  # Top 10 actions
 
 
-def quick_summary() -> dict:
+def quick_summary(context: Optional[AnalysisContext] = None) -> dict:
     """Generate a quick summary for session start."""
-    network = network_intel.load_network()
+    if context is None:
+        context = AnalysisContext()
+
+    network = context.network
     connections = network.get("connections", [])
 
     if not connections:
@@ -157,7 +178,7 @@ def quick_summary() -> dict:
             "message": "Network not populated. Import LinkedIn data to enable intelligence.",
         }
 
-    summary = network_intel.network_summary(network)
+    summary = network_intel.network_summary(context=context)
 
     # Count key metrics
     high_trust = summary.get("high_trust_count", 0)
@@ -179,10 +200,12 @@ def quick_summary() -> dict:
     }
 
 
-def before_meeting(connection_id: str) -> str:
+def before_meeting(connection_id: str, context: Optional[AnalysisContext] = None) -> str:
     """Generate a quick brief before meeting someone."""
-    network = network_intel.load_network()
-    assessment = network_intel.connection_assessment(connection_id, network)
+    if context is None:
+        context = AnalysisContext()
+
+    assessment = network_intel.connection_assessment(connection_id, context.network)
 
     if "error" in assessment:
         return f"Connection not found: {connection_id}"
@@ -221,6 +244,35 @@ def before_meeting(connection_id: str) -> str:
     return "\n".join(brief)
 
 
+# === ASYNC VARIANTS ===
+
+
+async def _aprepare(context: Optional[AnalysisContext], inputs: tuple[str, ...]) -> AnalysisContext:
+    """A context whose inputs have been loaded concurrently on worker threads."""
+    if context is None:
+        context = AnalysisContext()
+    await asyncio.gather(*(asyncio.to_thread(getattr, context, name) for name in inputs))
+    return context
+
+
+async def agenerate_full_report(context: Optional[AnalysisContext] = None) -> str:
+    """generate_full_report() without blocking the event loop."""
+    context = await _aprepare(context, ("network", "goals", "interactions"))
+    return await asyncio.to_thread(generate_full_report, context)
+
+
+async def aquick_summary(context: Optional[AnalysisContext] = None) -> dict:
+    """quick_summary() without blocking the event loop."""
+    context = await _aprepare(context, ("network",))
+    return await asyncio.to_thread(quick_summary, context)
+
+
+async def abefore_meeting(connection_id: str, context: Optional[AnalysisContext] = None) -> str:
+    """before_meeting() without blocking the event loop."""
+    context = await _aprepare(context, ("network",))
+    return await asyncio.to_thread(before_meeting, connection_id, context)
+
+
 def main():
     """CLI entry point."""
     if len(sys.argv) > 1:
@@ -0,0 +1,115 @@
+"""
+Analysis Server
+Serves the human layer analyses from a resident brain server.
+
+Registers the run_all entry points and the package's analysis functions
+on a brain SDK BrainServer as `analysis.<name>`, all sharing one
+AnalysisContext. The context (parsed files plus memoized results) is
+replaced when network.yaml, goals.yaml or interactions.yaml change, and
+at the start of each day, since staleness is measured from today.
+
+Requires the brain SDK on the path.
+
+Usage:
+    python -m analysis.server [--socket PATH]
+    python -m brain.client analysis.quick_summary
+    python -m brain.client analysis.before_meeting conn.john-smith
+"""
+
+import argparse
+import importlib
+import inspect
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Callable, Optional
+
+from brain.server import BrainServer, serve
+
+from . import run_all
+from .context import HUMAN_ROOT, AnalysisContext
+
+WATCHED_FILES = ("network.yaml", "goals.yaml", "interactions.yaml")
+
+# Inputs filled in from the shared context when the caller leaves them out
+CONTEXT_INPUTS = ("context", "network", "goals", "interactions")
+
+
+class LiveContext:
+    """An AnalysisContext that is rebuilt once its inputs change."""
+
+    def __init__(self):
+        self._key = None
+        self._context: Optional[AnalysisContext] = None
+        self._lock = threading.Lock()
+
+    def _current_key(self) -> tuple:
+        signatures = []
+        for name in WATCHED_FILES:
+            try:
+                stat = (HUMAN_ROOT / name).stat()
+                signatures.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signatures.append(None)
+        return date.today(), tuple(signatures)
+
+    def get(self) -> AnalysisContext:
+        key = self._current_key()
+        with self._lock:
+            if key != self._key:
+                self._context = AnalysisContext()
+                self._key = key
+            return self._context
+
+
+def with_context(function: Callable, live: LiveContext) -> Callable:
+    """Call function with the shared context's data for inputs it was not given."""
+    signature = inspect.signature(function)
+    inputs = [name for name in CONTEXT_INPUTS if name in signature.parameters]
+
+    def call(*args, **kwargs):
+        # Bind first: an input may have been passed positionally
+        bound = signature.bind_partial(*args, **kwargs)
+        missing = [name for name in inputs if name not in bound.arguments]
+        if missing:
+            context = live.get()
+            for name in missing:
+                bound.arguments[name] = context if name == "context" else getattr(context, name)
+        return function(*bound.args, **bound.kwargs)
+
+    return call
+
+
+def register_analysis(server: BrainServer, live: Optional[LiveContext] = None) -> None:
+    """Serve the analyses on server as analysis.<name>."""
+    live = live or LiveContext()
+    functions = {
+        name: getattr(run_all, name)
+        for name in ("generate_full_report", "generate_action_items", "quick_summary", "before_meeting")
+    }
+    package = importlib.import_module(__package__)
+    for name in package.__all__:
+        function = getattr(package, name)
+        if inspect.isfunction(function) and any(p in inspect.signature(function).parameters for p in CONTEXT_INPUTS):
+            functions[name] = function
+    for name, function in functions.items():
+        server.register(f"analysis.{name}", with_context(function, live))
+
+    # Parse and warm the shared results now rather than on the first query
+    run_all.generate_action_items(live.get())
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Serve brain and human layer analysis queries")
+    parser.add_argument("--socket", type=Path, default=None, help="socket path (default: brain.client.DEFAULT_SOCKET_PATH)")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between brain file change checks")
+    args = parser.parse_args()
+
+    server = BrainServer(args.socket, interval=args.interval)
+    register_analysis(server)
+    serve(server)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Term Index
+Inverted index from network expertise terms to connections.
+
+Every distinct (lowercased) domain and can_ask_for entry in network.yaml
+is a term. TermIndex maps terms to the connections listing them, and
+n-grams (1 to 3 characters) to terms, so "which terms contain this word"
+intersects a few posting sets and verifies the survivors instead of
+comparing the word with every term. Words resolve once per index and are
+reused across goals.
+
+Usage:
+    index = term_index(context=context)
+    index.terms_containing("mrr")   # {term id, ...}
+    index.connections_with("mrr")   # {connection index, ...}
+"""
+
+from typing import Optional
+
+from .context import AnalysisContext, resolve_context
+
+GRAM = 3
+
+
+def _grams(text: str, size: int) -> set[str]:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class TermIndex:
+    """Terms of a network's domains and can_ask_for fields, indexed by substring."""
+
+    def __init__(self, network: dict):
+        self.connections = network.get("connections", [])
+        self.terms: list[str] = []
+        self._term_ids: dict[str, int] = {}
+        self._holders: list[list[int]] = []  # term id -> connection indexes
+        self._grams: dict[str, set[int]] = {}  # 1- to 3-grams -> term ids
+        self._resolved: dict[str, frozenset] = {}
+        self._word_holders: dict[str, frozenset] = {}
+
+        for i, conn in enumerate(self.connections):
+            seen = set()
+            for value in [*(conn.get("domains") or []), *(conn.get("can_ask_for") or [])]:
+                if not isinstance(value, str):
+                    continue
+                term = value.lower()
+                term_id = self._term_ids.get(term)
+                if term_id is None:
+                    term_id = self._add_term(term)
+                if term_id not in seen:
+                    seen.add(term_id)
+                    self._holders[term_id].append(i)
+
+    def _add_term(self, term: str) -> int:
+        term_id = self._term_ids[term] = len(self.terms)
+        self.terms.append(term)
+        self._holders.append([])
+        for size in range(1, GRAM + 1):
+            for gram in _grams(term, size):
+                self._grams.setdefault(gram, set()).add(term_id)
+        return term_id
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def terms_containing(self, word: str) -> frozenset:
+        """Ids of the terms that contain word as a substring (cached per word)."""
+        word = word.lower()
+        found = self._resolved.get(word)
+        if found is None:
+            if not word:
+                found = frozenset(range(len(self.terms)))
+            else:
+                postings = sorted(
+                    (self._grams.get(gram, set()) for gram in _grams(word, min(len(word), GRAM))),
+                    key=len,
+                )
+                candidates = set(postings[0]).intersection(*postings[1:])
+                if len(word) > GRAM:
+                    candidates = {t for t in candidates if word in self.terms[t]}
+                found = frozenset(candidates)
+            self._resolved[word] = found
+        return found
+
+    def connections_with(self, word: str) -> frozenset:
+        """Indexes of the connections listing a term that contains word (cached per word)."""
+        word = word.lower()
+        holders = self._word_holders.get(word)
+        if holders is None:
+            holders = self._word_holders[word] = frozenset(
+                i for term_id in self.terms_containing(word) for i in self._holders[term_id]
+            )
+        return holders
+
+
+def term_index(
+    network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
+) -> TermIndex:
+    """Get the term index for a network, built once per context."""
+    context = resolve_context(context, network=network)
+    return context.memo("term_index", lambda: TermIndex(context.network))
@@ -0,0 +1,126 @@
+"""
+Topic Matching
+Many topics against every connection in one pass.
+
+domain_matches() answers one topic with a scan of the network. Matching a
+whole list of topics (thread names, goals) that way costs topics x network.
+TopicMatcher compiles the topics into one Aho-Corasick automaton instead,
+so each connection's searchable text is read once whatever the number of
+topics, and match_topics() returns every topic's connections at once.
+
+A connection matches a topic under the same rule as domain_matches(): the
+case-folded topic occurs within one of its domains, position, company,
+notes or can_ask_for fields. The lowercased search texts are built once
+per AnalysisContext.
+
+Usage:
+    matches = match_topics(["sales playbook", "fundraising"], context=context)
+    matches["fundraising"]  # [conn, ...] in network order
+"""
+
+from collections import deque
+from typing import Iterable, Optional
+
+from .context import AnalysisContext, resolve_context
+
+STRENGTH_ORDER = {"close": 3, "warm": 2, "cold": 1}
+
+# Joins a connection's fields; never occurs in a topic, so matches cannot span fields
+FIELD_SEPARATOR = "\0"
+
+
+class TopicMatcher:
+    """Aho-Corasick automaton over a set of case-folded topics."""
+
+    def __init__(self, topics: Iterable[str]):
+        self.topics = list(dict.fromkeys(topics))
+        patterns = [topic.lower() for topic in self.topics]
+        self._everywhere = [k for k, p in enumerate(patterns) if not p]  # "" is in every text
+
+        # Trie of the patterns; outputs[state] = topics ending there
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for k, pattern in enumerate(patterns):
+            if not pattern or FIELD_SEPARATOR in pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                following = goto[state].get(ch)
+                if following is None:
+                    following = len(goto)
+                    goto[state][ch] = following
+                    goto.append({})
+                    outputs.append([])
+                state = following
+            outputs[state].append(k)
+
+        # Fold failure links into the transitions (breadth first, so a state's
+        # fallback is complete before its children copy it): scanning is then
+        # one dict lookup per character, with unknown characters back at the root
+        self._delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            fallback = fail[state]
+            self._delta[state] = {**self._delta[fallback], **goto[state]}
+            outputs[state] = outputs[state] + outputs[fallback]
+            for ch, child in goto[state].items():
+                fail[child] = self._delta[fallback].get(ch, 0) if state else 0
+                queue.append(child)
+        self._outputs = [tuple(found) for found in outputs]
+
+    def matches(self, text: str) -> set[int]:
+        """Indexes (into self.topics) of the topics occurring in an already lowercased text."""
+        found = set(self._everywhere)
+        delta, outputs = self._delta, self._outputs
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+
+def search_texts(
+    network: Optional[dict] = None,
+    context: Optional[AnalysisContext] = None,
+) -> list[tuple[dict, str]]:
+    """(connection, lowercased searchable fields) per connection, built once per context."""
+    context = resolve_context(context, network=network)
+
+    def build() -> list[tuple[dict, str]]:
+        texts = []
+        for conn in context.network.get("connections", []):
+            fields = [
+                " ".join(conn.get("domains") or []),
+                conn.get("position") or "",
+                conn.get("company") or "",
+                conn.get("notes") or "",
+                " ".join(conn.get("can_ask_for") or []),
+            ]
+            texts.append((conn, FIELD_SEPARATOR.join(fields).lower()))
+        return texts
+
+    return context.memo("search_texts", build)
+
+
+def match_topics(
+    topics: Iterable[str],
+    network: Optional[dict] = None,
+    min_strength: str = "cold",
+    context: Optional[AnalysisContext] = None,
+) -> dict[str, list[dict]]:
+    """Map each topic to the connections (at least min_strength) related to it, in network order."""
+    matcher = TopicMatcher(topics)
+    result: dict[str, list[dict]] = {topic: [] for topic in matcher.topics}
+    if not matcher.topics:
+        return result
+
+    min_order = STRENGTH_ORDER.get(min_strength, 1)
+    for conn, text in search_texts(network, context):
+        if STRENGTH_ORDER.get(conn.get("relationship_strength", "cold"), 1) < min_order:
+            continue
+        for k in matcher.matches(text):
+            result[matcher.topics[k]].append(conn)
+    return result
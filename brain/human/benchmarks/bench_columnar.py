@@ -0,0 +1,88 @@
+"""
+Columnar vs dict analysis benchmark
+
+Runs staleness, trajectory and histogram analyses on a synthetic network
+through the dict path (single-pass aggregate + per-row date compares) and
+the NumPy columnar view.
+
+Usage:
+    python benchmarks/bench_columnar.py [connections]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analysis.aggregate import aggregate_network  # noqa: E402
+from analysis.columnar import ColumnarNetwork  # noqa: E402
+from benchmarks.synthetic import make_network  # noqa: E402
+
+
+def _timed(fn, repeat: int = 5):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def dict_analyses(agg) -> tuple:
+    now = datetime.now()
+    stale_cutoff = (now - timedelta(days=180)).strftime("%Y-%m-%d")
+    trend_cutoff = (now - timedelta(days=90)).strftime("%Y-%m-%d")
+    stale = sum(1 for _, _, touch in agg.touch_candidates if touch < stale_cutoff)
+    cooling = sum(1 for _, _, last in agg.cooling_candidates if last < trend_cutoff)
+    warming = sum(1 for _, last in agg.warming_candidates if last >= trend_cutoff)
+    return (
+        stale, cooling, warming, dict(agg.by_strength), dict(agg.domain_counts),
+        _levels(agg.by_trust), _levels(agg.by_energy),
+    )
+
+
+def columnar_analyses(view) -> tuple:
+    return (
+        int(view.stale_mask().sum()),
+        int(view.cooling_mask().sum()),
+        int(view.warming_mask().sum()),
+        view.strength_histogram(),
+        view.domain_histogram(),
+        _levels(view.trust_histogram()),
+        _levels(view.energy_histogram()),
+    )
+
+
+def _levels(histogram: dict) -> dict:
+    """Non-empty buckets of named levels (explicit nulls have no column code)."""
+    return {level: count for level, count in histogram.items() if level is not None and count}
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    network = make_network(n)
+    # Leave some fields out entirely: they must count as unknown trust / neutral energy
+    for conn in network["connections"][::7]:
+        del conn["trust_level"]
+    for conn in network["connections"][::5]:
+        del conn["energy"]
+    print(f"Synthetic network: {n:,} connections\n")
+
+    agg_build, agg = _timed(lambda: aggregate_network(network), repeat=3)
+    view_build, view = _timed(lambda: ColumnarNetwork.from_network(network), repeat=3)
+    dict_query, dict_result = _timed(lambda: dict_analyses(agg))
+    col_query, col_result = _timed(lambda: columnar_analyses(view))
+
+    assert dict_result[:3] == col_result[:3], (dict_result[:3], col_result[:3])
+    assert dict_result[4:] == col_result[4:], (dict_result[5:], col_result[5:])
+
+    print(f"{'':<12}{'build (ms)':>12}{'analyses (ms)':>16}")
+    print(f"{'dict':<12}{agg_build * 1000:>12.1f}{dict_query * 1000:>16.2f}")
+    print(f"{'columnar':<12}{view_build * 1000:>12.1f}{col_query * 1000:>16.2f}")
+    print(f"\nstale={col_result[0]:,} cooling={col_result[1]:,} warming={col_result[2]:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+LinkedIn ingest benchmark
+
+Generates a synthetic export and measures Messages.csv throughput
+(rows/sec) and peak traced memory of the streaming aggregator, plus the
+per-row cost of date parsing before (strptime cascade) and after
+(DateParser), serial vs process-pool wall clock for parse_all(), and
+network.yaml export time (first write, unchanged rewrite, one change).
+
+Usage:
+    python benchmarks/bench_ingest.py [messages] [connections]
+"""
+
+import contextlib
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import write_export  # noqa: E402
+from ingest.linkedin import DATE_FORMATS, DateParser, LinkedInParser  # noqa: E402
+
+
+def strptime_cascade(date_str: str):
+    """The original _parse_date: try each format until one parses."""
+    if not date_str:
+        return None
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str.strip(), fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return date_str
+
+
+def bench_dates(export: Path) -> None:
+    with open(export / "Messages.csv", newline="") as f:
+        reader = csv.reader(f)
+        date_col = next(reader).index("Date")
+        dates = [row[date_col] for row in reader]
+    with open(export / "Connections.csv", newline="") as f:
+        reader = csv.reader(f)
+        connected_col = next(reader).index("Connected On")
+        connected = [row[connected_col] for row in reader]
+
+    print(f"\nDate parsing per row ({len(dates):,} message dates, {len(connected):,} connection dates):")
+    for label, values in (("Messages.csv Date", dates), ("Connected On", connected)):
+        start = time.perf_counter()
+        before = [strptime_cascade(v) for v in values]
+        old = time.perf_counter() - start
+
+        parser = DateParser()
+        start = time.perf_counter()
+        after = [parser.parse(v, label) for v in values]
+        new = time.perf_counter() - start
+
+        assert before == after
+        print(f"  {label:<20}{old / len(values) * 1e6:>8.2f} us -> {new / len(values) * 1e6:.2f} us"
+              f"  ({old / new:.0f}x)")
+
+
+def bench_messages(export: Path) -> None:
+    parser = LinkedInParser(str(export))
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser.parse_connections()
+
+        start = time.perf_counter()
+        rows = parser.parse_messages()
+        elapsed = time.perf_counter() - start
+
+        # Memory is measured on a second run; tracing slows parsing down
+        parser = LinkedInParser(str(export))
+        parser.parse_connections()
+        tracemalloc.start()
+        parser.parse_messages()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"Messages.csv: {rows:,} rows in {elapsed:.2f}s = {rows / elapsed:,.0f} rows/sec")
+    print(f"  distinct senders: {len(parser.message_stats):,}, peak traced memory: {peak / 1e6:.1f} MB")
+
+
+def bench_parallel(export: Path) -> None:
+    workers = os.cpu_count() or 1
+    print(f"\nparse_all() wall clock ({workers} CPUs):")
+    results = {}
+    for parallel in (False, True):
+        parser = LinkedInParser(str(export))
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            parser.parse_all(parallel=parallel, workers=workers)
+            elapsed = time.perf_counter() - start
+        results[parallel] = sorted(parser.message_stats.items())
+        print(f"  {'parallel' if parallel else 'serial':<10}{elapsed:>8.2f}s")
+    assert results[False] == results[True]
+
+
+def bench_export(export: Path) -> None:
+    parser = LinkedInParser(str(export))
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser.parse_all()
+
+    print(f"\nexport_network() ({len(parser.connections):,} connections):")
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "network.yaml"
+        for label in ("first write", "unchanged", "one change"):
+            if label == "one change":
+                next(iter(parser.connections.values())).position = "Changed"
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                parser.export_network(output)
+                elapsed = time.perf_counter() - start
+            print(f"  {label:<12}{elapsed:>8.2f}s")
+
+
+def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    connections = int(sys.argv[2]) if len(sys.argv) > 2 else 30_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        export = Path(tmp)
+        print(f"Generating export: {connections:,} connections, {messages:,} messages...")
+        write_export(export, connections, messages)
+        bench_messages(export)
+        bench_dates(export)
+        bench_parallel(export)
+        bench_export(export)
+
+
+if __name__ == "__main__":
+    main()
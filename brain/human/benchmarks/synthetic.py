@@ -0,0 +1,99 @@
+"""
+Synthetic human-layer data for benchmarks.
+
+make_network(n) returns a network.yaml-shaped dict with n connections and
+realistic field coverage (domains, trust, energy, assessments, dates).
+"""
+
+import random
+from datetime import date, timedelta
+
+DOMAINS = [
+    "sales", "distribution", "fundraising", "ml", "ai", "product", "design",
+    "fintech", "marketing", "operations", "growth", "saas", "revenue", "hiring",
+]
+CAN_ASK_FOR = ["intro to vcs", "pricing advice", "hiring", "sales playbook", "mrr growth"]
+POSITIVES = ["Incredible at closing deals", "Deep technical expertise in ML", "Always follows through"]
+NEGATIVES = ["Tends to overpromise", "Can be flaky with timing", "Talks more than listens"]
+FIRST_NAMES = ["John", "Jane", "Alex", "Sam", "Maria", "Li", "Omar", "Priya", "Chris", "Taylor"]
+LAST_NAMES = ["Smith", "Doe", "Lee", "Garcia", "Chen", "Khan", "Patel", "Brown", "Wilson", "Nguyen"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne"]
+POSITIONS = ["Partner", "Founder", "VP Sales", "Growth Lead", "Engineer", "Designer", "BD Manager"]
+
+
+def _date(rng: random.Random) -> str:
+    return (date(2015, 1, 1) + timedelta(days=rng.randint(0, 4300))).isoformat()
+
+
+def make_network(n: int, seed: int = 0) -> dict:
+    """Generate a network with n connections."""
+    rng = random.Random(seed)
+    connections = []
+    for i in range(n):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        connections.append({
+            "id": f"conn.{first.lower()}-{last.lower()}-{i}",
+            "name": f"{first} {last}",
+            "company": rng.choice(COMPANIES),
+            "position": rng.choice(POSITIONS),
+            "connected_date": _date(rng),
+            "relationship_strength": rng.choice(["cold", "cold", "cold", "warm", "close"]),
+            "message_count": rng.randint(0, 30),
+            "last_message": _date(rng) if rng.random() < 0.7 else None,
+            "domains": rng.sample(DOMAINS, rng.randint(0, 3)),
+            "can_ask_for": rng.sample(CAN_ASK_FOR, rng.randint(0, 2)),
+            "introduces_to": [],
+            "notes": "",
+            "last_contact": _date(rng) if rng.random() < 0.2 else None,
+            "positives": rng.sample(POSITIVES, rng.randint(0, 2)),
+            "negatives": rng.sample(NEGATIVES, rng.randint(0, 1)),
+            "trust_level": rng.choice([None, "high", "medium", "low", "unknown"]),
+            "energy": rng.choice([None, "energizing", "neutral", "draining"]),
+        })
+    return {"connections": connections, "stats": {}}
+
+
+def write_export(path, connections: int, messages: int, seed: int = 0) -> None:
+    """Write a LinkedIn-style export (connections, messages, positions, skills) to path."""
+    import csv
+    from pathlib import Path
+
+    rng = random.Random(seed)
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    names = []
+    with open(path / "Connections.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["First Name", "Last Name", "Email Address", "Company", "Position", "Connected On"])
+        for i in range(connections):
+            first, last = rng.choice(FIRST_NAMES), f"{rng.choice(LAST_NAMES)}{i % 997}"
+            names.append(f"{first} {last}")
+            connected = date(2015, 1, 1) + timedelta(days=rng.randint(0, 3000))
+            writer.writerow([
+                first, last, f"{first.lower()}.{i}@example.com" if rng.random() < 0.3 else "",
+                rng.choice(COMPANIES), rng.choice(POSITIONS), connected.strftime("%d %b %Y"),
+            ])
+
+    # Skewed senders: a few people account for most messages
+    with open(path / "Messages.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["From", "To", "Date", "Subject", "Content"])
+        for _ in range(messages):
+            sender = names[min(int(rng.paretovariate(1.2)) - 1, len(names) - 1)] if names else "Someone"
+            if rng.random() < 0.05:
+                sender = sender.split()[0]  # some exports only carry first names
+            sent = date(2018, 1, 1) + timedelta(days=rng.randint(0, 2500))
+            writer.writerow([sender, "Me", sent.isoformat(), "", "hello"])
+
+    with open(path / "Positions.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Company Name", "Title", "Started On", "Finished On"])
+        for company, title in zip(COMPANIES, POSITIONS):
+            writer.writerow([company, title, "Jan 2019", "Mar 2021"])
+
+    with open(path / "Skills.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Name"])
+        for skill in DOMAINS:
+            writer.writerow([skill])
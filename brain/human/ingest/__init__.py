@@ -3,6 +3,7 @@ Human Layer Ingestion Package
 Parsers for importing data from external sources into the human layer.
 """
 
+from .identity import IdentityIndex
 from .linkedin import LinkedInParser
 
-__all__ = ["LinkedInParser"]
+__all__ = ["IdentityIndex", "LinkedInParser"]
@@ -0,0 +1,158 @@
+"""
+Identity Resolution
+Hash indexes mapping imported people to stable connection IDs.
+
+Every lookup is a dict probe on a normalized key, so assigning IDs to a
+whole export and resolving every message sender is linear in its size.
+
+Keys, strongest first:
+    - email address
+    - normalized full name + company
+    - normalized full name
+
+Usage:
+    identities = IdentityIndex()
+    identities.remember(previous_connections)  # from the last import
+    ids = identities.assign(people)  # [(first, last, email, company), ...]
+    identities.resolve("jane  DOE")  # -> ["conn.jane-doe"]
+"""
+
+import re
+import unicodedata
+from typing import Any, Iterable, Optional
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+_NON_ID = re.compile(r"[^a-z0-9]")
+
+# ("email", address), ("name_company", name, company) or ("name", name)
+IdentityKey = tuple[str, ...]
+
+# (first_name, last_name, email, company) of one imported person
+Person = tuple[str, str, Optional[str], Optional[str]]
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Case-, accent- and punctuation-insensitive form of a name."""
+    if not name:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(" ", stripped.casefold()).strip()
+
+
+def normalize_email(email: Optional[str]) -> str:
+    return email.strip().lower() if email else ""
+
+
+def make_id(first_name: str, last_name: str) -> str:
+    """Generate a connection ID from name."""
+    return f"conn.{_NON_ID.sub('', first_name.lower())}-{_NON_ID.sub('', last_name.lower())}"
+
+
+def _identity_keys(name: Optional[str], email: Optional[str], company: Optional[str]) -> list[IdentityKey]:
+    """Lookup keys for one person, strongest first."""
+    keys: list[IdentityKey] = []
+    normalized_email = normalize_email(email)
+    if normalized_email:
+        keys.append(("email", normalized_email))
+    normalized_name = normalize_name(name)
+    if normalized_name and company:
+        keys.append(("name_company", normalized_name, normalize_name(company)))
+    if normalized_name:
+        keys.append(("name", normalized_name))
+    return keys
+
+
+class IdentityIndex:
+    """
+    Assigns connection IDs and resolves message senders to connections.
+
+    People remembered from a previous import keep their IDs: each imported
+    row claims the first unclaimed previous identity sharing its email, then
+    its name + company, then its name. Strong keys are matched for the whole
+    batch before falling back to names, so a new namesake never takes an
+    existing person's ID just by appearing earlier in the file. Everyone
+    else gets conn.first-last, suffixed -2, -3, ... on collision; the next
+    free suffix is tracked per base ID instead of probed from 2.
+    """
+
+    def __init__(self) -> None:
+        self._prior: dict[IdentityKey, list[str]] = {}  # identity key -> remembered ids, in order
+        self._claimed: set[str] = set()
+        self._taken: set[str] = set()  # every id in use or reserved by a previous import
+        self._next_suffix: dict[str, int] = {}
+
+        # Current connections, for sender resolution
+        self._by_name: dict[str, list[str]] = {}
+        self._by_first_name: dict[str, list[str]] = {}
+
+    def remember(self, records: Iterable[dict[str, Any]]) -> None:
+        """Reserve the IDs of connections from a previous import."""
+        for record in records:
+            conn_id = record["id"]
+            self._taken.add(conn_id)
+            for key in _identity_keys(record.get("name"), record.get("email"), record.get("company")):
+                self._prior.setdefault(key, []).append(conn_id)
+
+    def add(self, conn_id: str, name: str, first_name: str) -> None:
+        """Register a current connection under an already assigned ID."""
+        self._claimed.add(conn_id)
+        self._taken.add(conn_id)
+        self._by_name.setdefault(normalize_name(name), []).append(conn_id)
+        self._by_first_name.setdefault(normalize_name(first_name), []).append(conn_id)
+
+    def assign(self, people: list[Person]) -> list[str]:
+        """
+        IDs for (first_name, last_name, email, company) rows, in order.
+
+        The rows are registered as current connections.
+        """
+        claimed: list[Optional[str]] = [None] * len(people)
+        keys = [_identity_keys(f"{first} {last}", email, company) for first, last, email, company in people]
+
+        # Strong keys first, then name-only matches
+        for strong in (True, False):
+            for i, person_keys in enumerate(keys):
+                if claimed[i] is None:
+                    claimed[i] = self._claim([k for k in person_keys if (k[0] != "name") == strong])
+
+        ids = []
+        for (first, last, _, _), conn_id in zip(people, claimed):
+            conn_id = conn_id or self._new_id(make_id(first, last))
+            ids.append(conn_id)
+            self.add(conn_id, f"{first} {last}", first)
+        return ids
+
+    def _claim(self, keys: list[IdentityKey]) -> Optional[str]:
+        for key in keys:
+            for conn_id in self._prior.get(key, ()):
+                if conn_id not in self._claimed:
+                    self._claimed.add(conn_id)
+                    return conn_id
+        return None
+
+    def _new_id(self, base_id: str) -> str:
+        if base_id not in self._taken:
+            return base_id
+        counter = self._next_suffix.get(base_id, 2)
+        while f"{base_id}-{counter}" in self._taken:
+            counter += 1
+        self._next_suffix[base_id] = counter + 1
+        return f"{base_id}-{counter}"
+
+    def resolve(self, sender: str) -> list[str]:
+        """
+        Connection IDs a message sender refers to.
+
+        A full name matches every connection with that name. A bare first
+        name matches only when exactly one connection has it; otherwise it
+        is ambiguous and resolves to nothing.
+        """
+        key = normalize_name(sender)
+        ids = self._by_name.get(key)
+        if ids:
+            return ids
+        ids = self._by_first_name.get(key)
+        if ids and len(ids) == 1:
+            return ids
+        return []
@@ -4,6 +4,8 @@ Ingests LinkedIn data export CSVs and populates the human layer.
 
 Usage:
     python -m context._brain.human.ingest.linkedin /path/to/linkedin-export/
+    python -m context._brain.human.ingest.linkedin /path/to/linkedin-export/ --parallel
+    python -m context._brain.human.ingest.linkedin /path/to/linkedin-export/ --incremental
 
 Expected files in export directory:
     - Connections.csv
@@ -14,16 +16,23 @@ Expected files in export directory:
 """
 
 import csv
+import hashlib
+import io
+import itertools
 import os
+import pickle
 import re
 import sys
-from collections import defaultdict
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional
 
-import yaml
+from .identity import IdentityIndex
+from .yaml_writer import RecordDocument, record_hash
 
 
 @dataclass
@@ -113,42 +122,376 @@ class Role:
         }
 
 
-class LinkedInParser:
-    """Parser for LinkedIn data exports."""
-
-    def __init__(self, export_path: str):
-        self.export_path = Path(export_path)
-        self.connections: dict[str, Connection] = {}
-        self.roles: list[Role] = []
-        self.skills: list[str] = []
-        self.messages: dict[str, list] = defaultdict(list)  # name -> messages
-
-    def _make_id(self, first_name: str, last_name: str) -> str:
-        """Generate a connection ID from name."""
-        clean = lambda s: re.sub(r'[^a-z0-9]', '', s.lower())
-        return f"conn.{clean(first_name)}-{clean(last_name)}"
+DATE_FORMATS = [
+    "%d %b %Y",  # 15 Jan 2023
+    "%b %d, %Y",  # Jan 15, 2023
+    "%Y-%m-%d",  # 2023-01-15
+    "%m/%d/%Y",  # 01/15/2023
+    "%d/%m/%Y",  # 15/01/2023
+]
+
+_ISO_DATE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_LINKEDIN_DATE = re.compile(r"(\d{1,2}) ([A-Za-z]{3}) (\d{4})")
+_MONTHS = {m: i for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1)}
+
+
+class DateParser:
+    """
+    Parses export dates to YYYY-MM-DD, tuned for columns of repeated values.
+
+    - Identical raw strings are memoized per column (exports repeat dates
+      heavily).
+    - ISO (2023-01-15) and LinkedIn (15 Jan 2023) dates take a regex fast
+      path instead of strptime.
+    - Other values try DATE_FORMATS, starting with the format that last
+      matched in the same column. For ambiguous day/month values this means
+      the column's established format wins. A column can instead be pinned
+      to a format settled up front (see detect_format()), so that every
+      value parses the same way whichever rows came before it.
+
+    Values that match no format are returned as-is.
+    """
+
+    MEMO_LIMIT = 1 << 16
+
+    def __init__(self):
+        self._memo: dict[Optional[str], dict[str, str]] = {}
+        self._formats: dict[Optional[str], str] = {}
+        self._pinned: dict[Optional[str], Optional[str]] = {}
+
+    def pin(self, column: Optional[str], fmt: Optional[str]):
+        """Always try fmt first for column (None: DATE_FORMATS order) and stop learning."""
+        self._pinned[column] = fmt
+        self._memo.pop(column, None)
+
+    @staticmethod
+    def detect_format(values) -> Optional[str]:
+        """The format a column would learn first from values: the first one a value needs."""
+        for value in values:
+            text = (value or '').strip()
+            if not text or _ISO_DATE.fullmatch(text):
+                continue
+            match = _LINKEDIN_DATE.fullmatch(text)
+            if match and match.group(2).lower() in _MONTHS:
+                continue
+            for fmt in DATE_FORMATS:
+                try:
+                    datetime.strptime(text, fmt)
+                except ValueError:
+                    continue
+                return fmt
+        return None
 
-    def _parse_date(self, date_str: str) -> Optional[str]:
-        """Parse various date formats to YYYY-MM-DD."""
+    def parse(self, date_str: str, column: Optional[str] = None) -> Optional[str]:
         if not date_str:
             return None
 
-        formats = [
-            "%d %b %Y",  # 15 Jan 2023
-            "%b %d, %Y",  # Jan 15, 2023
-            "%Y-%m-%d",  # 2023-01-15
-            "%m/%d/%Y",  # 01/15/2023
-            "%d/%m/%Y",  # 15/01/2023
-        ]
-
+        memo = self._memo.get(column)
+        if memo is None:
+            memo = self._memo[column] = {}
+        parsed = memo.get(date_str)
+        if parsed is None:
+            parsed = self._parse(date_str, column)
+            if len(memo) < self.MEMO_LIMIT:
+                memo[date_str] = parsed
+        return parsed
+
+    def _parse(self, date_str: str, column: Optional[str]) -> str:
+        text = date_str.strip()
+
+        match = _ISO_DATE.fullmatch(text)
+        if match:
+            year, month, day = match.groups()
+            return self._iso(int(year), int(month), int(day)) or date_str
+
+        match = _LINKEDIN_DATE.fullmatch(text)
+        if match and match.group(2).lower() in _MONTHS:
+            day, month, year = match.groups()
+            return self._iso(int(year), _MONTHS[month.lower()], int(day)) or date_str
+
+        pinned = column in self._pinned
+        learned = self._pinned[column] if pinned else self._formats.get(column)
+        formats = [learned] + [f for f in DATE_FORMATS if f != learned] if learned else DATE_FORMATS
         for fmt in formats:
             try:
-                return datetime.strptime(date_str.strip(), fmt).strftime("%Y-%m-%d")
+                parsed = datetime.strptime(text, fmt).strftime("%Y-%m-%d")
             except ValueError:
                 continue
+            if not pinned:
+                self._formats[column] = fmt
+            return parsed
 
         return date_str  # Return as-is if can't parse
 
+    @staticmethod
+    def _iso(year: int, month: int, day: int) -> Optional[str]:
+        try:
+            date(year, month, day)
+        except ValueError:
+            return None
+        # Same text as strftime("%Y-%m-%d"), which does not pad the year
+        return f"{year}-{month:02d}-{day:02d}"
+
+
+class MessageStats:
+    """
+    Streaming per-sender message aggregate.
+
+    Keeps only a message count and the latest date per distinct sender, so
+    memory is O(senders) no matter how many message rows are streamed
+    through. Counts live in a compact unsigned array indexed by a
+    sender -> slot map.
+    """
+
+    def __init__(self) -> None:
+        self._slots: dict[str, int] = {}
+        self._counts = array('Q')
+        self._last: list[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, sender: str) -> bool:
+        return sender in self._slots
+
+    def add(self, sender: str, date: Optional[str], count: int = 1) -> None:
+        """Record `count` messages from sender, the latest dated `date`."""
+        slot = self._slots.get(sender)
+        if slot is None:
+            self._slots[sender] = len(self._counts)
+            self._counts.append(count)
+            self._last.append(date)
+            return
+        self._counts[slot] += count
+        last = self._last[slot]
+        if date and (last is None or date > last):
+            self._last[slot] = date
+
+    def get(self, sender: str) -> tuple[int, Optional[str]]:
+        """Message count and latest date for a sender ((0, None) if unseen)."""
+        slot = self._slots.get(sender)
+        if slot is None:
+            return 0, None
+        return self._counts[slot], self._last[slot]
+
+    def items(self) -> Iterator[tuple[str, int, Optional[str]]]:
+        for sender, slot in self._slots.items():
+            yield sender, self._counts[slot], self._last[slot]
+
+    def merge(self, items: Iterable[tuple[str, int, Optional[str]]]) -> None:
+        """Fold in (sender, count, last date) items from a partial aggregate."""
+        for sender, count, last in items:
+            self.add(sender, last, count)
+
+
+def _column(header: list[str], *names: str) -> Optional[int]:
+    """Index of the first of `names` present in a CSV header."""
+    for name in names:
+        if name in header:
+            return header.index(name)
+    return None
+
+
+def _message_columns(header: list[str]) -> tuple[Optional[int], Optional[int]]:
+    """Sender and date column indexes (LinkedIn message format varies)."""
+    return _column(header, 'From', 'SENDER', 'Sender'), _column(header, 'Date', 'DATE', 'Sent Date')
+
+
+MESSAGE_DATE_COLUMN = 'Messages.Date'
+
+# Message rows sampled to settle the date format before aggregating
+DATE_SAMPLE_ROWS = 10_000
+
+
+def _message_date_format(path: Path, date_col: Optional[int]) -> Optional[str]:
+    """
+    Date format for the whole of Messages.csv, settled from its first rows.
+
+    Serial, chunked and incremental parses all pin the date column to it,
+    so an ambiguous date like 03/04/2023 reads the same in every chunk.
+    """
+    if date_col is None:
+        return None
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        rows = itertools.islice(reader, DATE_SAMPLE_ROWS)
+        return DateParser.detect_format(row[date_col] for row in rows if date_col < len(row))
+
+
+def _accumulate_messages(rows, sender_col, date_col, stats: MessageStats, dates: DateParser) -> int:
+    """Stream message rows into stats. Returns the number of messages counted."""
+    count = 0
+    for row in rows:
+        sender = row[sender_col].strip() if sender_col is not None and sender_col < len(row) else ''
+        if not sender:
+            continue
+        date = row[date_col].strip() if date_col is not None and date_col < len(row) else ''
+        stats.add(sender, dates.parse(date, MESSAGE_DATE_COLUMN))
+        count += 1
+    return count
+
+
+def _aggregate_message_chunk(
+    path: str, start: int, end: int, sender_col, date_col, date_format: Optional[str],
+) -> tuple[int, list]:
+    """Process-pool worker: aggregate one byte range of Messages.csv."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+    stats = MessageStats()
+    dates = DateParser()
+    dates.pin(MESSAGE_DATE_COLUMN, date_format)
+    count = _accumulate_messages(csv.reader(io.StringIO(text, newline='')), sender_col, date_col, stats, dates)
+    return count, list(stats.items())
+
+
+def _csv_header(path: Path) -> tuple[list[str], int]:
+    """Header row of a CSV file and its length in bytes."""
+    with open(path, 'rb') as f:
+        line = f.readline()
+    return next(csv.reader([line.decode('utf-8-sig')]), []), len(line)
+
+
+def _csv_chunks(path: Path, data_start: int, chunk_bytes: int) -> list[tuple[int, int]]:
+    """
+    Split a CSV body into byte ranges that begin and end on record boundaries.
+
+    A newline ends a record only outside a quoted field. With RFC 4180
+    escaping ("" inside quotes) that is exactly when the number of quote
+    characters before it is even, so one quote-parity scan finds safe cuts
+    even when message bodies span lines.
+    """
+    size = path.stat().st_size
+    ranges = []
+    start, target = data_start, data_start + chunk_bytes
+    in_quotes = 0
+
+    with open(path, 'rb') as f:
+        f.seek(data_start)
+        offset = data_start  # file offset of block[0]
+        while target < size:
+            block = f.read(1 << 20)
+            if not block:
+                break
+            pos = 0
+            while pos < len(block):
+                if target >= offset + len(block):
+                    # Next cut lies beyond this block
+                    in_quotes ^= block.count(b'"', pos) & 1
+                    break
+                if pos < target - offset:
+                    in_quotes ^= block.count(b'"', pos, target - offset) & 1
+                    pos = target - offset
+                newline = block.find(b'\n', pos)
+                if newline < 0:
+                    in_quotes ^= block.count(b'"', pos) & 1
+                    break
+                in_quotes ^= block.count(b'"', pos, newline) & 1
+                pos = newline + 1
+                if not in_quotes:
+                    cut = offset + pos
+                    ranges.append((start, cut))
+                    start, target = cut, cut + chunk_bytes
+            offset += len(block)
+
+    if start < size:
+        ranges.append((start, size))
+    return ranges
+
+
+# === IMPORT WATERMARKS ===
+
+IMPORT_STATE_VERSION = 1
+
+# Most recent import_log entries kept in network.yaml
+IMPORT_LOG_LIMIT = 20
+
+
+def import_state_path(network_output) -> Path:
+    """Where the incremental import state for a network.yaml is kept."""
+    return Path(network_output).parent / ".cache" / "linkedin_import.pickle"
+
+
+def _file_sha256(path: Path, limit: Optional[int] = None) -> str:
+    """sha256 of a file, or of its first `limit` bytes."""
+    digest = hashlib.sha256()
+    remaining = path.stat().st_size if limit is None else limit
+    with open(path, 'rb') as f:
+        while remaining > 0:
+            block = f.read(min(1 << 20, remaining))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
+
+def _watermark(path: Path, rows: int) -> dict:
+    return {"rows": rows, "bytes": path.stat().st_size, "sha256": _file_sha256(path)}
+
+
+def _appended_from(path: Path, watermark: Optional[dict]) -> Optional[int]:
+    """
+    Byte offset where rows added since `watermark` begin.
+
+    The file size means nothing changed. None means the file is not the
+    recorded one plus appended rows (rewritten, truncated, was empty so the
+    new rows start with a header, or the old copy ended mid-row), so it has
+    to be parsed in full.
+    """
+    if not watermark:
+        return None
+    size = path.stat().st_size
+    end = watermark.get("bytes", -1)
+    if end < 0 or end > size:
+        return None
+    if end < size:
+        if end == 0:
+            return None
+        with open(path, 'rb') as f:
+            f.seek(end - 1)
+            if f.read(1) != b'\n':
+                return None
+    if _file_sha256(path, end) != watermark.get("sha256"):
+        return None
+    return end
+
+
+def _read_import_state(path: Path) -> Optional[dict]:
+    """Saved import state, or None if missing, unreadable or outdated."""
+    try:
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != IMPORT_STATE_VERSION:
+        return None
+    return state
+
+
+class LinkedInParser:
+    """Parser for LinkedIn data exports."""
+
+    # Messages.csv is split into chunks of at least this size for the process pool
+    MIN_CHUNK_BYTES = 4 << 20
+
+    def __init__(self, export_path: str):
+        self.export_path = Path(export_path)
+        self.connections: dict[str, Connection] = {}
+        self.roles: list[Role] = []
+        self.skills: list[str] = []
+        self.message_stats = MessageStats()  # sender -> (count, last date)
+        self.watermarks: dict[str, dict] = {}  # file name -> rows/bytes/sha256
+        self.identities = IdentityIndex()
+        self.incremental = False
+        self._dates = DateParser()
+
+    def _parse_date(self, date_str: str, column: Optional[str] = None) -> Optional[str]:
+        """Parse various date formats to YYYY-MM-DD."""
+        return self._dates.parse(date_str, column)
+
     def parse_connections(self) -> int:
         """Parse Connections.csv."""
         csv_path = self.export_path / "Connections.csv"
@@ -156,96 +499,117 @@ class LinkedInParser:
             print(f"Warning: {csv_path} not found")
             return 0
 
-        count = 0
-        with open(csv_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                first_name = row.get('First Name', '').strip()
-                last_name = row.get('Last Name', '').strip()
-
-                if not first_name:
-                    continue
-
-                conn_id = self._make_id(first_name, last_name)
-
-                # Handle duplicate names by appending number
-                base_id = conn_id
-                counter = 2
-                while conn_id in self.connections:
-                    conn_id = f"{base_id}-{counter}"
-                    counter += 1
-
-                self.connections[conn_id] = Connection(
-                    id=conn_id,
-                    name=f"{first_name} {last_name}",
-                    first_name=first_name,
-                    last_name=last_name,
-                    email=row.get('Email Address', '').strip() or None,
-                    company=row.get('Company', '').strip() or None,
-                    position=row.get('Position', '').strip() or None,
-                    connected_date=self._parse_date(row.get('Connected On', '')),
-                )
-                count += 1
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+            count = len(self._add_connections(csv.DictReader(f)))
+        self.watermarks[csv_path.name] = _watermark(csv_path, count)
 
         print(f"Parsed {count} connections from Connections.csv")
         return count
 
+    def _add_connections(self, rows) -> list[Connection]:
+        """Add connections from Connections.csv rows. Returns the new connections."""
+        people = []
+        for row in rows:
+            first_name = (row.get('First Name') or '').strip()
+            last_name = (row.get('Last Name') or '').strip()
+
+            if not first_name:
+                continue
+
+            people.append((
+                first_name,
+                last_name,
+                (row.get('Email Address') or '').strip() or None,
+                (row.get('Company') or '').strip() or None,
+                (row.get('Position') or '').strip() or None,
+                self._parse_date(row.get('Connected On') or '', 'Connected On'),
+            ))
+
+        # Stable IDs: previous identities are kept, duplicate names get -2, -3, ...
+        ids = self.identities.assign([person[:4] for person in people])
+
+        added = []
+        for conn_id, (first_name, last_name, email, company, position, connected) in zip(ids, people):
+            conn = self.connections[conn_id] = Connection(
+                id=conn_id,
+                name=f"{first_name} {last_name}",
+                first_name=first_name,
+                last_name=last_name,
+                email=email,
+                company=company,
+                position=position,
+                connected_date=connected,
+            )
+            added.append(conn)
+        return added
+
+    def _messages_path(self) -> Optional[Path]:
+        for name in ("Messages.csv", "messages.csv"):  # Try alternate name
+            csv_path = self.export_path / name
+            if csv_path.exists():
+                return csv_path
+        return None
+
     def parse_messages(self) -> int:
         """Parse Messages.csv and calculate relationship strength."""
-        csv_path = self.export_path / "Messages.csv"
-        if not csv_path.exists():
-            # Try alternate name
-            csv_path = self.export_path / "messages.csv"
-            if not csv_path.exists():
-                print("Warning: Messages.csv not found - relationship strength will default to 'cold'")
-                return 0
-
-        count = 0
-        with open(csv_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # LinkedIn message format varies, try common column names
-                sender = row.get('From', row.get('SENDER', row.get('Sender', ''))).strip()
-                date = row.get('Date', row.get('DATE', row.get('Sent Date', ''))).strip()
+        csv_path = self._messages_path()
+        if csv_path is None:
+            print("Warning: Messages.csv not found - relationship strength will default to 'cold'")
+            return 0
 
-                if sender:
-                    self.messages[sender].append({
-                        'date': self._parse_date(date),
-                        'sender': sender,
-                    })
-                    count += 1
+        started = time.perf_counter()
+        sender_col, date_col = _message_columns(_csv_header(csv_path)[0])
+        self._dates.pin(MESSAGE_DATE_COLUMN, _message_date_format(csv_path, date_col))
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            count = _accumulate_messages(reader, sender_col, date_col, self.message_stats, self._dates)
+        elapsed = time.perf_counter() - started
 
-        # Calculate relationship strength
-        now = datetime.now()
-        six_months_ago = now - timedelta(days=180)
+        self._record_messages_watermark(csv_path, count)
+        self._apply_message_stats()
 
-        for conn_id, conn in self.connections.items():
-            name = conn.name
-            msgs = self.messages.get(name, [])
-
-            if not msgs:
-                # Also check first name only (messages sometimes use first name)
-                msgs = self.messages.get(conn.first_name, [])
-
-            conn.message_count = len(msgs)
-
-            if msgs:
-                # Find most recent message
-                dates = [m['date'] for m in msgs if m['date']]
-                if dates:
-                    conn.last_message = max(dates)
-
-                # Calculate relationship strength
-                if len(msgs) >= 10:
-                    conn.relationship_strength = "close"
-                elif len(msgs) >= 3:
-                    conn.relationship_strength = "warm"
-                else:
-                    conn.relationship_strength = "cold"
-
-        print(f"Parsed {count} messages from Messages.csv")
+        rate = f" ({count / elapsed:,.0f} rows/sec)" if elapsed > 0 else ""
+        print(f"Parsed {count} messages from Messages.csv{rate}")
         return count
 
+    def _record_messages_watermark(self, csv_path: Path, rows: int):
+        watermark = _watermark(csv_path, rows)
+        watermark["last_message"] = max((last for _, _, last in self.message_stats.items() if last), default=None)
+        self.watermarks[csv_path.name] = watermark
+
+    def _apply_message_stats(self):
+        """
+        Calculate relationship strength from the message aggregate.
+
+        Each distinct sender is resolved to connections through the identity
+        index; a connection's messages under its full name and (when
+        unambiguous) its first name are added up.
+        """
+        totals: dict[str, list] = {}
+        for sender, count, last in self.message_stats.items():
+            for conn_id in self.identities.resolve(sender):
+                total = totals.get(conn_id)
+                if total is None:
+                    totals[conn_id] = [count, last]
+                    continue
+                total[0] += count
+                if last and (total[1] is None or last > total[1]):
+                    total[1] = last
+
+        for conn in self.connections.values():
+            msg_count, last_message = totals.get(conn.id, (0, None))
+            conn.message_count = msg_count
+            conn.last_message = last_message
+
+            # Calculate relationship strength
+            if msg_count >= 10:
+                conn.relationship_strength = "close"
+            elif msg_count >= 3:
+                conn.relationship_strength = "warm"
+            else:
+                conn.relationship_strength = "cold"
+
     def parse_positions(self) -> int:
         """Parse Positions.csv for work history."""
         csv_path = self.export_path / "Positions.csv"
@@ -266,8 +630,8 @@ class LinkedInParser:
                 self.roles.append(Role(
                     company=company,
                     title=title,
-                    start_date=self._parse_date(row.get('Started On', '')),
-                    end_date=self._parse_date(row.get('Finished On', '')),
+                    start_date=self._parse_date(row.get('Started On', ''), 'Started On'),
+                    end_date=self._parse_date(row.get('Finished On', ''), 'Finished On'),
                 ))
                 count += 1
 
@@ -291,20 +655,190 @@ class LinkedInParser:
         print(f"Parsed {len(self.skills)} skills from Skills.csv")
         return len(self.skills)
 
-    def parse_all(self):
-        """Parse all available LinkedIn export files."""
+    def parse_all(self, parallel: bool = False, workers: Optional[int] = None):
+        """
+        Parse all available LinkedIn export files.
+
+        With parallel=True, Messages.csv is split into record-aligned chunks
+        aggregated by a process pool while the other files are parsed in
+        this process; partial aggregates are merged and then joined against
+        connections.
+        """
         print(f"\nParsing LinkedIn export from: {self.export_path}\n")
 
-        self.parse_connections()
-        self.parse_messages()
+        if parallel:
+            self._parse_all_parallel(workers)
+        else:
+            self.parse_connections()
+            self.parse_messages()
+            self.parse_positions()
+            self.parse_skills()
+
+        print(f"\nTotal: {len(self.connections)} connections, {len(self.roles)} roles, {len(self.skills)} skills")
+
+    def _parse_all_parallel(self, workers: Optional[int] = None):
+        csv_path = self._messages_path()
+        if csv_path is None:
+            # Nothing for a process pool to do
+            self.parse_connections()
+            self.parse_messages()  # Warns that Messages.csv is missing
+            self.parse_positions()
+            self.parse_skills()
+            return
+        workers = workers or os.cpu_count() or 1
+
+        started = time.perf_counter()
+        header, data_start = _csv_header(csv_path)
+        sender_col, date_col = _message_columns(header)
+        date_format = _message_date_format(csv_path, date_col)
+        chunk_bytes = max(self.MIN_CHUNK_BYTES, csv_path.stat().st_size // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_aggregate_message_chunk, str(csv_path), start, end, sender_col, date_col, date_format)
+                for start, end in _csv_chunks(csv_path, data_start, chunk_bytes)
+            ]
+
+            # Independent files are parsed here while the pool works on messages
+            self.parse_connections()
+            self.parse_positions()
+            self.parse_skills()
+
+            count = 0
+            for future in futures:
+                rows, items = future.result()
+                count += rows
+                self.message_stats.merge(items)
+        elapsed = time.perf_counter() - started
+
+        self._record_messages_watermark(csv_path, count)
+        self._apply_message_stats()
+        print(f"Parsed {count} messages from Messages.csv in {len(futures)} chunks "
+              f"({count / elapsed:,.0f} rows/sec across {workers} workers)")
+
+    # === INCREMENTAL IMPORT ===
+
+    def parse_incremental(self, state_path: Path, parallel: bool = False, workers: Optional[int] = None) -> bool:
+        """
+        Fold in only what changed since the import saved at state_path.
+
+        Connections.csv and Messages.csv are checked against their
+        watermarks: an unchanged file is skipped, rows appended since the
+        last import are parsed on their own and folded into the saved
+        connections and message aggregate, and a rewritten file is parsed
+        in full. If either file changed, message counts, last_message and
+        strength are then recomputed for every connection from the
+        aggregate: a new connection can make a first-name sender ambiguous,
+        so one new row may change connections no new message names.
+        Positions and skills are small and always reparsed.
+
+        Falls back to parse_all() when there is no usable saved state.
+        Returns True if the saved state was used.
+        """
+        state = _read_import_state(Path(state_path))
+        if state is None:
+            print("No previous import state found - running a full import")
+            self.parse_all(parallel=parallel, workers=workers)
+            return False
+
+        print(f"\nIncremental import from: {self.export_path}\n")
+        self.incremental = True
+        self.identities.remember(state["connections"])
+        self.message_stats.merge(state["message_stats"])
+
+        connections_changed = self._fold_connections(state["watermarks"], state["connections"])
+        messages_changed = self._fold_messages(state["watermarks"])
+        if connections_changed or messages_changed:
+            self._apply_message_stats()
+
         self.parse_positions()
         self.parse_skills()
 
         print(f"\nTotal: {len(self.connections)} connections, {len(self.roles)} roles, {len(self.skills)} skills")
+        return True
 
-    def compute_stats(self) -> dict:
+    def _fold_connections(self, watermarks: dict, records: list[dict]) -> bool:
+        """Restore saved connections and add those appended since. Returns True if any changed."""
+        csv_path = self.export_path / "Connections.csv"
+        offset = _appended_from(csv_path, watermarks.get(csv_path.name)) if csv_path.exists() else None
+
+        if offset is None:
+            # Rewritten: reparse, matching rows to the remembered identities
+            self.parse_connections()
+            return True
+
+        for record in records:
+            conn = self.connections[record["id"]] = Connection(**record)
+            self.identities.add(conn.id, conn.name, conn.first_name)
+
+        previous = watermarks[csv_path.name]
+        if offset == csv_path.stat().st_size:
+            self.watermarks[csv_path.name] = previous
+            print("Connections.csv unchanged")
+            return False
+
+        header, _ = _csv_header(csv_path)
+        with open(csv_path, 'rb') as f:
+            f.seek(offset)
+            text = f.read().decode('utf-8')
+        added = self._add_connections(csv.DictReader(io.StringIO(text, newline=''), fieldnames=header))
+        self.watermarks[csv_path.name] = _watermark(csv_path, previous["rows"] + len(added))
+
+        print(f"Added {len(added)} new connections from Connections.csv")
+        return bool(added)
+
+    def _fold_messages(self, watermarks: dict[str, Any]) -> bool:
+        """Aggregate messages appended since the last import. Returns True if any changed."""
+        csv_path = self._messages_path()
+        offset = _appended_from(csv_path, watermarks.get(csv_path.name)) if csv_path else None
+
+        if csv_path is None or offset is None:
+            self.message_stats = MessageStats()
+            self.parse_messages()
+            return True
+
+        previous = watermarks[csv_path.name]
+        if offset == csv_path.stat().st_size:
+            self.watermarks[csv_path.name] = previous
+            print("Messages.csv unchanged")
+            return False
+
+        # The file starts with the rows the format was settled from before
+        sender_col, date_col = _message_columns(_csv_header(csv_path)[0])
+        count, items = _aggregate_message_chunk(
+            str(csv_path), offset, csv_path.stat().st_size, sender_col, date_col,
+            _message_date_format(csv_path, date_col))
+        self.message_stats.merge(items)
+        self._record_messages_watermark(csv_path, previous["rows"] + count)
+
+        print(f"Folded in {count} new messages from Messages.csv")
+        return count > 0
+
+    def remember_previous_import(self, state_path: Path) -> bool:
+        """Keep connection IDs stable against the import saved at state_path."""
+        state = _read_import_state(Path(state_path))
+        if state is None:
+            return False
+        self.identities.remember(state["connections"])
+        return True
+
+    def save_import_state(self, state_path: Path) -> None:
+        """Save watermarks, connections and the message aggregate for the next incremental import."""
+        state_path = Path(state_path)
+        state = {
+            "version": IMPORT_STATE_VERSION,
+            "watermarks": self.watermarks,
+            "connections": [asdict(conn) for conn in self.connections.values()],
+            "message_stats": list(self.message_stats.items()),
+        }
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = state_path.with_name(f"{state_path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, state_path)
+
+    def compute_stats(self) -> dict[str, Any]:
         """Compute network statistics."""
-        stats = {
+        stats: dict[str, Any] = {
             "total": len(self.connections),
             "by_relationship": {
                 "cold": 0,
@@ -335,19 +869,27 @@ class LinkedInParser:
         """Export connections to network.yaml."""
         output = Path(output_path)
 
+        document = RecordDocument(output, "connections", key=lambda c: c['id'])
+
         # Load existing to preserve manual enrichments
         existing = {}
-        if preserve_manual and output.exists():
-            with open(output, 'r') as f:
-                data = yaml.safe_load(f)
-                if data and data.get('connections'):
-                    for conn in data['connections']:
-                        existing[conn['id']] = conn
+        import_log = []
+        if preserve_manual:
+            existing = document.existing_records()
+            import_log = document.existing().get('import_log') or []
 
         # Merge: new data overwrites LinkedIn fields, preserves manual fields
         connections = []
+        sources = {}
         for conn_id, conn in self.connections.items():
             conn_dict = conn.to_dict()
+            sources[conn_id] = source = record_hash(conn_dict)
+
+            # Unchanged since the last export: reuse the merged record
+            merged = document.reuse(conn_id, source) if preserve_manual else None
+            if merged is not None:
+                connections.append(merged)
+                continue
 
             if conn_id in existing:
                 # Preserve manual enrichments
@@ -374,18 +916,22 @@ class LinkedInParser:
             "connections": connections,
             "stats": stats,
             "network_gaps": [],
-            "import_log": [
+            # Volatile: logged only if the import changed anything else (see
+            # RecordDocument). Watermarks live in the import state, not here.
+            "import_log": (import_log + [
                 {
                     "date": datetime.now().strftime("%Y-%m-%d"),
                     "source": "linkedin_export",
+                    "mode": "incremental" if self.incremental else "full",
                     "connections_added": len(connections) - len(existing),
                     "connections_updated": len(existing),
                 }
-            ],
+            ])[-IMPORT_LOG_LIMIT:],
         }
 
-        with open(output, 'w') as f:
-            yaml.dump(network_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        if not document.write(network_data, sources):
+            print(f"\n{output} unchanged ({len(connections)} connections), import not logged")
+            return
 
         print(f"\nExported {len(connections)} connections to {output}")
 
@@ -393,23 +939,32 @@ class LinkedInParser:
         """Export positions and skills to experience.yaml."""
         output = Path(output_path)
 
+        document = RecordDocument(
+            output, "roles",
+            key=lambda r: f"{r.get('company')}|{r.get('title')}",
+            volatile=("created", "last_updated", "meta"),
+        )
+
         # Load existing to preserve manual enrichments
         existing_roles = {}
         existing_skills = {}
-        if preserve_manual and output.exists():
-            with open(output, 'r') as f:
-                data = yaml.safe_load(f)
-                if data:
-                    for role in data.get('roles', []):
-                        key = f"{role.get('company')}|{role.get('title')}"
-                        existing_roles[key] = role
-                    existing_skills = data.get('skills', {})
+        if preserve_manual:
+            existing_roles = document.existing_records()
+            existing_skills = document.existing().get('skills') or {}
 
         # Merge roles
         roles = []
+        sources = {}
         for role in self.roles:
             role_dict = role.to_dict()
             key = f"{role.company}|{role.title}"
+            sources[key] = source = record_hash(role_dict)
+
+            # Unchanged since the last export: reuse the merged record
+            merged = document.reuse(key, source) if preserve_manual else None
+            if merged is not None:
+                roles.append(merged)
+                continue
 
             if key in existing_roles:
                 old = existing_roles[key]
@@ -449,16 +1004,20 @@ class LinkedInParser:
             },
         }
 
-        with open(output, 'w') as f:
-            yaml.dump(experience_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        if not document.write(experience_data, sources):
+            print(f"{output} unchanged ({len(roles)} roles, {len(self.skills)} skills)")
+            return
 
         print(f"Exported {len(roles)} roles and {len(self.skills)} skills to {output}")
 
 
 def main():
     """CLI entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: python -m context._brain.human.ingest.linkedin <path-to-linkedin-export>")
+    flags = {arg for arg in sys.argv[1:] if arg.startswith('--')}
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+
+    if not args:
+        print("Usage: python -m context._brain.human.ingest.linkedin <path-to-linkedin-export> [--parallel] [--incremental]")
         print("\nTo get your LinkedIn export:")
         print("1. Go to LinkedIn -> Settings & Privacy")
         print("2. Click 'Data privacy' in left sidebar")
@@ -467,7 +1026,7 @@ def main():
         print("5. Wait for email, download, and extract the ZIP")
         sys.exit(1)
 
-    export_path = sys.argv[1]
+    export_path = args[0]
 
     if not os.path.isdir(export_path):
         print(f"Error: {export_path} is not a directory")
@@ -477,12 +1036,18 @@ def main():
     script_dir = Path(__file__).parent.parent
     network_output = script_dir / "network.yaml"
     experience_output = script_dir / "experience.yaml"
+    state_path = import_state_path(network_output)
 
     # Parse and export
     parser = LinkedInParser(export_path)
-    parser.parse_all()
+    if '--incremental' in flags:
+        parser.parse_incremental(state_path, parallel='--parallel' in flags)
+    else:
+        parser.remember_previous_import(state_path)
+        parser.parse_all(parallel='--parallel' in flags)
     parser.export_network(network_output)
     parser.export_experience(experience_output)
+    parser.save_import_state(state_path)
 
     print("\n--- Summary ---")
     stats = parser.compute_stats()
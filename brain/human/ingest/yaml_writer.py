@@ -0,0 +1,216 @@
+"""
+YAML Writer
+Fast, diff-aware writes of the human layer's record files.
+
+network.yaml and experience.yaml are a few top-level fields plus one long
+list of records. RecordDocument keeps a sidecar cache next to the file
+(.cache/<file>.records.pickle) holding, per record, a hash of the imported
+source data, the merged record and its emitted YAML. On the next export:
+
+    - if the file on disk is exactly what was last written, existing
+      records come from the cache instead of re-parsing the file, and a
+      record whose source hash is unchanged is reused as-is - no merge,
+      no emit;
+    - otherwise (first run, or the file was edited by hand) the file is
+      parsed and every record is merged again;
+    - the document is written to a temp file and renamed into place, and
+      skipped entirely when nothing but the volatile fields (dates, import
+      log) would change. A skipped write keeps the old volatile values, so
+      an import that changes nothing leaves no import_log entry.
+
+The libyaml loader and emitter are used when PyYAML was built with them.
+
+Usage:
+    doc = RecordDocument(path, "connections", key=lambda c: c["id"])
+    existing = doc.existing_records()
+    record = doc.reuse(conn_id, source_hash) or merge(...)
+    doc.write(document, sources)
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as _BaseDumper
+    from yaml import CSafeLoader as Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _BaseDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as Loader  # type: ignore[assignment]
+
+CACHE_VERSION = 1
+
+# Per record in the cache: (source hash, merged record, emitted YAML)
+CacheEntry = tuple[Optional[str], dict[str, Any], str]
+
+
+class Dumper(_BaseDumper):
+    """Never emits anchors, so records can be emitted one at a time."""
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+def dump_yaml(data: Any) -> str:
+    text: str = yaml.dump(data, Dumper=Dumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    return text
+
+
+def record_hash(record: Any) -> str:
+    """Content hash of a plain record (dicts keep insertion order, so repr is stable)."""
+    return hashlib.sha1(repr(record).encode()).hexdigest()
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file in the same directory and rename into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # mkstemp creates the file 0600: keep the mode of the file being replaced
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o644
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        os.chmod(tmp, mode)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class RecordDocument:
+    """A YAML file with one list of keyed records, written incrementally."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        records_key: str,
+        key: Callable[[dict[str, Any]], Any],
+        volatile: tuple[str, ...] = ("created", "last_updated", "import_log"),
+    ):
+        self.path = Path(path)
+        self.records_key = records_key
+        self.key = key
+        self.volatile = volatile
+        self.cache_path = self.path.parent / ".cache" / f"{self.path.name}.records.pickle"
+
+        # The cache's view of the file, used only while the file on disk is
+        # the one the cache describes (_fresh)
+        self._fresh = False
+        self._fields: dict[str, Any] = {}
+        self._records: dict[Any, CacheEntry] = {}
+        self._content_sha256: Optional[str] = None
+        cache = self._read_cache()
+        if (
+            cache is not None
+            and self.path.exists()
+            and hashlib.sha256(self.path.read_bytes()).hexdigest() == cache["file_sha256"]
+        ):
+            self._use_cache(cache)
+        self._document: Optional[dict[str, Any]] = None
+
+    def _use_cache(self, cache: dict[str, Any]) -> None:
+        self._fresh = True
+        self._fields = cache["fields"]
+        self._records = cache["records"]
+        self._content_sha256 = cache["content_sha256"]
+
+    def _read_cache(self) -> Optional[dict[str, Any]]:
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+            return None
+        return cache
+
+    # === READING ===
+
+    def existing(self) -> dict[str, Any]:
+        """The current document (empty if there is no file)."""
+        if self._document is None:
+            if self._fresh:
+                records = [entry[1] for entry in self._records.values()]
+                self._document = {**self._fields, self.records_key: records}
+            elif self.path.exists():
+                with open(self.path, 'r') as f:
+                    self._document = yaml.load(f, Loader=Loader) or {}
+            else:
+                self._document = {}
+        return self._document
+
+    def existing_records(self) -> dict[Any, dict[str, Any]]:
+        """Existing records by key (the last one wins on duplicate keys)."""
+        return {self.key(record): record for record in self.existing().get(self.records_key) or []}
+
+    def reuse(self, key: Any, source_hash: str) -> Optional[dict[str, Any]]:
+        """The previously written record for key if its source is unchanged."""
+        if not self._fresh:
+            return None
+        entry = self._records.get(key)
+        if entry is None or entry[0] != source_hash:
+            return None
+        return entry[1]
+
+    # === WRITING ===
+
+    def write(self, document: dict[str, Any], sources: Optional[dict[Any, str]] = None) -> bool:
+        """
+        Write document, reusing the emitted YAML of unchanged records.
+
+        sources maps record keys to the source hashes passed to reuse() on
+        the next run. Returns False if the write was skipped because only
+        volatile fields changed.
+        """
+        sources = sources or {}
+        cached = self._records if self._fresh else {}
+
+        entries: dict[Any, CacheEntry] = {}
+        record_texts = []
+        for record in document.get(self.records_key) or []:
+            key = self.key(record)
+            entry = cached.get(key)
+            if entry is not None and entry[1] is record:
+                text = entry[2]
+            else:
+                text = dump_yaml([record])
+            record_texts.append(text)
+            entries[key] = (sources.get(key), record, text)
+
+        parts = []
+        content = hashlib.sha256()
+        for name, value in document.items():
+            if name == self.records_key:
+                text = f"{name}:\n{''.join(record_texts)}" if record_texts else dump_yaml({name: []})
+            else:
+                text = dump_yaml({name: value})
+            parts.append(text)
+            if name not in self.volatile:
+                content.update(text.encode())
+
+        content_sha = content.hexdigest()
+        if self._fresh and content_sha == self._content_sha256:
+            return False
+
+        data = "".join(parts).encode()
+        write_atomic(self.path, data)
+
+        cache = {
+            "version": CACHE_VERSION,
+            "file_sha256": hashlib.sha256(data).hexdigest(),
+            "content_sha256": content_sha,
+            "fields": {name: value for name, value in document.items() if name != self.records_key},
+            "records": entries,
+        }
+        self._use_cache(cache)
+        self._document = None
+        try:
+            write_atomic(self.cache_path, pickle.dumps(cache, protocol=pickle.HIGHEST_PROTOCOL))
+        except OSError:
+            pass  # The cache only speeds up the next export
+        return True
@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The human layer is run from its own directory (see benchmarks/), with
+# the brain SDK on the path
+HUMAN_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(HUMAN_ROOT.parent / "sdk" / "python"))
+sys.path.insert(0, str(HUMAN_ROOT))
+
+
+@pytest.fixture
+def network():
+    """A small network.yaml covering every field the analyses read, with gaps."""
+    return {"connections": [
+        {"id": "ada", "name": "Ada", "company": "Acme", "relationship_strength": "close",
+         "trust_level": "high", "energy": "energizing", "domains": ["ML", "fundraising"],
+         "positives": ["Very generous with time", "Generous intros"], "message_count": 40,
+         "last_message": "2020-03-01", "connected_date": "2015-01-01"},
+        {"id": "bob", "name": "Bob", "company": "Acme", "relationship_strength": "warm",
+         "trust_level": "low", "energy": "draining", "domains": ["ml", "sales"],
+         "negatives": ["Misses deadlines often", "Misses calls"], "message_count": 3,
+         "last_contact": "2024-01-10", "last_message": "2019-05-05"},
+        {"id": "cy", "name": "Cy", "relationship_strength": "cold", "domains": ["design"],
+         "message_count": 5, "last_message": "2099-01-01", "connected_date": "2016-06-01"},
+        {"id": "dee", "name": "Dee", "company": "Initech", "relationship_strength": "warm",
+         "trust_level": "medium", "energy": "neutral", "positives": ["Sharp thinker"],
+         "negatives": ["Blunt feedback"], "message_count": 0},
+        {"id": "eve", "name": "Eve", "company": "Initech", "relationship_strength": "acquaintance",
+         "trust_level": "high", "energy": "draining", "domains": ["Sales"],
+         "message_count": 2, "last_message": "2021-01-01"},
+        {"id": "fay", "name": "Fay", "trust_level": "low",
+         "negatives": ["Misses deadlines", "Vague deadlines"], "connected_date": "2023-02-02"},
+        {"id": "gus", "name": "Gus", "relationship_strength": "cold", "message_count": 1,
+         "last_message": "2022-02-02"},
+    ]}
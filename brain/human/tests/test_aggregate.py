@@ -0,0 +1,188 @@
+from collections import Counter, defaultdict
+
+from analysis.aggregate import aggregate_network, network_aggregate
+from analysis.context import AnalysisContext
+
+# The separate scans each analysis made before the fused pass, one per
+# counter, kept here as the reference the aggregate must reproduce.
+
+
+def _network_summary_stats(network):
+    by_relationship = {"close": 0, "warm": 0, "cold": 0}
+    by_domain = {}
+    trust_stats = {"high": 0, "medium": 0, "low": 0, "unknown": 0}
+    energy_stats = {"energizing": 0, "neutral": 0, "draining": 0}
+    with_positives = with_negatives = 0
+    for conn in network["connections"]:
+        strength = conn.get("relationship_strength", "cold")
+        by_relationship[strength] = by_relationship.get(strength, 0) + 1
+        for domain in conn.get("domains", []):
+            by_domain[domain] = by_domain.get(domain, 0) + 1
+        trust = conn.get("trust_level", "unknown")
+        trust_stats[trust] = trust_stats.get(trust, 0) + 1
+        energy = conn.get("energy", "neutral")
+        energy_stats[energy] = energy_stats.get(energy, 0) + 1
+        with_positives += bool(conn.get("positives"))
+        with_negatives += bool(conn.get("negatives"))
+    return by_relationship, by_domain, trust_stats, energy_stats, with_positives, with_negatives
+
+
+def _network_gaps_domains(network):
+    domain_counts = {}
+    for conn in network["connections"]:
+        for domain in conn.get("domains", []):
+            domain_counts[domain.lower()] = domain_counts.get(domain.lower(), 0) + 1
+    return domain_counts
+
+
+def _domain_clusters(network):
+    domain_by_strength = defaultdict(lambda: {"close": 0, "warm": 0, "cold": 0})
+    for conn in network["connections"]:
+        strength = conn.get("relationship_strength", "cold")
+        for domain in conn.get("domains", []):
+            domain_by_strength[domain][strength] = domain_by_strength[domain].get(strength, 0) + 1
+    return dict(domain_by_strength)
+
+
+def _trust_patterns(network):
+    by_company = defaultdict(lambda: {"high": 0, "low": 0, "total": 0})
+    by_strength = defaultdict(lambda: {"high": 0, "low": 0, "total": 0})
+    low_trust_words = Counter()
+    for conn in network["connections"]:
+        trust = conn.get("trust_level")
+        company = conn.get("company", "Unknown")
+        strength = conn.get("relationship_strength", "cold")
+        if trust == "high":
+            by_company[company]["high"] += 1
+        elif trust == "low":
+            by_company[company]["low"] += 1
+            for reason in conn.get("negatives", []):
+                low_trust_words.update(reason.lower().split())
+        by_company[company]["total"] += 1
+        by_strength[strength]["total"] += 1
+        if trust:
+            by_strength[strength][trust] = by_strength[strength].get(trust, 0) + 1
+    return dict(by_company), dict(by_strength), low_trust_words
+
+
+def _energy_patterns(network):
+    by_domain = defaultdict(lambda: {"energizing": 0, "draining": 0, "total": 0})
+    by_trust = defaultdict(lambda: {"energizing": 0, "draining": 0})
+    for conn in network["connections"]:
+        energy = conn.get("energy")
+        trust = conn.get("trust_level", "unknown")
+        for domain in conn.get("domains", []):
+            by_domain[domain]["total"] += 1
+            if energy:
+                by_domain[domain][energy] = by_domain[domain].get(energy, 0) + 1
+        if energy in ("energizing", "draining"):
+            by_trust[trust][energy] += 1
+    return dict(by_domain), dict(by_trust)
+
+
+def _positive_negative_insights(network):
+    only_positive = only_negative = balanced = 0
+    positive_words, negative_words = Counter(), Counter()
+    for conn in network["connections"]:
+        positives = conn.get("positives", [])
+        negatives = conn.get("negatives", [])
+        if positives and not negatives:
+            only_positive += 1
+        elif negatives and not positives:
+            only_negative += 1
+        elif positives and negatives:
+            balanced += 1
+        for p in positives:
+            positive_words.update(w.lower() for w in p.split() if len(w) > 3)
+        for n in negatives:
+            negative_words.update(w.lower() for w in n.split() if len(w) > 3)
+    return only_positive, only_negative, balanced, positive_words, negative_words
+
+
+def _communication_patterns(network):
+    contact_counts = Counter()
+    silent = []
+    for conn in network["connections"]:
+        if conn.get("message_count", 0) > 0:
+            contact_counts[conn.get("name", "")] += conn["message_count"]
+        if conn.get("message_count", 0) == 0:
+            silent.append(conn.get("name"))
+    return dict(contact_counts), silent
+
+
+def _blind_spots(network):
+    undocumented = []
+    unassessed = []
+    for conn in network["connections"]:
+        trust = conn.get("trust_level")
+        positives = conn.get("positives", [])
+        if trust == "high" and not positives:
+            undocumented.append(conn.get("name"))
+        connected = conn.get("connected_date")
+        if connected and not trust and not positives and not conn.get("negatives", []):
+            unassessed.append((conn.get("name"), connected))
+    return undocumented, unassessed
+
+
+def _date_candidates(network):
+    touch, cooling, warming = [], [], []
+    for conn in network["connections"]:
+        strength = conn.get("relationship_strength", "cold")
+        last_message = conn.get("last_message")
+        if strength in ("warm", "close"):
+            last_touch = conn.get("last_contact") or last_message
+            if last_touch:
+                touch.append((conn, strength, last_touch))
+            if last_message:
+                cooling.append((conn, strength, last_message))
+        if strength == "cold" and last_message and conn.get("message_count", 0) >= 2:
+            warming.append((conn, last_message))
+    return touch, cooling, warming
+
+
+def test_fused_pass_matches_the_per_analysis_scans(network):
+    agg = aggregate_network(network)
+
+    assert agg.total == len(network["connections"])
+    assert (
+        agg.by_strength, agg.domain_counts, agg.by_trust, agg.by_energy, agg.with_positives, agg.with_negatives,
+    ) == _network_summary_stats(network)
+    assert agg.domain_counts_lower == _network_gaps_domains(network)
+    assert agg.domain_by_strength == _domain_clusters(network)
+    assert (agg.company_trust, agg.trust_by_strength, agg.low_trust_negative_words) == _trust_patterns(network)
+    assert (agg.energy_by_domain, agg.energy_by_trust) == _energy_patterns(network)
+    assert (
+        agg.only_positive, agg.only_negative, agg.balanced, agg.positive_words, agg.negative_words,
+    ) == _positive_negative_insights(network)
+    assert (agg.message_counts_by_name, agg.silent) == _communication_patterns(network)
+    assert (agg.undocumented_trust, agg.unassessed) == _blind_spots(network)
+    assert (agg.touch_candidates, agg.cooling_candidates, agg.warming_candidates) == _date_candidates(network)
+
+
+def test_fixture_exercises_every_counter(network):
+    agg = aggregate_network(network)
+
+    # Guards the comparison above against passing on empty counters
+    assert agg.by_strength["acquaintance"] == 1
+    assert agg.domain_counts_lower["ml"] == 2 and agg.domain_counts_lower["sales"] == 2
+    assert agg.low_trust_negative_words["deadlines"] == 3
+    assert agg.only_positive and agg.only_negative and agg.balanced
+    assert agg.undocumented_trust == ["Eve"] and agg.unassessed == [("Cy", "2016-06-01")]
+    assert agg.silent == ["Dee", "Fay"]
+    assert [c[0]["id"] for c in agg.warming_candidates] == ["cy"]
+
+
+def test_empty_network_keeps_the_seeded_levels():
+    agg = aggregate_network({"connections": []})
+
+    assert agg.total == 0
+    assert agg.by_strength == {"close": 0, "warm": 0, "cold": 0}
+    assert agg.by_trust == {"high": 0, "medium": 0, "low": 0, "unknown": 0}
+    assert agg.by_energy == {"energizing": 0, "neutral": 0, "draining": 0}
+
+
+def test_aggregate_is_computed_once_per_context(network):
+    context = AnalysisContext(network=network, goals={}, interactions={"interactions": []})
+
+    assert network_aggregate(context=context) is network_aggregate(context=context)
+    assert network_aggregate(network) is not network_aggregate(network)
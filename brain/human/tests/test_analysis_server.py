@@ -0,0 +1,29 @@
+from analysis.server import with_context
+
+
+class FakeContext:
+    network = {"connections": ["from context"]}
+
+    @property
+    def goals(self):
+        raise AssertionError("goals were supplied by the caller")
+
+
+class FakeLive:
+    def get(self):
+        return FakeContext()
+
+
+def analysis(network, goals=None, limit=3):
+    return network, goals, limit
+
+
+def test_inputs_passed_positionally_are_not_replaced():
+    call = with_context(analysis, FakeLive())
+    assert call({"connections": []}, {"primary": "x"}) == ({"connections": []}, {"primary": "x"}, 3)
+    assert call({"connections": []}, goals={}, limit=1) == ({"connections": []}, {}, 1)
+
+
+def test_missing_inputs_come_from_the_context():
+    call = with_context(lambda network, limit=3: (network, limit), FakeLive())
+    assert call(limit=5) == ({"connections": ["from context"]}, 5)
@@ -0,0 +1,86 @@
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from analysis.aggregate import aggregate_network  # noqa: E402
+from analysis.columnar import ColumnarNetwork, columnar_view  # noqa: E402
+from analysis.context import AnalysisContext  # noqa: E402
+from analysis.network_intel import stale_relationships  # noqa: E402
+
+TODAY = date.today()
+
+
+def _ids(view, mask):
+    return view.ids[mask].tolist()
+
+
+def _before(days):
+    return (TODAY - timedelta(days=days)).isoformat()
+
+
+def test_stale_mask_matches_stale_relationships(network):
+    view = ColumnarNetwork.from_network(network)
+
+    expected = [i.connections[0] for i in stale_relationships(network)]
+
+    assert expected  # The fixture has stale connections
+    assert _ids(view, view.stale_mask(today=TODAY)) == expected
+
+
+def test_trajectory_masks_match_the_aggregate_candidates(network):
+    view = ColumnarNetwork.from_network(network)
+    agg = aggregate_network(network)
+    cutoff = _before(90)
+
+    cooling = [conn["id"] for conn, _, last in agg.cooling_candidates if last < cutoff]
+    warming = [conn["id"] for conn, last in agg.warming_candidates if last >= cutoff]
+
+    assert _ids(view, view.cooling_mask(today=TODAY)) == cooling == ["ada", "bob"]
+    assert _ids(view, view.warming_mask(today=TODAY)) == warming == ["cy"]
+
+
+def test_histograms_match_the_aggregate(network):
+    view = ColumnarNetwork.from_network(network)
+    agg = aggregate_network(network)
+
+    # Unrecognised strengths have no column code
+    assert view.strength_histogram() == {k: v for k, v in agg.by_strength.items() if k != "acquaintance"}
+    assert view.trust_histogram() == agg.by_trust
+    assert view.energy_histogram() == agg.by_energy
+    assert view.domain_histogram() == agg.domain_counts
+
+
+def test_domain_mask_matches_a_dict_scan(network):
+    view = ColumnarNetwork.from_network(network)
+
+    for domain in [*view.domain_vocab, "absent"]:
+        expected = [c["id"] for c in network["connections"] if domain in c.get("domains", [])]
+        assert _ids(view, view.domain_mask(domain)) == expected
+
+
+def test_missing_and_invalid_dates_are_nat():
+    view = ColumnarNetwork.from_network({"connections": [
+        {"id": "a", "relationship_strength": "warm", "last_message": "2020-02-30"},
+        {"id": "b", "relationship_strength": "close", "last_message": None},
+        {"id": "c", "relationship_strength": "warm", "last_message": "2020-02-28"},
+    ]})
+
+    assert np.isnat(view.last_message).tolist() == [True, True, False]
+    assert _ids(view, view.stale_mask(today=TODAY)) == ["c"]
+
+
+def test_empty_network():
+    view = ColumnarNetwork.from_network({"connections": []})
+
+    assert len(view) == 0
+    assert view.strength_histogram() == {"cold": 0, "warm": 0, "close": 0}
+    assert view.domain_histogram() == {}
+    assert not view.stale_mask(today=TODAY).any()
+
+
+def test_view_is_built_once_per_context(network):
+    context = AnalysisContext(network=network, goals={})
+
+    assert columnar_view(context=context) is columnar_view(context=context)
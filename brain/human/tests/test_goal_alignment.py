@@ -0,0 +1,37 @@
+from analysis.goal_alignment import goal_keywords, network_goal_fit
+
+NETWORK = {"connections": [
+    # Covers "a", "to", "the" and "1k" by accident, nothing the goal is about
+    {"id": "filler", "name": "Filler", "relationship_strength": "close", "trust_level": "high",
+     "domains": ["data", "theatre", "toronto", "1k runs"]},
+    {"id": "expert", "name": "Expert", "relationship_strength": "cold",
+     "domains": ["fundraising", "seed stage"]},
+]}
+
+
+def _fit(*goals):
+    return network_goal_fit({"stated": {"primary": goals[0], "secondary": list(goals[1:])}}, NETWORK)
+
+
+def test_keywords_drop_stopwords_short_and_symbol_words():
+    words = set("raise a seed round — to the 1k 2026 investors".split())
+    assert goal_keywords(words) == {"raise", "seed", "round", "investors"}
+    assert goal_keywords({"to", "a"}) == {"to", "a"}  # Nothing better to rank by
+
+
+def test_people_are_ranked_by_goal_keywords():
+    [insight] = _fit("Get to a seed round with the 1k fundraising list")
+    assert insight.type == "aligned"
+    assert insight.people == ["expert"]
+
+
+def test_a_stopword_hit_alone_is_a_gap():
+    [insight] = _fit("Move to Berlin")  # "to" only occurs in "toronto"
+    assert insight.type == "gap"
+    assert insight.people == []
+
+
+def test_a_goal_of_only_stopwords_matches_on_them():
+    [insight] = _fit("to the")
+    assert insight.type == "aligned"
+    assert insight.people == ["filler"]
@@ -0,0 +1,67 @@
+import random
+
+from ingest.identity import IdentityIndex, make_id, normalize_name
+
+PEOPLE = [
+    ("Jane", "Doe", "jane@acme.com", "Acme"),
+    ("John", "Smith", None, "Initech"),
+    ("John", "Smith", None, "Globex"),
+    ("José", "Núñez", None, None),
+    ("Ada", "Lovelace", "ada@engine.org", None),
+]
+
+
+def _records(people, ids):
+    return [
+        {"id": conn_id, "name": f"{first} {last}", "email": email, "company": company}
+        for (first, last, email, company), conn_id in zip(people, ids)
+    ]
+
+
+def test_new_people_get_suffixed_ids():
+    ids = IdentityIndex().assign(PEOPLE + [("John", "Smith", None, None)])
+    assert ids == [
+        "conn.jane-doe", "conn.john-smith", "conn.john-smith-2",
+        "conn.jos-nez", "conn.ada-lovelace", "conn.john-smith-3",
+    ]
+    assert make_id("Mary-Ann", "O'Neil") == "conn.maryann-oneil"
+    assert normalize_name("  José  NÚÑEZ ") == "jose nunez"
+
+
+def test_ids_are_stable_across_reimports():
+    first = IdentityIndex().assign(PEOPLE)
+    expected = dict(zip(PEOPLE, first))
+
+    for seed in range(5):
+        people = PEOPLE + [("John", "Smith", None, "Hooli")]
+        random.Random(seed).shuffle(people)
+        index = IdentityIndex()
+        index.remember(_records(PEOPLE, first))
+        ids = index.assign(people)
+        assert {person: conn_id for person, conn_id in zip(people, ids) if person in expected} == expected
+        assert ids[people.index(("John", "Smith", None, "Hooli"))] == "conn.john-smith-3"
+
+
+def test_strong_keys_are_claimed_before_names():
+    index = IdentityIndex()
+    index.remember([{"id": "conn.jane-doe", "name": "Jane Doe", "email": "jane@acme.com"}])
+    # A new namesake earlier in the file must not take the known Jane's id
+    ids = index.assign([("Jane", "Doe", None, None), ("Jane", "Doe", "JANE@acme.com ", None)])
+    assert ids == ["conn.jane-doe-2", "conn.jane-doe"]
+
+
+def test_a_changed_email_falls_back_to_the_name():
+    index = IdentityIndex()
+    index.remember([{"id": "conn.ada-lovelace", "name": "Ada Lovelace", "email": "old@engine.org"}])
+    assert index.assign([("Ada", "Lovelace", "new@engine.org", None)]) == ["conn.ada-lovelace"]
+
+
+def test_resolve_senders():
+    index = IdentityIndex()
+    ids = index.assign(PEOPLE)
+    assert index.resolve("JANE doe") == [ids[0]]
+    assert index.resolve("jose nunez") == [ids[3]]
+    assert index.resolve("John Smith") == [ids[1], ids[2]]  # every namesake
+    assert index.resolve("Ada") == [ids[4]]  # unique first name
+    assert index.resolve("John") == []  # ambiguous first name
+    assert index.resolve("Nobody") == []
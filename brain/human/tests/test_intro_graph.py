@@ -0,0 +1,61 @@
+import pytest
+
+from analysis.intro_graph import IntroGraph
+
+NETWORK = {"connections": [
+    {"id": "a", "name": "Ann", "relationship_strength": "close", "trust_level": "high", "company": "Acme"},
+    {"id": "b", "name": "Bo", "relationship_strength": "cold", "trust_level": "low", "domains": ["Fundraising"]},
+    {"id": "c", "name": "Cy", "company": "acme", "domains": ["fundraising"]},
+    {"id": "d", "name": "Di", "relationship_strength": "warm", "trust_level": "medium",
+     "introduces_to": ["VC investors", "Ann"]},
+    {"name": "No Id", "relationship_strength": "close", "trust_level": "high", "domains": ["fundraising"]},
+]}
+
+
+@pytest.fixture
+def graph():
+    return IntroGraph(NETWORK)
+
+
+def _routes(paths):
+    return [(path.people, path.links, path.cost) for path in paths]
+
+
+def test_routes_are_ranked_by_cost(graph):
+    assert _routes(graph.best_paths("fundraising", k=5, max_hops=3)) == [
+        (["a", "c"], ["company:Acme"], 2.5),  # a close friend at Cy's company beats asking Cy
+        (["d", "a", "c"], ["introduces_to", "company:Acme"], 5.31),
+        (["c"], [], 8.0),
+        (["b"], [], 16.0),
+    ]
+    assert _routes(graph.best_paths("fundraising", k=1)) == [(["a", "c"], ["company:Acme"], 2.5)]
+    assert graph.best_paths("fundraising", k=0) == []
+    assert graph.best_paths("underwater welding") == []
+
+
+def test_max_hops_counts_every_person(graph):
+    assert [path.people for path in graph.best_paths("fundraising", k=5, max_hops=1)] == [["c"], ["b"]]
+    paths = graph.best_paths("fundraising", k=5, max_hops=2)
+    assert [path.people for path in paths] == [["a", "c"], ["c"], ["b"]]
+    assert max(path.hops for path in paths) == 2
+    assert graph.best_paths("fundraising", max_hops=0) == []
+
+
+def test_a_route_out_of_the_network_counts_its_last_step(graph):
+    assert graph.best_paths("vc investors", max_hops=1) == []
+    [path] = graph.best_paths("vc investors", max_hops=2)
+    assert (path.people, path.target, path.hops) == (["d"], "vc investors", 2)
+    assert path.links == ["introduces_to:vc investors"]
+
+
+def test_connections_without_an_id_are_left_out(graph):
+    assert len(graph) == 4
+    assert all("No Id" not in path.people for path in graph.best_paths("fundraising", k=10, max_hops=3))
+
+
+def test_between_finds_the_fewest_hops(graph):
+    assert graph.between("d", "c") == ["d", "a", "c"]
+    assert graph.between("b", "c") == ["b", "c"]  # shared domain, any spelling
+    assert graph.between("c", "d") is None  # introductions only go one way
+    assert graph.between("a", "a") == ["a"]
+    assert graph.between("a", "missing") is None
@@ -0,0 +1,259 @@
+import contextlib
+import csv
+import io
+import random
+from datetime import datetime
+
+import pytest
+import yaml
+
+from benchmarks.synthetic import write_export
+from ingest.linkedin import (
+    IMPORT_LOG_LIMIT,
+    DateParser,
+    LinkedInParser,
+    MessageStats,
+    _appended_from,
+    _watermark,
+)
+
+
+def _parse(export, parallel=False):
+    parser = LinkedInParser(str(export))
+    parser.MIN_CHUNK_BYTES = 256  # many chunks even for a small file
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser.parse_all(parallel=parallel, workers=2)
+    return parser
+
+
+def _results(parser):
+    return {
+        conn.id: (conn.message_count, conn.last_message, conn.relationship_strength)
+        for conn in parser.connections.values()
+    }
+
+
+@pytest.fixture
+def export(tmp_path):
+    write_export(tmp_path, connections=40, messages=0)
+    with open(tmp_path / "Connections.csv", newline="") as f:
+        names = [f"{row['First Name']} {row['Last Name']}" for row in csv.DictReader(f)]
+
+    rng = random.Random(1)
+    with open(tmp_path / "Messages.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["From", "To", "Date", "Subject", "Content"])
+        # Day-first, settled by the first row; later ambiguous dates must follow it
+        writer.writerow([names[0], "Me", "25/03/2023", "", "hi"])
+        for _ in range(400):
+            day, month = rng.randint(1, 12), rng.randint(1, 12)
+            body = "line one\nline two, \"quoted\"" if rng.random() < 0.2 else "hello"
+            writer.writerow([rng.choice(names), "Me", f"{day:02d}/{month:02d}/2023", "", body])
+    return tmp_path
+
+
+def test_message_stats_keep_count_and_latest_date():
+    stats = MessageStats()
+    stats.add("ada", "2023-05-01")
+    stats.add("ada", None)
+    stats.add("ada", "2023-04-01", count=3)
+    stats.add("bo", None)
+    assert len(stats) == 2 and "ada" in stats and "cy" not in stats
+    assert stats.get("ada") == (5, "2023-05-01")
+    assert stats.get("bo") == (1, None)
+    assert stats.get("cy") == (0, None)
+
+    stats.add("bo", "2022-01-01")
+    assert stats.get("bo") == (2, "2022-01-01")
+
+
+def test_merged_partial_stats_match_one_pass():
+    rng = random.Random(3)
+    rows = [
+        (rng.choice("abcdefg"), rng.choice([None, f"2023-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}"]))
+        for _ in range(500)
+    ]
+    whole = MessageStats()
+    for sender, date in rows:
+        whole.add(sender, date)
+
+    merged = MessageStats()
+    for start in range(0, len(rows), 70):
+        part = MessageStats()
+        for sender, date in rows[start:start + 70]:
+            part.add(sender, date)
+        merged.merge(part.items())
+    assert sorted(merged.items()) == sorted(whole.items())
+
+    copy = MessageStats()
+    copy.merge(whole.items())
+    assert list(copy.items()) == list(whole.items())
+
+
+def test_chunked_messages_match_serial(export):
+    serial = _parse(export)
+    chunked = _parse(export, parallel=True)
+    assert _results(chunked) == _results(serial)
+    assert sorted(chunked.message_stats.items()) == sorted(serial.message_stats.items())
+
+
+def test_ambiguous_dates_follow_settled_format(export):
+    results = _results(_parse(export, parallel=True))
+    assert all(last is None or last.startswith("2023-") for _, last, _ in results.values())
+
+    dates = DateParser()
+    dates.pin("Date", DateParser.detect_format(["2023-01-02", "25/03/2023", "03/04/2023"]))
+    assert dates.parse("03/04/2023", "Date") == "2023-04-03"
+
+
+@pytest.mark.parametrize("text, fmt", [
+    ("2023-01-15", "%Y-%m-%d"),
+    ("2023-1-5", "%Y-%m-%d"),
+    ("2024-02-29", "%Y-%m-%d"),
+    ("15 Jan 2023", "%d %b %Y"),
+    ("5 sep 2023", "%d %b %Y"),
+    ("29 FEB 2024", "%d %b %Y"),
+])
+def test_fast_paths_match_strptime(text, fmt):
+    assert DateParser().parse(text) == datetime.strptime(text, fmt).strftime("%Y-%m-%d")
+
+
+@pytest.mark.parametrize("text", [
+    "2023-02-30", "2023-13-01", "30 Feb 2023", "31 Apr 2023", "15 Foo 2023", "yesterday", "32/01/2023",
+])
+def test_invalid_dates_are_returned_as_is(text):
+    assert DateParser().parse(text) == text
+
+
+def test_empty_dates_are_none():
+    assert DateParser().parse("") is None
+    assert DateParser().parse(None) is None
+
+
+def test_learned_format_is_kept_per_column():
+    dates = DateParser()
+    assert dates.parse("25/03/2023", "Sent") == "2023-03-25"  # Only day-first fits
+    assert dates.parse("03/04/2023", "Connected On") == "2023-03-04"  # DATE_FORMATS order
+
+    # Each column keeps the format it learned
+    assert dates.parse("05/06/2023", "Sent") == "2023-06-05"
+    assert dates.parse("05/06/2023", "Connected On") == "2023-05-06"
+
+
+def test_pinned_format_is_not_relearned():
+    dates = DateParser()
+    dates.pin("Sent", "%m/%d/%Y")
+    assert dates.parse("25/03/2023", "Sent") == "2023-03-25"  # Falls back to day-first
+    assert dates.parse("05/06/2023", "Sent") == "2023-05-06"
+
+    dates.pin("Sent", None)
+    assert dates.parse("05/06/2023", "Sent") == "2023-05-06"  # DATE_FORMATS order
+
+
+def test_memo_is_bounded_and_parsing_continues_past_it():
+    dates = DateParser()
+    dates.MEMO_LIMIT = 2
+    values = ["2023-01-01", "2023-01-02", "2023-01-03"]
+
+    assert [dates.parse(v, "Date") for v in values * 2] == values * 2
+    assert list(dates._memo["Date"]) == values[:2]
+
+    # Columns are memoized separately
+    assert dates.parse("2023-01-03", "Other") == "2023-01-03"
+    assert list(dates._memo["Other"]) == ["2023-01-03"]
+
+
+def test_parallel_without_messages(tmp_path):
+    write_export(tmp_path, connections=10, messages=0)
+    (tmp_path / "Messages.csv").unlink()
+    parser = _parse(tmp_path, parallel=True)
+    assert len(parser.connections) == 10
+    assert all(conn.message_count == 0 for conn in parser.connections.values())
+
+
+def _append(export, name, rows):
+    with open(export / name, "a", newline="") as f:
+        csv.writer(f).writerows(rows)
+
+
+def test_incremental_matches_full_import(tmp_path):
+    export, state = tmp_path / "export", tmp_path / ".cache" / "import.pickle"
+    write_export(export, connections=50, messages=2000)
+    first = _parse(export)
+    first.save_import_state(state)
+
+    _append(export, "Connections.csv", [["Ada", "Newcomer", "", "Acme", "Founder", "02 Jan 2024"]])
+    _append(export, "Messages.csv", [["Ada Newcomer", "Me", "2024-01-0%d" % day, "", "hi"] for day in range(1, 5)])
+
+    incremental = LinkedInParser(str(export))
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert incremental.parse_incremental(state)
+    full = _parse(export)
+
+    assert _results(incremental) == _results(full)
+    assert incremental.connections["conn.ada-newcomer"].message_count == 4
+    assert incremental.watermarks == full.watermarks
+
+
+def _assert_incremental_matches_full(export, state):
+    incremental = LinkedInParser(str(export))
+    with contextlib.redirect_stdout(io.StringIO()):
+        incremental.parse_incremental(state)
+    full = _parse(export)
+    assert _results(incremental) == _results(full)
+    assert incremental.watermarks == full.watermarks
+
+
+def test_rows_written_into_an_empty_file_are_parsed_in_full(tmp_path):
+    export, state = tmp_path / "export", tmp_path / ".cache" / "import.pickle"
+    write_export(export, connections=20, messages=0)
+    (export / "Messages.csv").write_bytes(b"")
+    watermark = _watermark(export / "Messages.csv", 0)
+    _parse(export).save_import_state(state)
+
+    _append(export, "Messages.csv", [
+        ["From", "To", "Date", "Subject", "Content"],
+        ["Ada Person", "Me", "2024-01-02", "", "hi"],
+    ])
+    assert _appended_from(export / "Messages.csv", watermark) is None
+    _assert_incremental_matches_full(export, state)
+
+
+def test_old_copy_ending_mid_row_is_parsed_in_full(tmp_path):
+    export, state = tmp_path / "export", tmp_path / ".cache" / "import.pickle"
+    write_export(export, connections=20, messages=50)
+    path = export / "Messages.csv"
+    path.write_bytes(path.read_bytes().rstrip(b"\r\n"))  # last row not terminated yet
+    watermark = _watermark(path, 50)
+    _parse(export).save_import_state(state)
+
+    with open(path, "ab") as f:
+        f.write(b" continued\r\nAda Person,Me,2024-01-02,,hi\r\n")
+    assert _appended_from(path, watermark) is None
+    assert _appended_from(path, _watermark(path, 51)) == path.stat().st_size
+    _assert_incremental_matches_full(export, state)
+
+
+def test_import_log_is_capped(tmp_path):
+    write_export(tmp_path / "export", connections=5, messages=20)
+    output = tmp_path / "network.yaml"
+    for i in range(IMPORT_LOG_LIMIT + 3):
+        _append(tmp_path / "export", "Connections.csv", [[f"Extra{i}", "Person", "", "", "", ""]])
+        parser = _parse(tmp_path / "export")
+        with contextlib.redirect_stdout(io.StringIO()):
+            parser.export_network(output)
+
+    log = yaml.safe_load(output.read_text())["import_log"]
+    assert len(log) == IMPORT_LOG_LIMIT
+    assert all("watermarks" not in entry for entry in log)
+
+
+def test_unchanged_import_is_not_logged(tmp_path):
+    write_export(tmp_path / "export", connections=5, messages=20)
+    output = tmp_path / "network.yaml"
+    for _ in range(2):
+        with contextlib.redirect_stdout(io.StringIO()):
+            _parse(tmp_path / "export").export_network(output)
+
+    assert len(yaml.safe_load(output.read_text())["import_log"]) == 1
+    assert not [p for p in tmp_path.iterdir() if p.name.endswith(".tmp")]
@@ -0,0 +1,72 @@
+from collections import Counter
+
+import pytest
+
+from analysis import aggregate, goal_alignment, network_intel, pattern_detect, run_all
+from analysis.context import AnalysisContext
+
+NETWORK = {"connections": [
+    {"id": "ada", "name": "Ada", "relationship_strength": "close", "trust_level": "high",
+     "energy": "energizing", "last_message": "2020-01-05", "domains": ["ml"]},
+    {"id": "bob", "name": "Bob", "relationship_strength": "warm", "energy": "draining",
+     "last_message": "2021-06-01", "domains": ["fundraising"]},
+    {"id": "cy", "name": "Cy", "relationship_strength": "cold", "domains": ["design"]},
+]}
+GOALS = {"stated": {"primary": "Raise a seed round", "secondary": ["Hire ML engineers"]}}
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Counts calls to the analyses a report shares between its sections."""
+    monkeypatch.delenv("BRAIN_STORE", raising=False)
+    counts = Counter()
+
+    def counting(module, name):
+        original = getattr(module, name)
+
+        def wrapper(*args, **kwargs):
+            counts[name] += 1
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(module, name, wrapper)
+
+    counting(aggregate, "aggregate_network")
+    for name in ("stale_relationships", "network_gaps", "energizing_connections", "_network_summary"):
+        counting(network_intel, name)
+    counting(pattern_detect, "blind_spot_detection")
+    counting(goal_alignment, "stated_vs_revealed")
+    return counts
+
+
+def test_each_analysis_runs_once_per_context(calls):
+    context = AnalysisContext(network=NETWORK, goals=GOALS, interactions={"interactions": []})
+
+    run_all.generate_full_report(context)
+    run_all.quick_summary(context)
+    run_all.generate_action_items(context)
+
+    assert calls == {
+        "aggregate_network": 1,
+        "stale_relationships": 1,
+        "network_gaps": 1,
+        "energizing_connections": 1,
+        "_network_summary": 1,
+        "blind_spot_detection": 1,
+        "stated_vs_revealed": 1,
+    }
+
+
+def test_separate_contexts_do_not_share_results(calls):
+    for _ in range(2):
+        run_all.generate_action_items(AnalysisContext(network=NETWORK, goals=GOALS))
+
+    assert calls["stale_relationships"] == 2
+    assert calls["energizing_connections"] == 2
+
+
+def test_energizing_connections_reads_the_context_network():
+    context = AnalysisContext(network=NETWORK, goals={})
+
+    insights = network_intel.energizing_connections(context=context)
+
+    assert [(i.type, i.connections) for i in insights] == [("energizing", ["ada"]), ("draining", ["bob"])]
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from analysis.network_intel import domain_matches
+from analysis.topic_match import TopicMatcher, match_topics
+
+WORDS = ["sales", "saas", "ai", "aid", "fund", "fundraising", "go", "gogo", "B2B", "Ops", "ml", "ml ops"]
+STRENGTHS = ["close", "warm", "cold"]
+
+
+def _text(rng, words=3):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, words)))
+
+
+def _connection(rng, i):
+    conn = {"id": f"p{i}", "name": f"Person {i}", "relationship_strength": rng.choice(STRENGTHS)}
+    for field_name in ("position", "company", "notes"):
+        if rng.random() < 0.7:
+            conn[field_name] = _text(rng)
+    for field_name in ("domains", "can_ask_for"):
+        if rng.random() < 0.7:
+            conn[field_name] = [_text(rng, 2) for _ in range(rng.randint(0, 3))]
+    return conn
+
+
+def _topics(rng):
+    topics = [_text(rng, 2) for _ in range(8)]
+    # Case variants, and a topic that only matches across two joined domains
+    return topics + [rng.choice(WORDS).upper(), "sales ai", ""]
+
+
+def _ids(insights):
+    return insights[0].connections if insights else []
+
+
+def test_overlapping_topics_all_match():
+    matcher = TopicMatcher(["he", "she", "his", "hers"])
+    found = {matcher.topics[k] for k in matcher.matches("ushers")}
+    assert found == {"he", "she", "hers"}
+
+
+def test_a_topic_never_matches_across_fields():
+    network = {"connections": [{"id": "p0", "company": "acme sales", "notes": "ai research"}]}
+    assert match_topics(["sales ai", "sales", "ai"], network) == {
+        "sales ai": [],
+        "sales": network["connections"],
+        "ai": network["connections"],
+    }
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_match_topics_agrees_with_domain_matches(seed):
+    rng = random.Random(seed)
+    network = {"connections": [_connection(rng, i) for i in range(60)]}
+    topics = _topics(rng)
+    for min_strength in STRENGTHS:
+        matches = match_topics(topics, network, min_strength=min_strength)
+        assert list(matches) == list(dict.fromkeys(topics))
+        for topic in topics:
+            expected = _ids(domain_matches(topic, network, min_strength=min_strength))
+            assert [conn["id"] for conn in matches[topic]] == expected, topic
@@ -0,0 +1,103 @@
+import contextlib
+import io
+
+import pytest
+import yaml
+
+from benchmarks.synthetic import write_export
+from ingest import yaml_writer
+from ingest.linkedin import LinkedInParser
+from ingest.yaml_writer import RecordDocument, record_hash
+
+RECORDS = [{"id": "a", "name": "Ada"}, {"id": "b", "name": "Bo"}]
+
+
+def _document(path):
+    return RecordDocument(path, "people", key=lambda r: r["id"])
+
+
+def _write(path, records, **fields):
+    document = _document(path)
+    sources = {r["id"]: record_hash(r) for r in records}
+    merged = [document.reuse(r["id"], sources[r["id"]]) or dict(r) for r in records]
+    return document.write({"version": 1, **fields, "people": merged}, sources)
+
+
+@pytest.fixture
+def dumps(monkeypatch):
+    """Every value passed to dump_yaml."""
+    dumped = []
+
+    def dump(data):
+        dumped.append(data)
+        return yaml.safe_dump(data, sort_keys=False)
+
+    monkeypatch.setattr(yaml_writer, "dump_yaml", dump)
+    return dumped
+
+
+def test_unchanged_records_are_reused(tmp_path, dumps):
+    path = tmp_path / "people.yaml"
+    assert _write(path, RECORDS, created="monday")
+    written = path.read_bytes()
+
+    document = _document(path)
+    reused = document.reuse("a", record_hash(RECORDS[0]))
+    assert reused == RECORDS[0]
+    assert document.reuse("a", "another source") is None
+    assert document.existing_records()["a"] is reused
+
+    dumps.clear()
+    # Only a volatile field changed: no record is emitted and nothing is written
+    assert not _write(path, RECORDS, created="tuesday")
+    assert [data for data in dumps if isinstance(data, list)] == []
+    assert path.read_bytes() == written
+
+    changed = [RECORDS[0], {"id": "b", "name": "Bob"}]
+    assert _write(path, changed)
+    assert [data for data in dumps if isinstance(data, list)] == [[{"id": "b", "name": "Bob"}]]
+    assert yaml.safe_load(path.read_text())["people"] == changed
+
+
+def test_hand_edited_file_invalidates_the_cache(tmp_path):
+    path = tmp_path / "people.yaml"
+    _write(path, RECORDS)
+    path.write_text(path.read_text().replace("name: Ada", "name: Ada\n  notes: met at a conference"))
+
+    document = _document(path)
+    assert document.reuse("a", record_hash(RECORDS[0])) is None
+    assert document.existing_records()["a"]["notes"] == "met at a conference"
+
+
+def _export(export, output):
+    parser = LinkedInParser(str(export))
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser.parse_all()
+        parser.export_network(output)
+
+
+def test_manual_enrichments_survive_reuse(tmp_path, monkeypatch):
+    write_export(tmp_path / "export", connections=10, messages=30)
+    output = tmp_path / "network.yaml"
+    _export(tmp_path / "export", output)
+
+    network = yaml.safe_load(output.read_text())
+    conn_id = network["connections"][0]["id"]
+    network["connections"][0]["notes"] = "knows everyone in fintech"
+    output.write_text(yaml.safe_dump(network, sort_keys=False))
+
+    _export(tmp_path / "export", output)  # edited by hand: merged again
+    reused = []
+    original_reuse = RecordDocument.reuse
+
+    def reuse(self, key, source_hash):
+        record = original_reuse(self, key, source_hash)
+        reused.append(record is not None)
+        return record
+
+    monkeypatch.setattr(RecordDocument, "reuse", reuse)
+    _export(tmp_path / "export", output)  # unchanged: records come from the cache
+
+    assert reused and all(reused)
+    connections = {c["id"]: c for c in yaml.safe_load(output.read_text())["connections"]}
+    assert connections[conn_id]["notes"] == "knows everyone in fintech"
@@ -0,0 +1,151 @@
+"""
+Brain load benchmarks
+
+Compares every available parser backend against the compiled snapshot
+cache per file (a file x backend matrix), source against snapshot for a
+full cold-start process, eager against lazy Brain.load() for typical
+single-query scripts, and Brain.load() against the concurrent
+Brain.aload() inside an event loop.
+
+Usage:
+    python benchmarks/bench_load.py
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SDK_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(SDK_ROOT))
+
+from brain import Brain, backends, loaders  # noqa: E402
+
+FILES = [
+    ('graph/entities.yaml', loaders.load_yaml),
+    ('graph/relationships.yaml', loaders.load_yaml),
+    ('graph/predictions.yaml', loaders.load_yaml),
+    ('agenda.yaml', loaders.load_yaml),
+    ('human/network.yaml', loaders.load_yaml),
+    ('state.json', loaders.load_json),
+]
+
+
+def _best_of(fn, repeat: int = 20) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_files() -> None:
+    columns = [backend.name for fmt in ('yaml', 'json') for backend in backends.BACKENDS[fmt]] + ['snapshot']
+    print("Load time per file and backend (ms, best of 20):")
+    print(f"{'file':<28}" + "".join(f"{name:>10}" for name in columns))
+    for relative_path, load in FILES:
+        fmt = backends.format_for(relative_path)
+        load(relative_path, use_snapshot=True)  # warm the snapshot
+        timings = {
+            backend.name: _best_of(lambda: load(relative_path, use_snapshot=False, backend=backend.name))
+            for backend in backends.BACKENDS[fmt]
+        }
+        timings['snapshot'] = _best_of(lambda: load(relative_path, use_snapshot=True))
+        row = "".join(f"{timings[name] * 1000:>10.2f}" if name in timings else f"{'-':>10}" for name in columns)
+        print(f"{relative_path:<28}{row}")
+
+
+def _time_script(code: str, env: dict, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=SDK_ROOT, env=env, check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_cold_start(repeat: int = 5) -> None:
+    code = 'from brain import Brain; Brain.load()'
+    results = {}
+    for label, flag in (('source', '0'), ('snapshot', '1')):
+        env = dict(os.environ, BRAIN_SNAPSHOTS=flag, PYTHONWARNINGS='ignore')
+        results[label] = _time_script(code, env, repeat)
+    print(f"\nCold start (import + Brain.load(), best of {repeat}):")
+    for label, seconds in results.items():
+        print(f"  {label:<10}{seconds * 1000:>8.1f} ms")
+
+
+SINGLE_QUERY_SCRIPTS = {
+    'believes': "b.believes('small-is-underrated')",
+    'network': "b.network.high_trust()",
+    'agenda': "b.urgent_agenda_items()",
+    'version': "b.version",
+}
+
+
+def bench_lazy(repeat: int = 5) -> None:
+    env = dict(os.environ, BRAIN_SNAPSHOTS='0', PYTHONWARNINGS='ignore')
+    print(f"\nEager vs lazy Brain.load() per single-query script (source parse, best of {repeat}):")
+    print(f"  {'query':<12}{'eager (ms)':>12}{'lazy (ms)':>12}")
+    for label, query in SINGLE_QUERY_SCRIPTS.items():
+        timings = [
+            _time_script(f'from brain import Brain; b = Brain.load(lazy={lazy}); {query}', env, repeat)
+            for lazy in (False, True)
+        ]
+        print(f"  {label:<12}{timings[0] * 1000:>12.1f}{timings[1] * 1000:>12.1f}")
+
+
+async def _loop_stall(load) -> tuple[float, float]:
+    """(load time, longest gap between 1 ms ticks of another coroutine) for one load."""
+    ticking = True
+    stall = 0.0
+
+    async def ticker():
+        nonlocal stall
+        last = time.perf_counter()
+        while ticking:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await load()
+    elapsed = time.perf_counter() - start
+    ticking = False
+    await task
+    return elapsed, stall
+
+
+def bench_aload(repeat: int = 5) -> None:
+    async def blocking():
+        Brain.load()
+
+    print(f"\nBrain.load() vs Brain.aload() in an event loop (ms, best of {repeat}):")
+    print(f"  {'':<10}{'load':>10}{'aload':>10}{'load stall':>13}{'aload stall':>13}")
+    for label, snapshots in (('source', False), ('snapshot', True)):
+        loaders.SNAPSHOTS_ENABLED = snapshots
+        results = {}
+        for name, load in (('load', blocking), ('aload', Brain.aload)):
+            runs = [asyncio.run(_loop_stall(load)) for _ in range(repeat)]
+            results[name] = (min(r[0] for r in runs), min(r[1] for r in runs))
+        print(f"  {label:<10}{results['load'][0] * 1000:>10.1f}{results['aload'][0] * 1000:>10.1f}"
+              f"{results['load'][1] * 1000:>13.1f}{results['aload'][1] * 1000:>13.1f}")
+    loaders.SNAPSHOTS_ENABLED = True
+    print("  (stall: longest time another coroutine waited for the loop)")
+
+
+def main():
+    bench_files()
+    bench_cold_start()
+    bench_lazy()
+    bench_aload()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Brain server benchmarks
+
+Compares answering a query in a fresh process (import + lazy
+Brain.load() + query, what a CLI call or one-off agent script pays) with
+asking a resident BrainServer through BrainClient over its Unix socket,
+and measures the server under concurrent clients.
+
+Usage:
+    python benchmarks/bench_server.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+SDK_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(SDK_ROOT))
+
+from brain.client import BrainClient  # noqa: E402
+from brain.server import BrainServer  # noqa: E402
+
+QUERIES = {
+    'believes': ('brain.believes', 'small-is-underrated', "b.believes('small-is-underrated')"),
+    'entity': ('brain.entity', 'belief.small-is-underrated', "b.entity('belief.small-is-underrated')"),
+    'high_trust': ('network.high_trust', None, "b.network.high_trust()"),
+    'urgent_agenda': ('brain.urgent_agenda_items', None, "b.urgent_agenda_items()"),
+}
+
+
+def _per_call(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n
+
+
+def _script_time(query: str, repeat: int = 3) -> float:
+    env = dict(os.environ, PYTHONWARNINGS='ignore')
+    code = f'from brain import Brain; b = Brain.load(lazy=True); {query}'
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=SDK_ROOT, env=env, check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        server = BrainServer(Path(tmp) / 'brain.sock', interval=None)
+        print(f"Server startup (load + index): {(time.perf_counter() - start) * 1000:.1f} ms\n")
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        with BrainClient(server.path) as client:
+            print(f"{'query':<16}{'new process (ms)':>18}{'server (ms)':>14}")
+            for label, (method, arg, query) in QUERIES.items():
+                args = () if arg is None else (arg,)
+                client.call(method, *args)
+                served = _per_call(lambda: client.call(method, *args), 1000)
+                print(f"{label:<16}{_script_time(query) * 1000:>18.1f}{served * 1000:>14.3f}")
+
+        for n_clients in (1, 4, 16):
+            def worker():
+                with BrainClient(server.path) as c:
+                    for _ in range(500):
+                        c.call('brain.believes', 'small-is-underrated')
+
+            threads = [threading.Thread(target=worker) for _ in range(n_clients)]
+            start = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            elapsed = time.perf_counter() - start
+            print(f"\n{n_clients:>2} concurrent clients: {n_clients * 500 / elapsed:,.0f} queries/s", end='')
+        print()
+
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Brain store benchmarks
+
+Builds a synthetic brain with a large network, imports it into a SQLite
+store and compares the YAML-backed Brain with Brain.from_store() for
+first-query latency (open + query, what a short script pays) and
+steady-state query time.
+
+Usage:
+    python benchmarks/bench_store.py [connections]
+"""
+
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+SDK_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(SDK_ROOT))
+
+from brain import Brain, loaders  # noqa: E402
+from brain.brain import NetworkAccessor  # noqa: E402
+from brain.store import BrainStore  # noqa: E402
+
+DOMAINS = ["sales", "distribution", "fundraising", "ml", "ai", "product", "design", "fintech", "growth", "saas"]
+STRENGTHS = ["cold", "cold", "cold", "warm", "close"]
+
+
+def make_network(n: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    return {"connections": [
+        {
+            "id": f"conn.person-{i}",
+            "name": f"Person {i}",
+            "company": f"Company {rng.randint(0, n // 20)}",
+            "position": rng.choice(["Founder", "VP Sales", "Engineer", "Partner"]),
+            "relationship_strength": rng.choice(STRENGTHS),
+            "last_message": f"20{rng.randint(15, 24)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}",
+            "domains": rng.sample(DOMAINS, rng.randint(0, 3)),
+            "can_ask_for": [],
+            "trust_level": rng.choice([None, "high", "medium", "low"]),
+            "energy": rng.choice([None, "energizing", "neutral", "draining"]),
+        }
+        for i in range(n)
+    ], "stats": {}}
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for name in ("graph", "agenda.yaml", "state.json"):
+            source = loaders.BRAIN_ROOT / name
+            (shutil.copytree if source.is_dir() else shutil.copy)(source, root / name)
+        (root / "human").mkdir()
+        network_path = root / "human" / "network.yaml"
+        network_path.write_text(yaml.dump(make_network(n), Dumper=yaml.CSafeDumper, sort_keys=False))
+
+        store = BrainStore(root / "brain.db")
+        print(f"Import {n:,} connections into SQLite: {_timed(lambda: store.import_yaml(root)):.2f}s")
+        print(f"Re-import, unchanged: {_timed(lambda: store.import_yaml(root)) * 1000:.1f} ms\n")
+
+        def yaml_first_query():
+            network = yaml.load(network_path.read_bytes(), Loader=yaml.CSafeLoader)
+            NetworkAccessor(_connections=network["connections"]).domain_matches("sales")
+
+        def store_first_query():
+            Brain.from_store(BrainStore(root / "brain.db")).network.domain_matches("sales")
+
+        print("First query (open + domain_matches('sales')):")
+        print(f"  yaml (libyaml){_timed(yaml_first_query) * 1000:>12.1f} ms")
+        print(f"  sqlite        {_timed(store_first_query) * 1000:>12.1f} ms")
+
+        network = yaml.load(network_path.read_bytes(), Loader=yaml.CSafeLoader)
+        memory = NetworkAccessor(_connections=network["connections"])
+        stored = Brain.from_store(store)
+        cutoff = "2018-01-01"
+        queries = {
+            "domain_matches('fin')": (lambda: memory.domain_matches("fin"), lambda: stored.network.domain_matches("fin")),
+            "get(id)": (lambda: memory.get("conn.person-7"), lambda: stored.network.get("conn.person-7")),
+            "stale candidates": (
+                lambda: [c for c in memory.connections if c.get("relationship_strength") in ("warm", "close")
+                         and (c.get("last_contact") or c.get("last_message") or "9") < cutoff],
+                lambda: store.stale_connections(cutoff),
+            ),
+        }
+        print("\nSteady-state query (indexes built, ms):")
+        for label, (in_memory, sql) in queries.items():
+            in_memory(), sql()  # warm up
+            print(f"  {label:<24}memory {_timed(in_memory) * 1000:>8.2f}   sqlite {_timed(sql) * 1000:>8.2f}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
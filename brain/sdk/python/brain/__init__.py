@@ -25,24 +25,57 @@ Usage:
     urgent = brain.urgent_agenda_items()
 """
 
-from .brain import Brain
-from .types import (
-    ConfidenceLevel,
-    RelationshipStrength,
-    TrustLevel,
-    EnergyLevel,
-    Priority,
-    Entity,
-    Belief,
-    Thread,
-    Prediction,
-    Relationship,
-    Connection,
-    Network,
-    AgendaItem,
-    Agenda,
-    BrainState,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .brain import Brain
+    from .types import (
+        ConfidenceLevel,
+        RelationshipStrength,
+        TrustLevel,
+        EnergyLevel,
+        Priority,
+        Entity,
+        Belief,
+        Thread,
+        Prediction,
+        Relationship,
+        Connection,
+        Network,
+        AgendaItem,
+        Agenda,
+        BrainState,
+    )
+
+# Exports are imported on first access, so light modules such as
+# brain.client start without loading pydantic or the parsers
+_EXPORTS = {'Brain': 'brain', **{name: 'types' for name in (
+    'ConfidenceLevel',
+    'RelationshipStrength',
+    'TrustLevel',
+    'EnergyLevel',
+    'Priority',
+    'Entity',
+    'Belief',
+    'Thread',
+    'Prediction',
+    'Relationship',
+    'Connection',
+    'Network',
+    'AgendaItem',
+    'Agenda',
+    'BrainState',
+)}}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(importlib.import_module(f'.{module}', __name__), name)
+    return value
+
 
 __all__ = [
     'Brain',
@@ -0,0 +1,104 @@
+"""
+Brain SDK Backends
+Pluggable parsers for brain files
+
+Each format has a list of parser backends, fastest first. The first one
+whose library is installed is used, so nothing needs configuring:
+
+    yaml: libyaml (PyYAML's CSafeLoader) -> pyyaml (pure Python SafeLoader)
+    json: orjson (optional dependency)   -> json (stdlib)
+
+If a faster backend rejects a file (e.g. orjson on NaN, which the stdlib
+accepts), the next backend is tried, and an error is only raised once
+the reference parser (the last one) rejects it too. The faster backends
+are meant as drop-in replacements, but nothing checks that they parse
+every input exactly like the reference. Pin a backend with
+BRAIN_YAML_BACKEND or BRAIN_JSON_BACKEND; an unknown or unavailable name
+falls back to the default.
+
+Parsed results are cached on top of this by the compiled snapshots in
+loaders.load_cached().
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import yaml
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True)
+class Backend:
+    """A named parser turning raw file bytes into Python data."""
+
+    name: str
+    format: str
+    parse: Callable[[bytes], Any]
+
+
+def _yaml_backends() -> list[Backend]:
+    backends = []
+    if hasattr(yaml, 'CSafeLoader'):
+        backends.append(Backend('libyaml', 'yaml', lambda raw: yaml.load(raw, Loader=yaml.CSafeLoader)))
+    backends.append(Backend('pyyaml', 'yaml', yaml.safe_load))
+    return backends
+
+
+def _json_backends() -> list[Backend]:
+    backends = []
+    if orjson is not None:
+        backends.append(Backend('orjson', 'json', orjson.loads))
+    backends.append(Backend('json', 'json', json.loads))
+    return backends
+
+
+# Available backends per format, fastest first; the last is the reference
+BACKENDS: dict[str, list[Backend]] = {
+    'yaml': _yaml_backends(),
+    'json': _json_backends(),
+}
+
+SUFFIXES = {'.yaml': 'yaml', '.yml': 'yaml', '.json': 'json'}
+
+
+def format_for(path: Union[str, Path]) -> str:
+    """File format from a path's suffix."""
+    suffix = Path(path).suffix.lower()
+    if suffix not in SUFFIXES:
+        raise ValueError(f"Unsupported brain file type: {path}")
+    return SUFFIXES[suffix]
+
+
+def get_backend(fmt: str, name: Optional[str] = None) -> Backend:
+    """The named backend, else the BRAIN_<FORMAT>_BACKEND one, else the fastest available."""
+    backends = BACKENDS[fmt]
+    name = name or os.environ.get(f'BRAIN_{fmt.upper()}_BACKEND')
+    for backend in backends:
+        if backend.name == name:
+            return backend
+    return backends[0]
+
+
+def parse(raw: bytes, fmt: str, backend: Optional[str] = None) -> Any:
+    """Parse raw bytes, falling back to slower backends if one rejects the input."""
+    backends = BACKENDS[fmt]
+    chosen = get_backend(fmt, backend)
+    start = backends.index(chosen)
+    for i, candidate in enumerate(backends[start:], start):
+        try:
+            return candidate.parse(raw)
+        except Exception:
+            if i == len(backends) - 1:
+                raise
+
+
+def parser(fmt: str, backend: Optional[str] = None) -> Callable[[bytes], Any]:
+    """A parse function for one format, for use with loaders.load_cached()."""
+    return lambda raw: parse(raw, fmt, backend)
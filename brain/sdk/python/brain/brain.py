@@ -5,6 +5,7 @@ Usage:
     from brain import Brain
 
     brain = Brain.load()
+    brain = await Brain.aload()  # from async code
 
     # Check a belief
     if brain.believes('distribution-beats-product'):
@@ -12,14 +13,24 @@ Usage:
 
     # Get network
     experts = brain.network.domain_matches('sales')
+
+    # Pick up edits to the brain files
+    brain.refresh()
 """
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import threading
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union, cast
 
 from .loaders import (
+    SECTION_FILES,
+    file_signature,
     load_entities,
     load_relationships,
     load_predictions,
@@ -27,6 +38,10 @@ from .loaders import (
     load_network,
     load_state,
 )
+from .confidence import ConfidenceEngine
+from .consistency import ConsistencyReport, cached_check, check_consistency
+from .graph import RelationshipGraph
+from .search import SubstringIndex
 from .types import (
     ConfidenceLevel,
     RelationshipStrength,
@@ -34,64 +49,145 @@ from .types import (
     Connection,
 )
 
+if TYPE_CHECKING:
+    from .store import BrainStore, StoreNetworkAccessor
+    from .watch import BrainWatcher
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Section name -> loader, in the order Brain.load() reads them
+SECTION_LOADERS: dict[str, Callable[[], Any]] = {
+    'state': load_state,
+    'entities': load_entities,
+    'relationships': load_relationships,
+    'predictions': load_predictions,
+    'agenda': load_agenda,
+    'network': load_network,
+}
+
+# Derived index -> sections it is built from, dropped when one of them reloads
+INDEX_SECTIONS: dict[str, tuple[str, ...]] = {
+    'entities_by_id': ('entities',),
+    'entities_by_type': ('entities',),
+    'entities_by_confidence': ('entities',),
+    'relationships_by_entity': ('relationships',),
+    'relationships_to': ('relationships',),
+    'graph': ('relationships',),
+    'consistency': ('entities', 'relationships'),
+    'network': ('network',),
+}
+
+CONSISTENCY_SECTIONS = frozenset(INDEX_SECTIONS['consistency'])
+
+# Derived indexes carried over a reload by their updated() method instead
+# of being rebuilt: index -> sections it is computed from
+INCREMENTAL_INDEXES: dict[str, tuple[str, ...]] = {
+    'confidence': ('entities', 'relationships'),
+}
+
 
 @dataclass
 class NetworkAccessor:
-    """Accessor for network queries."""
+    """
+    Accessor for network queries.
+
+    The id map and strength/trust/energy buckets are built once in a single
+    pass over the connections; substring indexes for the searchable fields
+    are built on first use. An accessor should be kept and reused -
+    Brain.network returns the same instance on every access.
+    """
+
+    # Searchable text fields; list fields are matched element-wise
+    SEARCH_FIELDS = ('name', 'company', 'position', 'domains', 'can_ask_for')
+    LIST_FIELDS = ('domains', 'can_ask_for')
+
+    _connections: list[dict[str, Any]] = field(default_factory=list)
+    _stats: dict[str, Any] = field(default_factory=dict)
+
+    _by_id: dict[Optional[str], dict[str, Any]] = field(init=False, repr=False)
+    _by_strength: dict[Optional[str], list[dict[str, Any]]] = field(init=False, repr=False)
+    _by_trust: dict[Optional[str], list[dict[str, Any]]] = field(init=False, repr=False)
+    _by_energy: dict[Optional[str], list[dict[str, Any]]] = field(init=False, repr=False)
+    _text_indexes: dict[str, SubstringIndex] = field(init=False, repr=False)
 
-    _connections: list[dict] = field(default_factory=list)
-    _stats: dict = field(default_factory=dict)
+    def __post_init__(self) -> None:
+        self._by_id = {}
+        self._by_strength = {}
+        self._by_trust = {}
+        self._by_energy = {}
+        self._text_indexes = {}
+
+        for c in self._connections:
+            self._by_id.setdefault(c.get('id'), c)
+            self._by_strength.setdefault(c.get('relationship_strength'), []).append(c)
+            self._by_trust.setdefault(c.get('trust_level'), []).append(c)
+            self._by_energy.setdefault(c.get('energy'), []).append(c)
+
+    def _text_index(self, field_name: str) -> SubstringIndex:
+        index = self._text_indexes.get(field_name)
+        if index is None:
+            texts = []
+            for c in self._connections:
+                value = c.get(field_name)
+                if field_name in self.LIST_FIELDS:
+                    # NUL never occurs in a query, so no match can span two
+                    # items; a missing or empty list has no item to match at all
+                    texts.append('\0'.join(value) if value else None)
+                else:
+                    texts.append(value or '')
+            index = self._text_indexes[field_name] = SubstringIndex(texts)
+        return index
+
+    def _matching(self, query: str, fields: tuple[str, ...]) -> list[dict[str, Any]]:
+        positions: set[int] = set()
+        for field_name in fields:
+            positions.update(self._text_index(field_name).find(query))
+        return [self._connections[i] for i in sorted(positions)]
 
     @property
-    def connections(self) -> list[dict]:
+    def connections(self) -> list[dict[str, Any]]:
         return self._connections
 
     @property
-    def stats(self) -> dict:
+    def stats(self) -> dict[str, Any]:
         return self._stats
 
-    def domain_matches(self, domain: str) -> list[dict]:
+    def domain_matches(self, domain: str) -> list[dict[str, Any]]:
         """Find connections in a domain."""
-        domain_lower = domain.lower()
-        return [
-            c for c in self._connections
-            if any(domain_lower in d.lower() for d in c.get('domains', []))
-        ]
+        return self._matching(domain, ('domains',))
 
-    def by_strength(self, strength: str) -> list[dict]:
+    def by_strength(self, strength: str) -> list[dict[str, Any]]:
         """Find connections by relationship strength."""
-        return [
-            c for c in self._connections
-            if c.get('relationship_strength') == strength
-        ]
+        return list(self._by_strength.get(strength, ()))
 
-    def high_trust(self) -> list[dict]:
+    def high_trust(self) -> list[dict[str, Any]]:
         """Get high-trust connections."""
-        return [c for c in self._connections if c.get('trust_level') == 'high']
+        return list(self._by_trust.get('high', ()))
 
-    def energizing(self) -> list[dict]:
+    def energizing(self) -> list[dict[str, Any]]:
         """Get energizing connections."""
-        return [c for c in self._connections if c.get('energy') == 'energizing']
+        return list(self._by_energy.get('energizing', ()))
 
-    def draining(self) -> list[dict]:
+    def draining(self) -> list[dict[str, Any]]:
         """Get draining connections."""
-        return [c for c in self._connections if c.get('energy') == 'draining']
+        return list(self._by_energy.get('draining', ()))
 
-    def get(self, connection_id: str) -> Optional[dict]:
+    def get(self, connection_id: str) -> Optional[dict[str, Any]]:
         """Get a specific connection."""
-        for c in self._connections:
-            if c.get('id') == connection_id:
-                return c
-        return None
+        return self._by_id.get(connection_id)
 
-    def search(self, query: str) -> list[dict]:
-        """Search connections by name or company."""
-        query_lower = query.lower()
-        return [
-            c for c in self._connections
-            if query_lower in c.get('name', '').lower()
-            or query_lower in (c.get('company') or '').lower()
-        ]
+    def search(self, query: str, fields: tuple[str, ...] = ('name', 'company')) -> list[dict[str, Any]]:
+        """
+        Search connections by name or company.
+
+        Pass `fields` (any of SEARCH_FIELDS) to search other fields too.
+        """
+        unknown = set(fields) - set(self.SEARCH_FIELDS)
+        if unknown:
+            raise ValueError(f"Unsearchable fields: {', '.join(sorted(unknown))}")
+        return self._matching(query, fields)
 
 
 class Brain:
@@ -106,164 +202,445 @@ class Brain:
 
     def __init__(
         self,
-        state: dict,
-        entities: list,
-        relationships: list,
-        predictions: list,
-        agenda: dict,
-        network: dict,
+        state: dict[str, Any],
+        entities: list[dict[str, Any]],
+        relationships: list[dict[str, Any]],
+        predictions: list[dict[str, Any]],
+        agenda: dict[str, Any],
+        network: dict[str, Any],
     ):
-        self._state = state
-        self._entities = entities
-        self._relationships = relationships
-        self._predictions = predictions
-        self._agenda = agenda
-        self._network_data = network
+        self._init({
+            'state': state,
+            'entities': entities,
+            'relationships': relationships,
+            'predictions': predictions,
+            'agenda': agenda,
+            'network': network,
+        })
+
+    def _init(
+        self,
+        sections: dict[str, Any],
+        pending: Optional[dict[str, Callable[[], Any]]] = None,
+        store: Optional[BrainStore] = None,
+    ) -> None:
+        """Set up a brain from its loaded sections and the loaders of the rest."""
+        self._sections = sections
+        self._pending: dict[str, Callable[[], Any]] = pending or {}
+        self._indexes: dict[str, Any] = {}
+        self._signatures: dict[str, Optional[tuple[int, int]]] = {}  # section -> file signature when loaded
+        self._store = store
+        # Held by refresh() and by the load of a pending section, so two
+        # threads never load one section twice or lose it to a reload
+        self._refresh_lock = threading.RLock()
+
+    @classmethod
+    def load(cls, lazy: bool = False) -> Brain:
+        """
+        Load the brain from disk.
+
+        With lazy=True nothing is parsed up front: each section is loaded on
+        first access and memoized, so short-lived scripts only pay for the
+        files they touch. The consistency check then runs once both
+        entities and relationships are loaded.
+        """
+        if lazy:
+            brain = cls.__new__(cls)
+            brain._init({}, dict(SECTION_LOADERS))
+            return brain
+
+        signatures = _section_signatures()
+        return cls._loaded(signatures, {name: loader() for name, loader in SECTION_LOADERS.items()})
+
+    @classmethod
+    async def aload(cls, executor: Optional[Executor] = None) -> Brain:
+        """
+        Load the brain from disk without blocking the event loop.
+
+        Every section is parsed on a worker thread (the loop's default
+        executor unless one is given), all of them concurrently, and the
+        coroutine resumes once the last one is done.
+        """
+        loop = asyncio.get_running_loop()
+        signatures = _section_signatures()
+        parsed = await asyncio.gather(*(
+            loop.run_in_executor(executor, loader) for loader in SECTION_LOADERS.values()
+        ))
+        return cls._loaded(signatures, dict(zip(SECTION_LOADERS, parsed)))
+
+    @classmethod
+    def _loaded(cls, signatures: dict[str, Optional[tuple[int, int]]], sections: dict[str, Any]) -> Brain:
+        brain = cls(**sections)
+        brain._signatures = signatures
+        brain._check_consistency()
+        return brain
 
     @classmethod
-    def load(cls) -> Brain:
-        """Load the brain from disk."""
-        state = load_state()
-        entities = load_entities()
-        relationships = load_relationships()
-        predictions = load_predictions()
-        agenda = load_agenda()
-        network = load_network()
+    def from_store(cls, store: Union[BrainStore, str, None] = None) -> Brain:
+        """
+        Open the brain from a SQLite store (see store.py).
+
+        Sections are read from the store on first access; relationship and
+        network queries run as indexed SQL instead of in-memory scans. As
+        with a lazy load, the consistency check runs once both entities and
+        relationships are loaded.
+
+        Raises LookupError if the store holds no brain state, e.g. when
+        nothing was imported into it yet.
+        """
+        from .store import BrainStore
+
+        if not isinstance(store, BrainStore):
+            store = BrainStore(store)
+        state = store.section('state')
+        if state is None:
+            raise LookupError(f"No brain state in {store.path}: import the brain files first (BrainStore.import_yaml())")
+        brain = cls.__new__(cls)
+        pending: dict[str, Callable[[], Any]] = {
+            name: partial(store.section, name) for name in SECTION_LOADERS if name != 'state'
+        }
+        brain._init({'state': state}, pending, store)
+        return brain
+
+    def _section(self, name: str) -> Any:
+        """Get a section's data, loading it first if still pending."""
+        try:
+            return self._sections[name]
+        except KeyError:
+            with self._refresh_lock:
+                sections = self._sections
+                if name not in sections:
+                    if self._store is None:
+                        self._signatures[name] = file_signature(SECTION_FILES[name])
+                    sections[name] = self._pending[name]()
+                    del self._pending[name]
+                    if name in CONSISTENCY_SECTIONS and CONSISTENCY_SECTIONS <= sections.keys():
+                        self._check_consistency()
+                return sections[name]
+
+    @property
+    def loaded_sections(self) -> list[str]:
+        """Names of the sections parsed so far."""
+        return list(self._sections)
+
+    def warm(self) -> None:
+        """Load every pending section and build every derived index now rather than on first use."""
+        for name in SECTION_LOADERS:
+            self._section(name)
+        for name in (*INDEX_SECTIONS, *INCREMENTAL_INDEXES):
+            self._index(name, getattr(self, f'_build_{name}'))
+
+    # === RELOADING ===
+
+    def refresh(self) -> list[str]:
+        """
+        Re-parse the loaded sections whose files changed on disk.
+
+        A file counts as changed when its mtime or size differs from when
+        its section was loaded; other sections are left alone, and sections
+        not loaded yet will read the current file anyway. The new sections
+        are swapped in together, and only the indexes derived from them are
+        dropped (to be rebuilt on next use) or, for INCREMENTAL_INDEXES,
+        updated for just what changed. If a file fails to parse, e.g.
+        mid-save, nothing is swapped and the next refresh tries again.
+
+        A store-backed brain re-imports changed files into its store first.
+        Returns the names of the sections that changed.
+        """
+        with self._refresh_lock:
+            signatures = dict(self._signatures)
+            if self._store is not None:
+                # Store-built indexes (the network) depend on the store, not
+                # on a loaded section
+                changed = [name for name in self._store.import_yaml() if name in SECTION_LOADERS]
+                reloaded = {name: self._store.section(name) for name in changed if name in self._sections}
+            else:
+                reloaded = {}
+                for name, signature in self._signatures.items():
+                    current = file_signature(SECTION_FILES[name])
+                    if current != signature:
+                        reloaded[name] = SECTION_LOADERS[name]()
+                        signatures[name] = current
+                changed = list(reloaded)
+            if not changed:
+                return []
+
+            sections = {**self._sections, **reloaded}
+            indexes = {
+                name: index for name, index in self._indexes.items()
+                if not any(section in changed for section in INDEX_SECTIONS.get(name, ()))
+            }
+            for name, inputs in INCREMENTAL_INDEXES.items():
+                if name in indexes and any(section in changed for section in inputs):
+                    indexes[name] = indexes[name].updated(*(sections[section] for section in inputs))
+            # Sections first: _index() reads the indexes dict before building
+            # from the sections, so it never caches an old build in the new dict
+            self._sections = sections
+            self._signatures = signatures
+            self._indexes = indexes
+            if CONSISTENCY_SECTIONS.intersection(changed):
+                self._check_consistency()
+            return changed
+
+    def watch(
+        self,
+        interval: float = 1.0,
+        on_change: Optional[Callable[[list[str]], None]] = None,
+    ) -> BrainWatcher:
+        """
+        Call refresh() every `interval` seconds on a background thread.
+
+        on_change gets the names of the reloaded sections. Returns the
+        running watcher; call its stop() to end it.
+        """
+        from .watch import BrainWatcher
 
-        return cls(state, entities, relationships, predictions, agenda, network)
+        return BrainWatcher(self, interval, on_change).start()
 
     # === STATE ===
 
     @property
-    def state(self) -> dict:
-        return self._state
+    def state(self) -> dict[str, Any]:
+        return cast(dict[str, Any], self._section('state'))
 
     @property
     def version(self) -> str:
-        return self._state.get('version', '')
+        return cast(str, self.state.get('version', ''))
 
     @property
-    def capabilities(self) -> dict:
-        return self._state.get('capabilities', {})
+    def capabilities(self) -> dict[str, Any]:
+        return cast(dict[str, Any], self.state.get('capabilities', {}))
 
     def has_capability(self, name: str) -> bool:
         """Check if brain has a capability."""
-        return self._state.get('capabilities', {}).get(name, False)
+        return bool(self.capabilities.get(name, False))
 
     # === ENTITIES ===
 
     @property
-    def entities(self) -> list:
-        return self._entities
+    def entities(self) -> list[dict[str, Any]]:
+        return cast(list[dict[str, Any]], self._section('entities'))
 
     @property
-    def beliefs(self) -> list:
-        return [e for e in self._entities if e.get('type') == 'belief']
+    def beliefs(self) -> list[dict[str, Any]]:
+        return self.entities_by_type('belief')
 
     @property
-    def threads(self) -> list:
-        return [e for e in self._entities if e.get('type') == 'thread']
+    def threads(self) -> list[dict[str, Any]]:
+        return self.entities_by_type('thread')
 
-    def entity(self, entity_id: str) -> Optional[dict]:
+    def entity(self, entity_id: str) -> Optional[dict[str, Any]]:
         """Get an entity by ID."""
-        for e in self._entities:
-            if e.get('id') == entity_id:
-                return e
-        return None
+        return self._index('entities_by_id', self._build_entities_by_id).get(entity_id)
 
     def believes(self, belief_id: str) -> bool:
         """Check if the brain holds a belief."""
-        full_id = f"belief.{belief_id}" if not belief_id.startswith('belief.') else belief_id
-        return self.entity(full_id) is not None or self.entity(belief_id) is not None
-
-    def belief_confidence(self, belief_id: str) -> Optional[str]:
-        """Get belief confidence level."""
-        full_id = f"belief.{belief_id}" if not belief_id.startswith('belief.') else belief_id
-        belief = self.entity(full_id) or self.entity(belief_id)
-        return belief.get('confidence') if belief else None
-
-    def entities_by_type(self, entity_type: str) -> list:
+        return self._find_belief(belief_id) is not None
+
+    def belief_confidence(self, belief_id: str, stated: bool = False) -> Optional[str]:
+        """
+        Get belief confidence level.
+
+        This is the effective level: the stated confidence moved by the
+        supports/validates and contradicts/challenges edges pointing at the
+        belief (see confidence.py). It equals the stated level when there
+        are none; stated=True always returns the level in entities.yaml.
+        """
+        belief = self._find_belief(belief_id)
+        if belief is None:
+            return None
+        if stated:
+            return belief.get('confidence')
+        return self._index('confidence', self._build_confidence).level(belief['id'])
+
+    def confidence_score(self, entity_id: str) -> Optional[float]:
+        """Effective confidence of any entity as a score in [0, 1]."""
+        return self._index('confidence', self._build_confidence).score(entity_id)
+
+    def entities_by_type(self, entity_type: str) -> list[dict[str, Any]]:
         """Get entities by type."""
-        return [e for e in self._entities if e.get('type') == entity_type]
+        return list(self._index('entities_by_type', self._build_entities_by_type).get(entity_type, ()))
 
-    def entities_by_confidence(self, confidence: str) -> list:
+    def entities_by_confidence(self, confidence: str) -> list[dict[str, Any]]:
         """Get entities by confidence level."""
-        return [e for e in self._entities if e.get('confidence') == confidence]
+        return list(self._index('entities_by_confidence', self._build_entities_by_confidence).get(confidence, ()))
+
+    def _find_belief(self, belief_id: str) -> Optional[dict[str, Any]]:
+        by_id = self._index('entities_by_id', self._build_entities_by_id)
+        full_id = f"belief.{belief_id}" if not belief_id.startswith('belief.') else belief_id
+        return by_id.get(full_id) or by_id.get(belief_id)
 
     # === RELATIONSHIPS ===
 
     @property
-    def relationships(self) -> list:
-        return self._relationships
+    def relationships(self) -> list[dict[str, Any]]:
+        return cast(list[dict[str, Any]], self._section('relationships'))
 
-    def relationships_for(self, entity_id: str) -> list:
+    def relationships_for(self, entity_id: str) -> list[dict[str, Any]]:
         """Get relationships for an entity."""
-        return [
-            r for r in self._relationships
-            if r.get('from') == entity_id or r.get('to') == entity_id
-        ]
+        if self._store is not None:
+            return self._store.relationships_for(entity_id)
+        return list(self._index('relationships_by_entity', self._build_relationships_by_entity).get(entity_id, ()))
 
-    def supports(self, entity_id: str) -> list:
+    def supports(self, entity_id: str) -> list[dict[str, Any]]:
         """Get what supports an entity."""
-        return [
-            r for r in self._relationships
-            if r.get('to') == entity_id and r.get('type') == 'supports'
-        ]
+        return self._relationships_to(entity_id, 'supports')
 
-    def contradicts(self, entity_id: str) -> list:
+    def contradicts(self, entity_id: str) -> list[dict[str, Any]]:
         """Get what contradicts an entity."""
-        return [
-            r for r in self._relationships
-            if r.get('to') == entity_id and r.get('type') == 'contradicts'
-        ]
+        return self._relationships_to(entity_id, 'contradicts')
+
+    def _relationships_to(self, entity_id: str, relationship_type: str) -> list[dict[str, Any]]:
+        if self._store is not None:
+            return self._store.relationships_to(entity_id, relationship_type)
+        relationships_to = self._index('relationships_to', self._build_relationships_to)
+        return list(relationships_to.get((entity_id, relationship_type), ()))
+
+    @property
+    def graph(self) -> RelationshipGraph:
+        """The relationships as a graph, for multi-hop queries (see graph.py)."""
+        return self._index('graph', self._build_graph)
+
+    def all_supporting(self, entity_id: str) -> list[str]:
+        """IDs of everything supporting an entity, directly or through a chain."""
+        return sorted(self.graph.transitive_closure(entity_id, ('supports',), 'in'))
+
+    def support_chain(self, from_id: str, to_id: str) -> Optional[list[dict[str, Any]]]:
+        """Strongest chain of supports relationships from one entity to another."""
+        return self.graph.shortest_path(from_id, to_id, ('supports',))
+
+    # === CONSISTENCY ===
+
+    @property
+    def consistency(self) -> ConsistencyReport:
+        """Dangling edges, support cycles and contradiction loops (see consistency.py)."""
+        return self._index('consistency', self._build_consistency)
+
+    def _check_consistency(self) -> None:
+        report = self.consistency
+        if not report.ok:
+            logger.warning(report.summary())
+
+    # === INDEXES ===
+    # Built on first query by the matching _build_<name> method and reused
+    # afterwards. They assume the loaded lists are not mutated in place;
+    # refresh() drops them with their section (see INDEX_SECTIONS).
+
+    def _index(self, name: str, build: Callable[[], T]) -> T:
+        indexes = self._indexes
+        index = indexes.get(name)
+        if index is None:
+            index = indexes[name] = build()
+        return cast(T, index)
+
+    def _build_entities_by_id(self) -> dict[Optional[str], dict[str, Any]]:
+        by_id: dict[Optional[str], dict[str, Any]] = {}
+        for e in self.entities:
+            # First occurrence wins, matching a front-to-back scan
+            by_id.setdefault(e.get('id'), e)
+        return by_id
+
+    def _build_entities_by_type(self) -> dict[Any, list[dict[str, Any]]]:
+        return _group(self.entities, lambda e: e.get('type'))
+
+    def _build_entities_by_confidence(self) -> dict[Any, list[dict[str, Any]]]:
+        return _group(self.entities, lambda e: e.get('confidence'))
+
+    def _build_relationships_by_entity(self) -> dict[Optional[str], list[dict[str, Any]]]:
+        by_entity: dict[Optional[str], list[dict[str, Any]]] = {}
+        for r in self.relationships:
+            source, target = r.get('from'), r.get('to')
+            by_entity.setdefault(source, []).append(r)
+            if target != source:
+                by_entity.setdefault(target, []).append(r)
+        return by_entity
+
+    def _build_relationships_to(self) -> dict[Any, list[dict[str, Any]]]:
+        return _group(self.relationships, lambda r: (r.get('to'), r.get('type')))
+
+    def _build_confidence(self) -> ConfidenceEngine:
+        return ConfidenceEngine(self.entities, self.relationships)
+
+    def _build_consistency(self) -> ConsistencyReport:
+        entities, relationships = self.entities, self.relationships
+        built: Optional[ConsistencyReport] = self._indexes.get('consistency')
+        if built is not None:
+            return built  # Loading a pending section above ran the check
+        if self._store is None and CONSISTENCY_SECTIONS <= self._signatures.keys():
+            # Loaded from the brain files: reuse the report cached for their contents
+            stamps = {name: self._signatures[name] for name in CONSISTENCY_SECTIONS}
+            return cached_check(entities, relationships, stamps)
+        return check_consistency(entities, relationships)
+
+    def _build_graph(self) -> RelationshipGraph:
+        return RelationshipGraph(self.relationships)
+
+    def _build_network(self) -> Union[NetworkAccessor, StoreNetworkAccessor]:
+        if self._store is not None:
+            return self._store.network()
+        network: dict[str, Any] = self._section('network')
+        return NetworkAccessor(
+            _connections=network.get('connections', []),
+            _stats=network.get('stats', {}),
+        )
 
     # === PREDICTIONS ===
 
     @property
-    def predictions(self) -> list:
-        return self._predictions
+    def predictions(self) -> list[dict[str, Any]]:
+        return cast(list[dict[str, Any]], self._section('predictions'))
 
-    def pending_predictions(self) -> list:
+    def pending_predictions(self) -> list[dict[str, Any]]:
         """Get pending predictions."""
-        return [p for p in self._predictions if p.get('status') == 'pending']
+        return [p for p in self.predictions if p.get('status') == 'pending']
 
-    def predictions_due_before(self, date_str: str) -> list:
+    def predictions_due_before(self, date_str: str) -> list[dict[str, Any]]:
         """Get predictions due before a date."""
         return [
-            p for p in self._predictions
+            p for p in self.predictions
             if p.get('status') == 'pending' and p.get('resolution_date', '') <= date_str
         ]
 
     # === AGENDA ===
 
     @property
-    def agenda(self) -> dict:
-        return self._agenda
+    def agenda(self) -> dict[str, Any]:
+        return cast(dict[str, Any], self._section('agenda'))
 
-    def urgent_agenda_items(self) -> list:
+    def urgent_agenda_items(self) -> list[dict[str, Any]]:
         """Get high-priority agenda items."""
         return [
-            item for item in self._agenda.get('immediate', [])
+            item for item in self.agenda.get('immediate', [])
             if item.get('priority') == 'high'
         ]
 
     # === NETWORK ===
 
     @property
-    def network(self) -> NetworkAccessor:
-        return NetworkAccessor(
-            _connections=self._network_data.get('connections', []),
-            _stats=self._network_data.get('stats', {}),
-        )
+    def network(self) -> Union[NetworkAccessor, StoreNetworkAccessor]:
+        return self._index('network', self._build_network)
 
     # === CONVENIENCE ===
 
     @property
-    def pending_attention(self) -> list:
+    def pending_attention(self) -> list[dict[str, Any]]:
         """Get attention items that need immediate focus."""
-        return self._state.get('pending_attention', [])
+        return cast(list[dict[str, Any]], self.state.get('pending_attention', []))
 
     @property
-    def recent_changes(self) -> list:
+    def recent_changes(self) -> list[dict[str, Any]]:
         """Get recent changes to the brain."""
-        return self._state.get('recent_changes', [])
+        return cast(list[dict[str, Any]], self.state.get('recent_changes', []))
+
+
+def _section_signatures() -> dict[str, Optional[tuple[int, int]]]:
+    # Taken before parsing, so an edit made while loading is seen by refresh()
+    return {name: file_signature(SECTION_FILES[name]) for name in SECTION_LOADERS}
+
+
+def _group(items: list[dict[str, Any]], key: Callable[[dict[str, Any]], Any]) -> dict[Any, list[dict[str, Any]]]:
+    """Group dicts by a key function, preserving input order."""
+    groups: dict[Any, list[dict[str, Any]]] = {}
+    for item in items:
+        groups.setdefault(key(item), []).append(item)
+    return groups
@@ -0,0 +1,133 @@
+"""
+Brain SDK Client
+Thin client for the resident brain server (see server.py)
+
+Sends one query per line over the server's Unix socket and keeps the
+connection open, so a query costs a socket round trip instead of an
+import and a parse. Only the standard library (and orjson, if installed,
+to decode large results) is imported, so scripts that just ask questions
+start fast.
+
+Methods are named by namespace:
+    brain.<name>      Brain methods and properties
+    network.<name>    NetworkAccessor methods and properties
+    analysis.<name>   human layer analyses, when the server registers them
+
+Usage:
+    with BrainClient() as client:
+        client.call('brain.believes', 'distribution-beats-product')
+        client.call('network.domain_matches', 'sales')
+
+    python -m brain.client network.domain_matches sales
+"""
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+# Same directory as loaders.BRAIN_ROOT, without importing the loaders
+DEFAULT_SOCKET_PATH = Path(
+    os.environ.get('BRAIN_SOCKET', Path(__file__).parent.parent.parent.parent / '.cache' / 'brain.sock')
+)
+
+
+class BrainServerError(Exception):
+    """A query failed on the server."""
+
+    def __init__(self, error_type: str, message: str):
+        super().__init__(f"{error_type}: {message}")
+        self.error_type = error_type
+
+
+class BrainClient:
+    """A connection to a brain server."""
+
+    def __init__(self, path: Union[str, Path, None] = None, timeout: Optional[float] = 30.0):
+        self.path = Path(path) if path is not None else DEFAULT_SOCKET_PATH
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._file: Optional[BinaryIO] = None
+
+    def connect(self) -> 'BrainClient':
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(str(self.path))
+            except OSError:
+                sock.close()
+                raise
+            self._sock = sock
+            self._file = sock.makefile('rb')
+        return self
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = self._file = None
+
+    def __enter__(self) -> 'BrainClient':
+        return self.connect()
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Run one query on the server and return its (JSON-decoded) result."""
+        self.connect()
+        assert self._sock is not None and self._file is not None
+        request = {'method': method, 'args': args, 'kwargs': kwargs}
+        self._sock.sendall(json.dumps(request).encode() + b'\n')
+        line = self._file.readline()
+        if not line:
+            self.close()
+            raise ConnectionError("Brain server closed the connection")
+        response = orjson.loads(line) if orjson is not None else json.loads(line)
+        if 'error' in response:
+            raise BrainServerError(response['error']['type'], response['error']['message'])
+        return response['result']
+
+    def ping(self) -> bool:
+        return bool(self.call('server.ping') == 'pong')
+
+
+def _argument(text: str) -> Any:
+    """A CLI argument as JSON if it parses, else as a plain string."""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def main() -> None:
+    """CLI entry point: python -m brain.client METHOD [ARG ...]"""
+    if len(sys.argv) < 2:
+        print("Usage: python -m brain.client METHOD [ARG ...]")
+        print("  e.g. python -m brain.client network.domain_matches sales")
+        sys.exit(2)
+
+    try:
+        with BrainClient() as client:
+            result = client.call(sys.argv[1], *map(_argument, sys.argv[2:]))
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"No brain server at {DEFAULT_SOCKET_PATH} (start one with: python -m brain.server)", file=sys.stderr)
+        sys.exit(1)
+    except BrainServerError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    print(result if isinstance(result, str) else json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
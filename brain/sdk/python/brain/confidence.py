@@ -0,0 +1,256 @@
+"""
+Brain SDK Confidence
+Effective entity confidence propagated over evidence edges
+
+The confidence written in entities.yaml is a prior. Evidence edges in
+relationships.yaml move it: supports and validates raise the target,
+contradicts and challenges lower it, each in proportion to the edge's
+strength and to the current confidence of its source. Per entity:
+
+    evidence  = sum(coefficient * source score) / (1 + sum(|coefficient|))
+    score     = sigmoid(logit(prior) + GAIN * evidence)
+
+evidence stays in (-1, 1) and a score moves by at most GAIN / 4 times
+the change in its sources, so with GAIN < 4 the scores converge even
+around cycles. An entity without incoming evidence keeps its prior, and
+its stated level.
+
+Scores are computed with a worklist: a node is recomputed only when one
+of its sources moved by more than TOLERANCE. A change to one entity or
+edge therefore only touches the part of the graph downstream of it,
+both through the in-place methods (set_entity, add_relationship, ...)
+and through updated(), which Brain.refresh() uses to carry the engine
+over a reload instead of rebuilding it.
+
+Usage:
+    engine = ConfidenceEngine(entities, relationships)
+    engine.score('belief.x')   # 0.0 - 1.0
+    engine.level('belief.x')   # 'speculative' ... 'hardened'
+"""
+
+from __future__ import annotations
+
+import copy
+import math
+from collections import Counter, deque
+from typing import Any, Iterable, Optional, TypeVar
+
+from .graph import edge_weight
+
+# Prior score per stated confidence level, weakest first
+LEVEL_PRIORS = {'speculative': 0.2, 'tentative': 0.4, 'grounded': 0.7, 'hardened': 0.9}
+DEFAULT_PRIOR = 0.5
+
+# Signed coefficient per evidence relationship type (times edge strength)
+EVIDENCE_WEIGHTS = {'supports': 0.7, 'validates': 1.0, 'contradicts': -0.7, 'challenges': -1.0}
+
+GAIN = 2.0
+TOLERANCE = 1e-6
+
+# (source, target, coefficient) of one evidence edge
+Edge = tuple[str, str, float]
+
+T = TypeVar('T')
+
+# Upper score bound per level (all but the strongest): midpoints between
+# neighbouring priors, so a prior maps back to its own level
+_PRIORS = list(LEVEL_PRIORS.items())
+_LEVEL_BOUNDS = [(level, (prior + next_prior) / 2) for (level, prior), (_, next_prior) in zip(_PRIORS, _PRIORS[1:])]
+
+
+def score_level(score: float) -> str:
+    """Confidence level of a score."""
+    for level, bound in _LEVEL_BOUNDS:
+        if score < bound:
+            return level
+    return _PRIORS[-1][0]
+
+
+def _logit(p: float) -> float:
+    p = min(max(p, 1e-9), 1 - 1e-9)
+    return math.log(p / (1 - p))
+
+
+def _sigmoid(x: float) -> float:
+    return 1 / (1 + math.exp(-x))
+
+
+def _edge(relationship: dict[str, Any]) -> Optional[Edge]:
+    """(source, target, coefficient) of an evidence relationship, else None."""
+    kind = relationship.get('type')
+    weight = EVIDENCE_WEIGHTS.get(kind) if isinstance(kind, str) else None
+    source, target = relationship.get('from'), relationship.get('to')
+    if weight is None or source is None or target is None:
+        return None
+    return source, target, weight * edge_weight(relationship)
+
+
+def _set_or_drop(mapping: dict[str, list[T]], key: str, items: list[T]) -> None:
+    if items:
+        mapping[key] = items
+    else:
+        mapping.pop(key, None)
+
+
+class ConfidenceEngine:
+    """Effective confidence of every entity, kept current incrementally."""
+
+    def __init__(self, entities: list[dict[str, Any]], relationships: list[dict[str, Any]]):
+        self._stated: dict[str, Optional[str]] = {}
+        self._evidence: dict[str, list[tuple[str, float]]] = {}  # target -> (source, coefficient)
+        self._dependents: dict[str, list[str]] = {}  # source -> targets, one per edge
+        self._edges: Counter[Edge] = Counter()
+        self._scores: dict[str, float] = {}
+        self.recomputed = 0  # node recomputations so far, for diagnostics
+
+        seeds = set()
+        for entity in entities:
+            entity_id = entity.get('id')
+            if entity_id is not None and entity_id not in self._stated:
+                seeds |= self._set_stated(entity_id, entity.get('confidence'))
+        for relationship in relationships:
+            edge = _edge(relationship)
+            if edge is not None:
+                source, target, coefficient = edge
+                self._edges[edge] += 1
+                self._evidence.setdefault(target, []).append((source, coefficient))
+                self._dependents.setdefault(source, []).append(target)
+                seeds.update((source, target))
+        self._propagate(seeds)
+
+    # === QUERIES ===
+
+    def score(self, entity_id: str) -> Optional[float]:
+        """Effective confidence in [0, 1], or None for an unknown id."""
+        return self._scores.get(entity_id)
+
+    def level(self, entity_id: str) -> Optional[str]:
+        """Effective confidence level; the stated one if no evidence points at the entity."""
+        if entity_id not in self._evidence:
+            return self._stated.get(entity_id)
+        return score_level(self._scores[entity_id])
+
+    @property
+    def scores(self) -> dict[str, float]:
+        return dict(self._scores)
+
+    # === UPDATES ===
+
+    def set_entity(self, entity: dict[str, Any]) -> None:
+        """Add an entity or change its stated confidence."""
+        self._propagate(self._set_stated(entity['id'], entity.get('confidence')))
+
+    def remove_entity(self, entity_id: str) -> None:
+        self._propagate(self._set_stated(entity_id, None, remove=True))
+
+    def add_relationship(self, relationship: dict[str, Any]) -> None:
+        edge = _edge(relationship)
+        if edge is not None:
+            self._propagate(self._link(edge, 1))
+
+    def remove_relationship(self, relationship: dict[str, Any]) -> None:
+        edge = _edge(relationship)
+        if edge is not None and self._edges[edge]:
+            self._propagate(self._link(edge, -1))
+
+    def updated(self, entities: list[dict[str, Any]], relationships: list[dict[str, Any]]) -> ConfidenceEngine:
+        """
+        A copy of the engine for new entity and relationship lists.
+
+        Only what differs from the current lists is applied and propagated;
+        this engine is left untouched, so readers can keep using it.
+        """
+        engine = copy.copy(self)
+        engine._stated = dict(self._stated)
+        engine._evidence = dict(self._evidence)  # lists are replaced, never mutated
+        engine._dependents = dict(self._dependents)
+        engine._edges = Counter(self._edges)
+        engine._scores = dict(self._scores)
+
+        seeds = set()
+        stated: dict[str, Optional[str]] = {}
+        for entity in entities:
+            entity_id = entity.get('id')
+            if entity_id is not None and entity_id not in stated:
+                stated[entity_id] = entity.get('confidence')
+        for entity_id in self._stated.keys() - stated.keys():
+            seeds |= engine._set_stated(entity_id, None, remove=True)
+        for entity_id, level in stated.items():
+            if entity_id not in self._stated or self._stated[entity_id] != level:
+                seeds |= engine._set_stated(entity_id, level)
+
+        edges = Counter(edge for edge in map(_edge, relationships) if edge is not None)
+        if sum(((self._edges - edges) + (edges - self._edges)).values()) > len(edges) // 4:
+            return ConfidenceEngine(entities, relationships)  # Mostly new: cheaper to rebuild
+        for edge, n in (self._edges - edges).items():
+            seeds |= engine._link(edge, -n)
+        for edge, n in (edges - self._edges).items():
+            seeds |= engine._link(edge, n)
+
+        engine._propagate(seeds)
+        return engine
+
+    def _set_stated(self, entity_id: str, level: Optional[str], remove: bool = False) -> set[str]:
+        if remove:
+            self._stated.pop(entity_id, None)
+        else:
+            self._stated[entity_id] = level
+        return {entity_id}
+
+    def _link(self, edge: Edge, n: int) -> set[str]:
+        """Add (n > 0) or remove (n < 0) copies of an edge; returns the nodes to recompute."""
+        source, target, coefficient = edge
+        self._edges[edge] += n
+        if self._edges[edge] <= 0:
+            del self._edges[edge]
+        evidence = list(self._evidence.get(target, ()))
+        dependents = list(self._dependents.get(source, ()))
+        for _ in range(abs(n)):
+            if n > 0:
+                evidence.append((source, coefficient))
+                dependents.append(target)
+            else:
+                evidence.remove((source, coefficient))
+                dependents.remove(target)
+        _set_or_drop(self._evidence, target, evidence)
+        _set_or_drop(self._dependents, source, dependents)
+        return {source, target}
+
+    # === PROPAGATION ===
+
+    def _prior(self, node: str) -> float:
+        level = self._stated.get(node)
+        return LEVEL_PRIORS.get(level, DEFAULT_PRIOR) if level is not None else DEFAULT_PRIOR
+
+    def _compute(self, node: str) -> Optional[float]:
+        if node not in self._stated and node not in self._evidence and node not in self._dependents:
+            return None  # No longer part of the brain
+        evidence = self._evidence.get(node)
+        prior = self._prior(node)
+        if not evidence:
+            return prior
+        total = magnitude = 0.0
+        for source, coefficient in evidence:
+            source_score = self._scores.get(source)
+            total += coefficient * (source_score if source_score is not None else self._prior(source))
+            magnitude += abs(coefficient)
+        return _sigmoid(_logit(prior) + GAIN * total / (1 + magnitude))
+
+    def _propagate(self, seeds: Iterable[str]) -> None:
+        queue = deque(seeds)
+        queued = set(queue)
+        while queue:
+            node = queue.popleft()
+            queued.discard(node)
+            self.recomputed += 1
+            old = self._scores.get(node)
+            new = self._compute(node)
+            if new is None:
+                self._scores.pop(node, None)
+            else:
+                self._scores[node] = new
+            if old is None or new is None or abs(new - old) > TOLERANCE:
+                for target in self._dependents.get(node, ()):
+                    if target not in queued:
+                        queued.add(target)
+                        queue.append(target)
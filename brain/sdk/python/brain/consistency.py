@@ -0,0 +1,243 @@
+"""
+Brain SDK Consistency
+Structural checks of graph/relationships.yaml against graph/entities.yaml
+
+Reports:
+    - dangling edges: relationships naming an entity id that entities.yaml
+      does not define (an empty endpoint, as in open suggestions, is fine);
+    - support cycles: strongly connected components of the supports and
+      validates edges, i.e. ideas that end up supporting themselves;
+    - contradiction loops: contradicts/challenges edges between entities
+      where one supports the other, directly or through a chain of
+      supports/validates edges (a support cycle included).
+
+Integrity is a set lookup per endpoint and cycles come from one
+iterative Tarjan pass, both linear in entities + relationships. A
+contradiction outside a support cycle costs one search for a support
+chain between its endpoints, pruned by the components' topological
+order to the part of the graph that lies between them.
+
+Brain.load() runs the check (a lazy or store-backed brain once it has
+both sections) and keeps the report in a cache keyed on the two files'
+content hashes (with the snapshot cache's mtime/size fast path), so an
+unchanged brain only pays a stat and a small pickle read.
+
+Usage:
+    report = check_consistency(entities, relationships)
+    if not report.ok:
+        print(report.summary())
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional, cast
+
+from . import loaders
+from .loaders import SECTION_FILES
+
+SUPPORT_TYPES = frozenset({'supports', 'validates'})
+CONTRADICTION_TYPES = frozenset({'contradicts', 'challenges'})
+
+CACHE_NAME = 'consistency.pickle'
+
+
+@dataclass(frozen=True)
+class ConsistencyReport:
+    """Structural problems found in the relationship graph."""
+
+    dangling: list[dict[str, Any]] = field(default_factory=list)  # relationship, from, to, missing
+    cycles: list[list[str]] = field(default_factory=list)  # entity ids per support cycle
+    contradiction_loops: list[dict[str, Any]] = field(default_factory=list)  # relationship, type, from, to
+
+    @property
+    def ok(self) -> bool:
+        return not (self.dangling or self.cycles or self.contradiction_loops)
+
+    def summary(self) -> str:
+        if self.ok:
+            return "Brain graph is consistent"
+        lines = [
+            f"Brain graph: {len(self.dangling)} dangling edges, {len(self.cycles)} support cycles, "
+            f"{len(self.contradiction_loops)} contradiction loops"
+        ]
+        for d in self.dangling[:5]:
+            lines.append(f"  dangling {d['relationship']}: unknown {', '.join(d['missing'])}")
+        for cycle in self.cycles[:5]:
+            lines.append(f"  cycle: {' -> '.join(cycle)}")
+        for loop in self.contradiction_loops[:5]:
+            lines.append(f"  contradiction {loop['relationship']}: {loop['from']} {loop['type']} {loop['to']}")
+        return "\n".join(lines)
+
+
+def strongly_connected_components(nodes: Iterable[str], successors: dict[str, list[str]]) -> list[list[str]]:
+    """Tarjan's algorithm, iterative so deep chains cannot overflow the stack."""
+    index: dict[str, int] = {}
+    low: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    components = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors.get(root, ())))]
+        while work:
+            node, pending = work[-1]
+            for successor in pending:
+                if successor not in index:
+                    index[successor] = low[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(successors.get(successor, ()))))
+                    break
+                if successor in on_stack and index[successor] < low[node]:
+                    low[node] = index[successor]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component[::-1])
+    return components
+
+
+def _supports(source: str, target: str, supports: dict[str, list[str]], order: dict[str, int]) -> bool:
+    """
+    Whether a chain of support edges leads from source to target.
+
+    order numbers the support components sinks first (Tarjan's output
+    order), so nothing numbered below target's component can lead to it
+    and the search never goes there.
+    """
+    floor = order[target]
+    seen = {source}
+    stack = [source]
+    while stack:
+        for successor in supports.get(stack.pop(), ()):
+            if successor == target:
+                return True
+            if successor not in seen and order[successor] >= floor:
+                seen.add(successor)
+                stack.append(successor)
+    return False
+
+
+def check_consistency(entities: list[dict[str, Any]], relationships: list[dict[str, Any]]) -> ConsistencyReport:
+    """Find dangling edges, support cycles and contradiction loops."""
+    known = {e.get('id') for e in entities}
+
+    dangling = []
+    supports: dict[str, list[str]] = {}
+    self_supporting: set[str] = set()
+    contradictions = []
+    for r in relationships:
+        source, target = r.get('from'), r.get('to')
+        missing = [e for e in (source, target) if e is not None and e not in known]
+        if missing:
+            dangling.append({'relationship': r.get('id'), 'from': source, 'to': target, 'missing': missing})
+        if source is None or target is None:
+            continue
+        kind = r.get('type')
+        if kind in SUPPORT_TYPES:
+            supports.setdefault(source, []).append(target)
+            if source == target:
+                self_supporting.add(source)
+        elif kind in CONTRADICTION_TYPES:
+            contradictions.append(r)
+
+    order: dict[str, int] = {}
+    cycles = []
+    for number, component in enumerate(strongly_connected_components(supports, supports)):
+        for member in component:
+            order[member] = number
+        if len(component) > 1 or component[0] in self_supporting:
+            cycles.append(component)
+
+    loops = []
+    for r in contradictions:
+        source, target = r['from'], r['to']
+        if source == target:
+            looped = True
+        elif source not in order or target not in order:
+            looped = False  # Not part of any support chain
+        elif order[source] == order[target]:
+            looped = True  # Same support cycle
+        elif order[source] > order[target]:
+            looped = _supports(source, target, supports, order)
+        else:
+            looped = _supports(target, source, supports, order)
+        if looped:
+            loops.append({'relationship': r.get('id'), 'type': r.get('type'), 'from': source, 'to': target})
+
+    return ConsistencyReport(dangling=dangling, cycles=cycles, contradiction_loops=loops)
+
+
+# === CACHE ===
+
+
+def _stamps() -> Optional[dict[str, tuple[int, int]]]:
+    stamps = {}
+    for name in ('entities', 'relationships'):
+        signature = loaders.file_signature(SECTION_FILES[name])
+        if signature is None:
+            return None
+        stamps[name] = signature
+    return stamps
+
+
+def _hashes() -> dict[str, str]:
+    return {
+        name: hashlib.sha256((loaders.BRAIN_ROOT / SECTION_FILES[name]).read_bytes()).hexdigest()
+        for name in ('entities', 'relationships')
+    }
+
+
+def cached_check(
+    entities: list[dict[str, Any]],
+    relationships: list[dict[str, Any]],
+    stamps: dict[str, Optional[tuple[int, int]]],
+) -> ConsistencyReport:
+    """
+    check_consistency() for the brain's own files, cached on their hashes.
+
+    stamps are the two files' signatures taken before entities and
+    relationships were parsed from them. If the files changed since, the
+    report is computed but not cached: their hashes would no longer
+    describe what was checked.
+    """
+    if None in stamps.values() or not loaders.SNAPSHOTS_ENABLED:
+        return check_consistency(entities, relationships)
+
+    cache_path = loaders.SNAPSHOT_DIR / CACHE_NAME
+    record = loaders._read_snapshot(cache_path)
+    if record and record['stamps'] == stamps:
+        return cast(ConsistencyReport, record['report'])
+
+    hashes = _hashes()
+    if _stamps() != stamps:
+        return check_consistency(entities, relationships)  # Edited since parsing
+    if record and record['hashes'] == hashes:
+        report = cast(ConsistencyReport, record['report'])  # Touched but not changed: re-stamp only
+    else:
+        report = check_consistency(entities, relationships)
+    loaders._write_snapshot(cache_path, {
+        'version': loaders.SNAPSHOT_VERSION,
+        'stamps': stamps,
+        'hashes': hashes,
+        'report': report,
+    })
+    return report
@@ -0,0 +1,227 @@
+"""
+Brain SDK Graph
+Adjacency-list engine over graph/relationships.yaml
+
+Relationships are directed edges `from -> to` (A supports B is A -> B).
+RelationshipGraph indexes them once into out- and in-adjacency lists, so
+a traversal touches only the edges it follows instead of rescanning the
+relationship list per hop. Brain.graph builds it on first use and drops
+it (with its cached closures) when relationships.yaml is reloaded.
+
+Traversals take `types` (relationship types to follow; None for all) and
+`direction`: 'out' follows edges forward, 'in' backward and 'both' either
+way. Everything transitively supporting X is a backward closure:
+
+    graph = brain.graph
+    graph.transitive_closure('belief.x', types=('supports',), direction='in')
+    graph.shortest_path('belief.a', 'belief.b', types=('supports',))
+    graph.bfs(graph.endpoints(('contradicts',)), direction='both', max_depth=3)
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from itertools import count
+from typing import Any, Iterable, Iterator, Literal, Optional, Union
+
+Direction = Literal['out', 'in', 'both']
+
+# Weight in (0, 1] per relationship strength; numeric strengths are on a 1-10 scale
+STRENGTH_WEIGHTS = {'strong': 1.0, 'moderate': 0.6, 'medium': 0.6, 'weak': 0.3}
+DEFAULT_WEIGHT = 0.5
+
+
+def edge_weight(relationship: dict[str, Any]) -> float:
+    """How strongly a relationship holds, from its strength field."""
+    strength = relationship.get('strength')
+    if isinstance(strength, (int, float)) and not isinstance(strength, bool):
+        return min(max(strength / 10, 0.1), 1.0)
+    if isinstance(strength, str):
+        return STRENGTH_WEIGHTS.get(strength, DEFAULT_WEIGHT)
+    return DEFAULT_WEIGHT
+
+
+def _type_set(types: Optional[Iterable[str]]) -> Optional[frozenset[str]]:
+    if types is None:
+        return None
+    return frozenset([types] if isinstance(types, str) else types)
+
+
+class RelationshipGraph:
+    """Directed multigraph of relationships with traversal and path queries."""
+
+    def __init__(self, relationships: list[dict[str, Any]]):
+        self._out: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        self._in: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        for r in relationships:
+            source, target = r.get('from'), r.get('to')
+            if source is None or target is None:
+                continue
+            self._out.setdefault(source, []).append((target, r))
+            self._in.setdefault(target, []).append((source, r))
+        self._closures: dict[tuple[str, Optional[frozenset[str]], Direction], frozenset[str]] = {}
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._out or node in self._in
+
+    @property
+    def nodes(self) -> set[str]:
+        """Every entity id appearing in a relationship."""
+        return self._out.keys() | self._in.keys()
+
+    def edges(
+        self,
+        node: str,
+        types: Optional[Iterable[str]] = None,
+        direction: Direction = 'out',
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """(neighbor, relationship) pairs of node's edges."""
+        return self._edges(node, _type_set(types), direction)
+
+    def _edges(
+        self,
+        node: str,
+        types: Optional[frozenset[str]],
+        direction: Direction,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        if direction not in ('out', 'in', 'both'):
+            raise ValueError(f"Unknown direction: {direction}")
+        if direction != 'in':
+            for neighbor, r in self._out.get(node, ()):
+                if types is None or r.get('type') in types:
+                    yield neighbor, r
+        if direction != 'out':
+            for neighbor, r in self._in.get(node, ()):
+                if types is None or r.get('type') in types:
+                    yield neighbor, r
+
+    def neighbors(
+        self,
+        node: str,
+        types: Optional[Iterable[str]] = None,
+        direction: Direction = 'out',
+    ) -> list[str]:
+        """Distinct neighbors of node, in edge order."""
+        return list(dict.fromkeys(n for n, _ in self._edges(node, _type_set(types), direction)))
+
+    def endpoints(self, types: Optional[Iterable[str]] = None) -> set[str]:
+        """Every node touching an edge of the given types."""
+        types = _type_set(types)
+        return {
+            node
+            for source, edges in self._out.items()
+            for target, r in edges
+            if types is None or r.get('type') in types
+            for node in (source, target)
+        }
+
+    # === TRAVERSAL ===
+
+    def bfs(
+        self,
+        start: Union[str, Iterable[str]],
+        types: Optional[Iterable[str]] = None,
+        direction: Direction = 'out',
+        max_depth: Optional[int] = None,
+    ) -> dict[str, int]:
+        """Nodes reachable from start (one id or several), with their hop count, in BFS order."""
+        types = _type_set(types)
+        starts = [start] if isinstance(start, str) else list(start)
+        depths = dict.fromkeys(starts, 0)
+        queue = deque(starts)
+        while queue:
+            node = queue.popleft()
+            depth = depths[node]
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for neighbor, _ in self._edges(node, types, direction):
+                if neighbor not in depths:
+                    depths[neighbor] = depth + 1
+                    queue.append(neighbor)
+        return depths
+
+    def dfs(
+        self,
+        start: str,
+        types: Optional[Iterable[str]] = None,
+        direction: Direction = 'out',
+    ) -> list[str]:
+        """Nodes reachable from start in depth-first preorder (edges in file order)."""
+        types = _type_set(types)
+        seen = {start}
+        order = [start]
+        stack = [self._edges(start, types, direction)]
+        while stack:
+            for neighbor, _ in stack[-1]:
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    order.append(neighbor)
+                    stack.append(self._edges(neighbor, types, direction))
+                    break
+            else:
+                stack.pop()
+        return order
+
+    def transitive_closure(
+        self,
+        node: str,
+        types: Optional[Iterable[str]] = ('supports',),
+        direction: Direction = 'out',
+    ) -> frozenset[str]:
+        """
+        Every node reachable from node over one or more edges (cached).
+
+        node itself is included only if it lies on a cycle.
+        """
+        types = _type_set(types)
+        key = (node, types, direction)
+        closure = self._closures.get(key)
+        if closure is None:
+            reached = self.bfs(self.neighbors(node, types, direction), types, direction)
+            closure = self._closures[key] = frozenset(reached)
+        return closure
+
+    # === PATHS ===
+
+    def shortest_path(
+        self,
+        source: str,
+        target: str,
+        types: Optional[Iterable[str]] = None,
+        direction: Direction = 'out',
+    ) -> Optional[list[dict[str, Any]]]:
+        """
+        The strongest chain of relationships from source to target.
+
+        Dijkstra with each edge costing 1 / its strength weight, so a chain
+        of strong edges beats a shorter one through weak edges. Returns the
+        relationships along the path ([] if source is target), or None if
+        target is unreachable.
+        """
+        types = _type_set(types)
+        if source == target:
+            return []
+        best = {source: 0.0}
+        came_from: dict[str, tuple[str, dict[str, Any]]] = {}
+        tie = count()
+        heap = [(0.0, next(tie), source)]
+        done = set()
+        while heap:
+            cost, _, node = heapq.heappop(heap)
+            if node in done:
+                continue
+            if node == target:
+                path = []
+                while node != source:
+                    node, r = came_from[node]
+                    path.append(r)
+                return path[::-1]
+            done.add(node)
+            for neighbor, r in self._edges(node, types, direction):
+                new_cost = cost + 1.0 / edge_weight(r)
+                if new_cost < best.get(neighbor, float('inf')):
+                    best[neighbor] = new_cost
+                    came_from[neighbor] = (node, r)
+                    heapq.heappush(heap, (new_cost, next(tie), neighbor))
+        return None
@@ -1,71 +1,212 @@
 """
 Brain SDK Loaders
 Functions to load YAML/JSON brain data
+
+Files are parsed by the fastest available backend (see backends.py).
+Parsed files are cached as compiled snapshots (pickles) under
+``<brain>/.cache/snapshots``. A snapshot is reused while the source file's
+mtime and size are unchanged; if those drift but the content hash still
+matches, the snapshot is re-stamped instead of re-parsed. Set
+``BRAIN_SNAPSHOTS=0`` to always parse from source.
 """
 
-import json
+import hashlib
+import os
+import pickle
+import tempfile
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, Callable, Optional, TypeVar, Union
 
-import yaml
+from . import backends
 
 T = TypeVar('T')
 
 # Find brain root (go up from sdk/python/brain to brain/)
 BRAIN_ROOT = Path(__file__).parent.parent.parent.parent
 
+# Compiled snapshot cache
+SNAPSHOT_DIR = Path(os.environ.get('BRAIN_SNAPSHOT_DIR', BRAIN_ROOT / '.cache' / 'snapshots'))
+SNAPSHOT_VERSION = 1
+SNAPSHOTS_ENABLED = os.environ.get('BRAIN_SNAPSHOTS', '1') != '0'
+
+
+# Brain section -> file it is loaded from
+SECTION_FILES = {
+    'state': 'state.json',
+    'entities': 'graph/entities.yaml',
+    'relationships': 'graph/relationships.yaml',
+    'predictions': 'graph/predictions.yaml',
+    'agenda': 'agenda.yaml',
+    'network': 'human/network.yaml',
+}
+
 
 def get_brain_root() -> Path:
     """Get the brain root directory."""
     return BRAIN_ROOT
 
 
-def load_yaml(relative_path: str) -> Any:
-    """Load a YAML file from the brain directory."""
+def _resolve(relative_path: str) -> Path:
     full_path = BRAIN_ROOT / relative_path
     if not full_path.exists():
         raise FileNotFoundError(f"Brain file not found: {full_path}")
-    with open(full_path, 'r') as f:
-        return yaml.safe_load(f)
+    return full_path
+
+
+def file_signature(relative_path: str) -> Optional[tuple[int, int]]:
+    """(mtime_ns, size) of a brain file, or None if it does not exist."""
+    try:
+        stat = (BRAIN_ROOT / relative_path).stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _snapshot_path(full_path: Path) -> Path:
+    try:
+        name = full_path.resolve().relative_to(BRAIN_ROOT.resolve()).as_posix().replace('/', '__')
+    except ValueError:
+        # Outside the brain: key on the absolute path
+        digest = hashlib.sha1(str(full_path.resolve()).encode()).hexdigest()[:16]
+        name = f'_ext__{digest}__{full_path.name}'
+    return SNAPSHOT_DIR / (name + '.pickle')
+
+
+def _read_snapshot(path: Path) -> Optional[dict[str, Any]]:
+    """Read a snapshot record, treating any corruption as a cache miss."""
+    try:
+        with open(path, 'rb') as f:
+            record = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if not isinstance(record, dict) or record.get('version') != SNAPSHOT_VERSION:
+        return None
+    return record
+
+
+def _write_snapshot(path: Path, record: dict[str, Any]) -> None:
+    """Atomically write a snapshot record. Failures are non-fatal."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+def load_cached(
+    relative_path: str,
+    parse: Callable[[bytes], Any],
+    use_snapshot: Optional[bool] = None,
+) -> Any:
+    """
+    Load a brain file through the snapshot cache.
+
+    `parse` turns the raw file bytes into Python data and is only called
+    when no valid snapshot exists for the current file contents.
+    """
+    return _load_path(_resolve(relative_path), parse, use_snapshot)
+
+
+def _load_path(full_path: Path, parse: Callable[[bytes], Any], use_snapshot: Optional[bool]) -> Any:
+    if use_snapshot is None:
+        use_snapshot = SNAPSHOTS_ENABLED
+    if not use_snapshot:
+        return parse(full_path.read_bytes())
+
+    snap_path = _snapshot_path(full_path)
+    stat = full_path.stat()
+    record = _read_snapshot(snap_path)
+
+    # Fast path: file untouched since the snapshot was taken
+    if record and record['mtime_ns'] == stat.st_mtime_ns and record['size'] == stat.st_size:
+        return record['data']
+
+    raw = full_path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    if record and record['sha256'] == digest:
+        # Touched but not changed (checkout, copy): re-stamp only
+        data = record['data']
+    else:
+        data = parse(raw)
+
+    _write_snapshot(snap_path, {
+        'version': SNAPSHOT_VERSION,
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'sha256': digest,
+        'data': data,
+    })
+    return data
+
+
+def load_file(path: Union[str, Path], use_snapshot: Optional[bool] = None, backend: Optional[str] = None) -> Any:
+    """
+    Load any YAML/JSON file (not just brain-relative ones) through the
+    parser backends and snapshot cache. Used by the human-layer analyses.
+    """
+    full_path = Path(path)
+    if not full_path.exists():
+        raise FileNotFoundError(f"Brain file not found: {full_path}")
+    return _load_path(full_path, backends.parser(backends.format_for(full_path), backend), use_snapshot)
+
 
+def clear_snapshots() -> int:
+    """Delete all compiled snapshots. Returns the number removed."""
+    removed = 0
+    if SNAPSHOT_DIR.exists():
+        for path in SNAPSHOT_DIR.glob('*.pickle'):
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
 
-def load_json(relative_path: str) -> Any:
+
+def load_yaml(relative_path: str, use_snapshot: Optional[bool] = None, backend: Optional[str] = None) -> Any:
+    """Load a YAML file from the brain directory."""
+    return load_cached(relative_path, backends.parser('yaml', backend), use_snapshot)
+
+
+def load_json(relative_path: str, use_snapshot: Optional[bool] = None, backend: Optional[str] = None) -> Any:
     """Load a JSON file from the brain directory."""
-    full_path = BRAIN_ROOT / relative_path
-    if not full_path.exists():
-        raise FileNotFoundError(f"Brain file not found: {full_path}")
-    with open(full_path, 'r') as f:
-        return json.load(f)
+    return load_cached(relative_path, backends.parser('json', backend), use_snapshot)
 
 
-def load_entities() -> list:
+def load_entities() -> list[dict[str, Any]]:
     """Load all entities from the graph."""
-    data = load_yaml('graph/entities.yaml')
+    data = load_yaml(SECTION_FILES['entities'])
     return data.get('entities', []) if data else []
 
 
-def load_relationships() -> list:
+def load_relationships() -> list[dict[str, Any]]:
     """Load all relationships from the graph."""
-    data = load_yaml('graph/relationships.yaml')
+    data = load_yaml(SECTION_FILES['relationships'])
     return data.get('relationships', []) if data else []
 
 
-def load_predictions() -> list:
+def load_predictions() -> list[dict[str, Any]]:
     """Load all predictions from the graph."""
-    data = load_yaml('graph/predictions.yaml')
+    data = load_yaml(SECTION_FILES['predictions'])
     return data.get('predictions', []) if data else []
 
 
-def load_agenda() -> dict:
+def load_agenda() -> dict[str, Any]:
     """Load the agenda."""
-    return load_yaml('agenda.yaml') or {}
+    return load_yaml(SECTION_FILES['agenda']) or {}
 
 
-def load_network() -> dict:
+def load_network() -> dict[str, Any]:
     """Load the network."""
-    return load_yaml('human/network.yaml') or {'connections': []}
+    return load_yaml(SECTION_FILES['network']) or {'connections': []}
 
 
-def load_state() -> dict:
+def load_state() -> dict[str, Any]:
     """Load the brain state."""
-    return load_json('state.json')
+    state: dict[str, Any] = load_json(SECTION_FILES['state'])
+    return state
@@ -0,0 +1,66 @@
+"""
+Brain SDK Search
+Trigram index for case-insensitive substring queries
+"""
+
+from typing import Iterable, Optional
+
+
+class SubstringIndex:
+    """
+    Answers `query.lower() in text.lower()` over a fixed list of texts.
+
+    Every lowercased text is broken into trigrams with a posting list of
+    the texts containing each one. A query of three or more characters
+    intersects the postings of its own trigrams and only verifies the
+    surviving candidates, so results are identical to a linear substring
+    scan. Shorter queries fall back to scanning the pre-lowercased texts.
+    A text of None never matches, not even the empty query.
+
+    Usage:
+        index = SubstringIndex(['Jane Doe', 'John Smith'])
+        index.find('jo')  # -> [1]
+    """
+
+    GRAM = 3
+
+    def __init__(self, texts: Iterable[Optional[str]]):
+        self._texts = [text.lower() if text is not None else None for text in texts]
+        self._postings: dict[str, list[int]] = {}
+
+        n = self.GRAM
+        for position, text in enumerate(self._texts):
+            if text is None:
+                continue
+            for gram in {text[i:i + n] for i in range(len(text) - n + 1)}:
+                self._postings.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def find(self, query: str) -> list[int]:
+        """Positions of texts containing query, in ascending order."""
+        query = query.lower()
+        n = self.GRAM
+
+        if len(query) < n:
+            return [i for i, text in enumerate(self._texts) if text is not None and query in text]
+
+        postings = []
+        for gram in {query[i:i + n] for i in range(len(query) - n + 1)}:
+            posting = self._postings.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+        if len(postings) == 1 and len(query) == n:
+            return postings[0][:]
+        # Candidates share a trigram with the query, so their text is never None
+        return sorted(i for i in candidates if query in (self._texts[i] or ''))
@@ -0,0 +1,189 @@
+"""
+Brain SDK Server
+Resident brain process answering queries over a Unix socket
+
+Parsing and indexing the brain costs far more than any single query, and
+a CLI call or agent script pays it on every run. BrainServer loads the
+brain once, parses every section and builds its indexes up front (see
+Brain.warm()), keeps them current with Brain.watch() and answers queries
+from any number of concurrent clients (one thread per connection; reads
+never block on a reload, which swaps sections in whole - see
+Brain.refresh()).
+
+Protocol: one JSON object per line each way.
+    -> {"method": "network.domain_matches", "args": ["sales"], "kwargs": {}}
+    <- {"result": [...]}  or  {"error": {"type": "...", "message": "..."}}
+
+`brain.<name>` and `network.<name>` resolve to public Brain and
+NetworkAccessor methods and properties at call time, so queries always
+see the current data. Other methods (e.g. the human layer analyses) are
+added with register(). Results are sent as JSON (encoded with orjson when
+it is installed): dates become ISO strings and dataclasses become objects.
+
+Usage:
+    python -m brain.server [--socket PATH] [--interval SECONDS]
+
+    with BrainClient() as client:  # see client.py
+        client.call('brain.urgent_agenda_items')
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import os
+import socket
+import socketserver
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from .brain import Brain
+from .client import DEFAULT_SOCKET_PATH
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+# Public Brain attributes that are not queries
+NOT_QUERIES = frozenset({'load', 'aload', 'from_store', 'watch', 'warm'})
+
+
+def _encode(value: Any) -> Any:
+    """json.dumps default= hook for the non-JSON types queries return."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _dumps(response: dict[str, Any]) -> bytes:
+    """One response line; orjson (when installed) encodes large results several times faster."""
+    if orjson is not None:
+        return orjson.dumps(response, default=_encode, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+    return json.dumps(response, default=_encode).encode() + b'\n'
+
+
+class _QueryHandler(socketserver.StreamRequestHandler):
+    """Answers the queries of one client connection until it disconnects."""
+
+    server: BrainServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                result = self.server.call(
+                    request['method'], *request.get('args', ()), **request.get('kwargs', {}),
+                )
+                response = _dumps({'result': result})
+            except Exception as e:
+                response = _dumps({'error': {'type': type(e).__name__, 'message': str(e)}})
+            self.wfile.write(response)
+
+
+class BrainServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serves one in-memory Brain (plus registered methods) on a Unix socket."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        brain: Optional[Brain] = None,
+        interval: Optional[float] = 1.0,
+    ):
+        self.path = Path(path) if path is not None else DEFAULT_SOCKET_PATH
+        self.brain = brain if brain is not None else Brain.load()
+        self.methods: dict[str, Callable[..., Any]] = {'server.ping': lambda: 'pong'}
+        self.warm()
+
+        self._remove_stale_socket()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(self.path), _QueryHandler)
+        os.chmod(self.path, 0o600)
+
+        # interval=None: no file watching; call brain.refresh() yourself
+        self.watcher = self.brain.watch(interval, lambda changed: self.warm()) if interval else None
+
+    def _remove_stale_socket(self) -> None:
+        if not self.path.exists():
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.path))
+        except ConnectionRefusedError:
+            self.path.unlink()  # Left behind by a server that died
+        else:
+            raise RuntimeError(f"A brain server is already listening on {self.path}")
+        finally:
+            probe.close()
+
+    def warm(self) -> None:
+        """Load every section and build every derived index now rather than on the first query."""
+        self.brain.warm()
+
+    def register(self, name: str, function: Callable[..., Any]) -> None:
+        """Serve function as method `name` (e.g. 'analysis.quick_summary')."""
+        self.methods[name] = function
+
+    def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        function = self.methods.get(method)
+        if function is not None:
+            return function(*args, **kwargs)
+
+        namespace, _, name = method.partition('.')
+        target: Optional[object]
+        if namespace == 'brain' and name not in NOT_QUERIES:
+            target = self.brain
+        elif namespace == 'network':
+            target = self.brain.network
+        else:
+            target = None
+        if target is None or not name or name.startswith('_') or not hasattr(type(target), name):
+            raise LookupError(f"Unknown method: {method}")
+
+        value = getattr(target, name)
+        if callable(value):
+            return value(*args, **kwargs)
+        if args or kwargs:
+            raise TypeError(f"{method} is a property and takes no arguments")
+        return value
+
+    def server_close(self) -> None:
+        if self.watcher is not None:
+            self.watcher.stop()
+        super().server_close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def serve(server: BrainServer) -> None:
+    """Run server until interrupted, then remove its socket."""
+    print(f"Brain server listening on {server.path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Serve brain queries over a Unix socket")
+    parser.add_argument("--socket", type=Path, default=None, help=f"socket path (default: {DEFAULT_SOCKET_PATH})")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between file change checks (0: never)")
+    args = parser.parse_args()
+    serve(BrainServer(args.socket, interval=args.interval))
+
+
+if __name__ == '__main__':
+    main()
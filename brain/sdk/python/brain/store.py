@@ -0,0 +1,517 @@
+"""
+Brain SDK Store
+Optional SQLite storage engine for the brain
+
+The YAML/JSON files stay the human-editable source: import_yaml() loads
+them into one SQLite database and export_yaml() writes them back. Records
+(entities, relationships, predictions, agenda items, connections and
+interactions) become indexed rows, so queries such as relationships_for(),
+network domain/text search and stale-relationship checks run as SQL
+instead of Python scans over the full lists.
+
+Each row keeps its full record (pickled) next to the indexed columns, so
+records come back exactly as they were parsed. The rest of each document
+is kept whole. Connection text search uses an FTS5 trigram index when
+SQLite provides one, and a plain table scan otherwise.
+
+A store can be shared between threads (e.g. the brain server's client
+threads and its watcher): its one connection is used under a lock, and a
+re-import holds it for each file's transaction, so readers wait for the
+commit instead of seeing a half-rebuilt table.
+
+Only sqlite3 from the standard library is needed.
+
+Usage:
+    store = BrainStore()
+    store.import_yaml()  # only files changed since the last import
+    brain = Brain.from_store(store)
+    brain.network.domain_matches('sales')
+    store.export_yaml()  # write the files back (comments are not kept)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+import yaml
+
+from . import backends
+from .loaders import BRAIN_ROOT
+
+DEFAULT_STORE_PATH = Path(os.environ.get('BRAIN_STORE', BRAIN_ROOT / 'brain.db'))
+SCHEMA_VERSION = 1
+
+# Searchable connection fields (as in NetworkAccessor.SEARCH_FIELDS); list
+# fields are indexed element-wise
+SCALAR_TEXT_FIELDS = ('name', 'company', 'position')
+LIST_TEXT_FIELDS = ('domains', 'can_ask_for')
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+def _last_touch(conn: dict[str, Any]) -> Optional[str]:
+    return _text(conn.get('last_contact') or conn.get('last_message'))
+
+
+@dataclass(frozen=True)
+class Table:
+    """A record table: indexed columns computed from each record."""
+
+    name: str
+    columns: dict[str, Callable[[dict[str, Any]], Any]]
+    indexes: tuple[tuple[str, ...], ...] = ()
+
+
+@dataclass(frozen=True)
+class Source:
+    """A brain file and where its records live in the store."""
+
+    name: str
+    path: str  # relative to the brain root
+    table: Optional[Table] = None
+    record_keys: Optional[tuple[str, ...]] = None  # top-level record lists; None = all of them
+
+
+TABLES = {
+    'entities': Table('entities', {
+        'id': lambda r: r.get('id'),
+        'type': lambda r: r.get('type'),
+        'confidence': lambda r: r.get('confidence'),
+    }, (('id',), ('type',), ('confidence',))),
+    'relationships': Table('relationships', {
+        'id': lambda r: r.get('id'),
+        'type': lambda r: r.get('type'),
+        'src': lambda r: r.get('from'),
+        'dst': lambda r: r.get('to'),
+        'strength': lambda r: r.get('strength'),
+    }, (('src',), ('dst', 'type'))),
+    'predictions': Table('predictions', {
+        'id': lambda r: r.get('id'),
+        'status': lambda r: r.get('status'),
+    }, (('status',),)),
+    'agenda_items': Table('agenda_items', {
+        'id': lambda r: r.get('id'),
+        'priority': lambda r: r.get('priority'),
+    }, (('section', 'priority'),)),
+    'connections': Table('connections', {
+        'id': lambda r: r.get('id'),
+        'relationship_strength': lambda r: r.get('relationship_strength'),
+        'trust_level': lambda r: r.get('trust_level'),
+        'energy': lambda r: r.get('energy'),
+        'last_touch': _last_touch,
+    }, (('id',), ('relationship_strength', 'last_touch'), ('trust_level',), ('energy',))),
+    'interactions': Table('interactions', {
+        'id': lambda r: r.get('id'),
+        'date': lambda r: _text(r.get('date')),
+        'with_id': lambda r: _text(r.get('with')),
+    }, (('with_id',), ('date',))),
+}
+
+SOURCES = {
+    source.name: source for source in (
+        Source('state', 'state.json'),
+        Source('entities', 'graph/entities.yaml', TABLES['entities'], ('entities',)),
+        Source('relationships', 'graph/relationships.yaml', TABLES['relationships'], ('relationships',)),
+        Source('predictions', 'graph/predictions.yaml', TABLES['predictions'], ('predictions',)),
+        Source('agenda', 'agenda.yaml', TABLES['agenda_items']),
+        Source('network', 'human/network.yaml', TABLES['connections'], ('connections',)),
+        Source('interactions', 'human/interactions.yaml', TABLES['interactions'], ('interactions',)),
+        Source('goals', 'human/goals.yaml'),
+    )
+}
+
+# Brain section -> document -> section data, mirroring the file loaders
+SECTIONS: dict[str, Callable[[Optional[Any]], Any]] = {
+    'state': lambda doc: doc,
+    'entities': lambda doc: doc.get('entities', []) if doc else [],
+    'relationships': lambda doc: doc.get('relationships', []) if doc else [],
+    'predictions': lambda doc: doc.get('predictions', []) if doc else [],
+    'agenda': lambda doc: doc or {},
+    'network': lambda doc: doc or {'connections': []},
+    'interactions': lambda doc: doc or {'interactions': []},
+    'goals': lambda doc: doc or {},
+}
+
+
+def _is_record_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+
+
+class BrainStore:
+    """SQLite-backed brain storage with YAML import/export."""
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path) if path is not None else DEFAULT_STORE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.RLock()  # held for every use of _db
+        self._fts = self._create_schema()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> BrainStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # === SCHEMA ===
+
+    def _create_schema(self) -> bool:
+        """Create missing tables. Returns True if text search uses FTS5."""
+        db = self._db
+        version = db.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise RuntimeError(f"Unsupported brain store schema version {version}: {self.path}")
+
+        with db:
+            db.execute('CREATE TABLE IF NOT EXISTS documents (name TEXT PRIMARY KEY, data BLOB NOT NULL)')
+            db.execute('CREATE TABLE IF NOT EXISTS sources (name TEXT PRIMARY KEY, sha256 TEXT NOT NULL)')
+            db.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+            for table in TABLES.values():
+                columns = ''.join(f', {column}' for column in table.columns)
+                db.execute(
+                    f'CREATE TABLE IF NOT EXISTS {table.name} '
+                    f'(pos INTEGER PRIMARY KEY, section TEXT{columns}, data BLOB NOT NULL)'
+                )
+                for index_columns in table.indexes:
+                    index_name = f"{table.name}_{'_'.join(index_columns)}"
+                    db.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table.name} ({', '.join(index_columns)})")
+
+            row = db.execute("SELECT value FROM meta WHERE key = 'text_index'").fetchone()
+            if row is None:
+                try:
+                    db.execute(
+                        "CREATE VIRTUAL TABLE connection_text USING fts5"
+                        "(value, field UNINDEXED, pos UNINDEXED, tokenize='trigram')"
+                    )
+                    kind = 'fts5'
+                except sqlite3.OperationalError:
+                    # SQLite without FTS5 trigram support
+                    db.execute('CREATE TABLE connection_text (value TEXT, field TEXT, pos INTEGER)')
+                    db.execute('CREATE INDEX connection_text_field ON connection_text (field)')
+                    kind = 'table'
+                db.execute("INSERT INTO meta (key, value) VALUES ('text_index', ?)", (kind,))
+            else:
+                kind = row[0]
+            db.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        return kind == 'fts5'
+
+    # === IMPORT / EXPORT ===
+
+    def import_yaml(self, root: Union[str, Path, None] = None, only_changed: bool = True) -> list[str]:
+        """
+        Load the brain files under root into the store.
+
+        Files whose content hash matches the last import are skipped unless
+        only_changed is False. Returns the names of the sources imported.
+        """
+        root = Path(root) if root is not None else BRAIN_ROOT
+        imported = []
+        for source in SOURCES.values():
+            path = root / source.path
+            if not path.exists():
+                continue
+            raw = path.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            if only_changed and self._source_hash(source.name) == digest:
+                continue
+            document = backends.parse(raw, backends.format_for(path))
+            with self._lock, self._db:
+                self._store_document(source, document)
+                self._db.execute('INSERT OR REPLACE INTO sources (name, sha256) VALUES (?, ?)', (source.name, digest))
+            imported.append(source.name)
+        return imported
+
+    def _source_hash(self, name: str) -> Optional[str]:
+        rows = self._query('SELECT sha256 FROM sources WHERE name = ?', (name,))
+        return rows[0][0] if rows else None
+
+    def _store_document(self, source: Source, document: Any) -> None:
+        """Replace a source's rows; the caller holds the lock and the transaction."""
+        db = self._db
+        table = source.table
+        if table is None or not isinstance(document, dict):
+            db.execute('INSERT OR REPLACE INTO documents (name, data) VALUES (?, ?)', (source.name, _dumps(document)))
+            return
+
+        # Records move to the table; the document keeps a placeholder so
+        # export restores the original key order
+        header: dict[str, Any] = {}
+        record_keys = []
+        rows: list[tuple[str, Any]] = []
+        for key, value in document.items():
+            wanted = source.record_keys is None or key in source.record_keys
+            if wanted and _is_record_list(value):
+                header[key] = None
+                record_keys.append(key)
+                rows.extend((key, record) for record in value)
+            else:
+                header[key] = value
+        header['__record_keys__'] = record_keys
+
+        db.execute('INSERT OR REPLACE INTO documents (name, data) VALUES (?, ?)', (source.name, _dumps(header)))
+        db.execute(f'DELETE FROM {table.name}')
+        if table.name == 'connections':
+            db.execute('DELETE FROM connection_text')
+
+        columns = list(table.columns)
+        placeholders = ', '.join('?' * (len(columns) + 3))
+        db.executemany(
+            f"INSERT INTO {table.name} (pos, section, {', '.join(columns)}, data) VALUES ({placeholders})",
+            (
+                (pos, key, *(compute(record) for compute in table.columns.values()), _dumps(record))
+                for pos, (key, record) in enumerate(rows)
+            ),
+        )
+        if table.name == 'connections':
+            db.executemany(
+                'INSERT INTO connection_text (value, field, pos) VALUES (?, ?, ?)',
+                _connection_text_rows(record for _, record in rows),
+            )
+
+    def export_yaml(self, root: Union[str, Path, None] = None) -> list[Path]:
+        """Write every stored document back to its file under root."""
+        root = Path(root) if root is not None else BRAIN_ROOT
+        written = []
+        for source in SOURCES.values():
+            document = self.document(source.name)
+            if document is None and not self._has_document(source.name):
+                continue
+            path = root / source.path
+            if backends.format_for(path) == 'json':
+                text = json.dumps(document, indent=2, ensure_ascii=False) + '\n'
+            else:
+                text = yaml.dump(document, Dumper=_Dumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            _write_atomic(path, text)
+            written.append(path)
+        return written
+
+    # === READING ===
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> list[Any]:
+        """All rows of a query, fetched under the lock."""
+        with self._lock:
+            return self._db.execute(sql, tuple(params)).fetchall()
+
+    def _has_document(self, name: str) -> bool:
+        return bool(self._query('SELECT 1 FROM documents WHERE name = ?', (name,)))
+
+    def document_header(self, name: str) -> Optional[Any]:
+        """A stored document without its record lists (None if never imported)."""
+        rows = self._query('SELECT data FROM documents WHERE name = ?', (name,))
+        if not rows:
+            return None
+        document = pickle.loads(rows[0][0])
+        if isinstance(document, dict):
+            for key in document.pop('__record_keys__', ()):
+                del document[key]
+        return document
+
+    def document(self, name: str) -> Optional[Any]:
+        """A stored document with its records put back in place (None if never imported)."""
+        with self._lock:
+            rows = self._query('SELECT data FROM documents WHERE name = ?', (name,))
+            if not rows:
+                return None
+            document = pickle.loads(rows[0][0])
+            if not isinstance(document, dict) or '__record_keys__' not in document:
+                return document
+
+            record_keys = document.pop('__record_keys__')
+            table = SOURCES[name].table
+            assert table is not None
+            records = self._query(f'SELECT section, data FROM {table.name} ORDER BY pos')
+        for key in record_keys:
+            document[key] = []
+        for section, data in records:
+            document[section].append(pickle.loads(data))
+        return document
+
+    def section(self, name: str) -> Any:
+        """A Brain/analysis section (same shape as the file loaders return)."""
+        return SECTIONS[name](self.document(name))
+
+    def _records(self, sql: str, params: Iterable[Any] = ()) -> list[dict[str, Any]]:
+        return [pickle.loads(data) for (data,) in self._query(sql, params)]
+
+    def relationships_for(self, entity_id: str) -> list[dict[str, Any]]:
+        """Relationships from or to an entity, in file order."""
+        return self._records(
+            'SELECT data FROM relationships WHERE src = ? OR dst = ? ORDER BY pos', (entity_id, entity_id))
+
+    def relationships_to(self, entity_id: str, relationship_type: str) -> list[dict[str, Any]]:
+        """Relationships of one type pointing at an entity, in file order."""
+        return self._records(
+            'SELECT data FROM relationships WHERE dst = ? AND type = ? ORDER BY pos', (entity_id, relationship_type))
+
+    def stale_connections(self, cutoff: str) -> list[tuple[dict[str, Any], str, str]]:
+        """(connection, strength, last touch) for warm/close connections last touched before cutoff."""
+        rows = self._query(
+            "SELECT data, relationship_strength, last_touch FROM connections "
+            "WHERE relationship_strength IN ('warm', 'close') AND last_touch < ? ORDER BY pos",
+            (cutoff,),
+        )
+        return [(pickle.loads(data), strength, last_touch) for data, strength, last_touch in rows]
+
+    def network(self) -> StoreNetworkAccessor:
+        return StoreNetworkAccessor(self)
+
+    # === CONNECTION QUERIES ===
+    # Connections are addressed by position (their order in network.yaml)
+
+    def connection_positions(self, limit: Optional[int] = None, **columns: Any) -> list[int]:
+        """
+        Positions of the connections whose indexed columns equal the given
+        values (None matches a missing value), in file order.
+
+            store.connection_positions(energy='draining')
+        """
+        unknown = columns.keys() - TABLES['connections'].columns.keys()
+        if unknown:
+            raise ValueError(f"Unknown connection columns: {', '.join(sorted(unknown))}")
+        where = ' AND '.join(f'{column} IS ?' for column in columns) or '1'
+        sql = f'SELECT pos FROM connections WHERE {where} ORDER BY pos'
+        if limit is not None:
+            sql += f' LIMIT {int(limit)}'
+        return self._positions(sql, columns.values())
+
+    def connections_at(self, positions: Iterable[int]) -> dict[int, dict[str, Any]]:
+        """Connection records by position."""
+        found: dict[int, dict[str, Any]] = {}
+        positions = list(positions)
+        for start in range(0, len(positions), 500):
+            batch = positions[start:start + 500]
+            rows = self._query(
+                f"SELECT pos, data FROM connections WHERE pos IN ({', '.join('?' * len(batch))})", batch)
+            for pos, data in rows:
+                found[pos] = pickle.loads(data)
+        return found
+
+    def _positions(self, sql: str, params: Iterable[Any] = ()) -> list[int]:
+        return [pos for (pos,) in self._query(sql, params)]
+
+    def text_positions(self, query: str, fields: tuple[str, ...]) -> list[int]:
+        """Positions of connections with `query` (case-insensitive) in any of the fields."""
+        query = query.lower()
+        field_list = ', '.join('?' * len(fields))
+        if self._fts and len(query) >= 3:
+            # Trigram index narrows the candidates; instr() keeps Python's exact semantics
+            phrase = '"' + query.replace('"', '""') + '"'
+            sql = (f'SELECT DISTINCT pos FROM connection_text WHERE connection_text MATCH ? '
+                   f'AND field IN ({field_list}) AND instr(value, ?) > 0 ORDER BY pos')
+            return self._positions(sql, (phrase, *fields, query))
+        sql = (f'SELECT DISTINCT pos FROM connection_text '
+               f'WHERE field IN ({field_list}) AND instr(value, ?) > 0 ORDER BY pos')
+        return self._positions(sql, (*fields, query))
+
+
+def _connection_text_rows(connections: Iterable[dict[str, Any]]) -> Iterator[tuple[str, str, int]]:
+    for pos, conn in enumerate(connections):
+        for field_name in SCALAR_TEXT_FIELDS:
+            yield ((_text(conn.get(field_name)) or '').lower(), field_name, pos)
+        for field_name in LIST_TEXT_FIELDS:
+            for item in conn.get(field_name) or []:
+                yield ((_text(item) or '').lower(), field_name, pos)
+
+
+class StoreNetworkAccessor:
+    """
+    NetworkAccessor API answered by SQL on a BrainStore.
+
+    Connections are unpickled on demand and memoized by position, so
+    repeated queries return the same dicts.
+    """
+
+    SEARCH_FIELDS = SCALAR_TEXT_FIELDS + LIST_TEXT_FIELDS
+
+    def __init__(self, store: BrainStore):
+        self._store = store
+        self._rows: dict[int, dict[str, Any]] = {}
+        self._header: Optional[dict[str, Any]] = None
+
+    def _connections_at(self, positions: list[int]) -> list[dict[str, Any]]:
+        missing = [pos for pos in positions if pos not in self._rows]
+        if missing:
+            self._rows.update(self._store.connections_at(missing))
+        return [self._rows[pos] for pos in positions]
+
+    def _where(self, **columns: Any) -> list[dict[str, Any]]:
+        return self._connections_at(self._store.connection_positions(**columns))
+
+    @property
+    def connections(self) -> list[dict[str, Any]]:
+        return self._where()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        if self._header is None:
+            self._header = self._store.document_header('network') or {}
+        return self._header.get('stats') or {}
+
+    def domain_matches(self, domain: str) -> list[dict[str, Any]]:
+        """Find connections in a domain."""
+        return self._connections_at(self._store.text_positions(domain, ('domains',)))
+
+    def by_strength(self, strength: str) -> list[dict[str, Any]]:
+        """Find connections by relationship strength."""
+        return self._where(relationship_strength=strength)
+
+    def high_trust(self) -> list[dict[str, Any]]:
+        """Get high-trust connections."""
+        return self._where(trust_level='high')
+
+    def energizing(self) -> list[dict[str, Any]]:
+        """Get energizing connections."""
+        return self._where(energy='energizing')
+
+    def draining(self) -> list[dict[str, Any]]:
+        """Get draining connections."""
+        return self._where(energy='draining')
+
+    def get(self, connection_id: str) -> Optional[dict[str, Any]]:
+        """Get a specific connection."""
+        found = self._store.connection_positions(limit=1, id=connection_id)
+        return self._connections_at(found)[0] if found else None
+
+    def search(self, query: str, fields: tuple[str, ...] = ('name', 'company')) -> list[dict[str, Any]]:
+        """
+        Search connections by name or company.
+
+        Pass `fields` (any of SEARCH_FIELDS) to search other fields too.
+        """
+        unknown = set(fields) - set(self.SEARCH_FIELDS)
+        if unknown:
+            raise ValueError(f"Unsearchable fields: {', '.join(sorted(unknown))}")
+        return self._connections_at(self._store.text_positions(query, fields))
+
+
+class _Dumper(getattr(yaml, 'CSafeDumper', yaml.SafeDumper)):  # type: ignore[misc]
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+def _dumps(data: Any) -> bytes:
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp, path)
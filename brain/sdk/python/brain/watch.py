@@ -0,0 +1,75 @@
+"""
+Brain SDK Watch
+Background hot reload for long-running processes
+
+Polls the brain files' mtimes (a stat per loaded section for a file-backed
+Brain) and calls Brain.refresh() when one changes, so a long-lived Brain
+follows edits without a restart. Polling needs nothing beyond the standard
+library and works the same on every platform and filesystem.
+
+Usage:
+    brain = Brain.load()
+    watcher = brain.watch(interval=1.0, on_change=print)
+    ...
+    watcher.stop()
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from .brain import Brain
+
+logger = logging.getLogger(__name__)
+
+
+class BrainWatcher:
+    """Daemon thread calling brain.refresh() every `interval` seconds."""
+
+    def __init__(
+        self,
+        brain: Brain,
+        interval: float = 1.0,
+        on_change: Optional[Callable[[list[str]], None]] = None,
+    ):
+        self.brain = brain
+        self.interval = interval
+        self.on_change = on_change
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> BrainWatcher:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='brain-watch', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def __enter__(self) -> BrainWatcher:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                changed = self.brain.refresh()
+            except Exception:
+                # Typically a file caught mid-save; keep the old data and retry
+                logger.warning("Brain refresh failed", exc_info=True)
+                continue
+            if changed and self.on_change is not None:
+                self.on_change(changed)
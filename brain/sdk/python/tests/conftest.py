@@ -0,0 +1,19 @@
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture
+def write_brain(tmp_path):
+    """Write brain files (graph/entities.yaml, ...) under tmp_path; returns the root."""
+    def write(files: dict) -> Path:
+        for relative, document in files.items():
+            path = tmp_path / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(yaml.safe_dump(document, sort_keys=False))
+        return tmp_path
+    return write
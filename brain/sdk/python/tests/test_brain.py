@@ -0,0 +1,210 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from brain import Brain, loaders
+import yaml
+
+from brain.brain import INCREMENTAL_INDEXES, INDEX_SECTIONS, SECTION_LOADERS
+
+
+def _pending_brain(loaders):
+    brain = Brain.__new__(Brain)
+    brain._init({}, dict(loaders), store=object())  # no files to stat
+    return brain
+
+
+def test_concurrent_reads_of_a_pending_section():
+    calls = []
+
+    def slow_state():
+        calls.append(1)
+        time.sleep(0.05)
+        return {'version': '1'}
+
+    brain = _pending_brain({'state': slow_state})
+    barrier = threading.Barrier(8)
+    results, errors = [], []
+
+    def read():
+        barrier.wait()
+        try:
+            results.append(brain.state)
+        except Exception as e:  # pragma: no cover - the failure being tested
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(calls) == 1
+    assert results == [{'version': '1'}] * 8
+
+
+def test_warm_loads_every_section():
+    brain = Brain.load(lazy=True)
+    brain.warm()
+    assert set(brain.loaded_sections) == {'state', 'entities', 'relationships', 'predictions', 'agenda', 'network'}
+
+
+@pytest.fixture
+def brain_root(write_brain, monkeypatch):
+    root = write_brain({
+        'graph/entities.yaml': {'entities': [{'id': 'a', 'type': 'belief'}, {'id': 'b', 'type': 'belief'}]},
+        'graph/relationships.yaml': {'relationships': [{'id': 'r', 'type': 'supports', 'from': 'a', 'to': 'b'}]},
+        'graph/predictions.yaml': {'predictions': [{'id': 'p', 'claim': 'b holds'}]},
+        'agenda.yaml': {'priorities': ['ship']},
+        'human/network.yaml': {'connections': [{'id': 'ada', 'name': 'Ada'}]},
+    })
+    (root / 'state.json').write_text(json.dumps({'version': '1', 'session_count': 3}))
+    monkeypatch.setattr(loaders, 'BRAIN_ROOT', root)
+    monkeypatch.setattr(loaders, 'SNAPSHOT_DIR', root / '.cache')
+    return root
+
+
+def _sections(brain):
+    return {name: brain._section(name) for name in SECTION_LOADERS}
+
+
+def test_aload_matches_load(brain_root):
+    loaded = Brain.load()
+    aloaded = asyncio.run(Brain.aload())
+
+    assert set(aloaded.loaded_sections) == set(SECTION_LOADERS)
+    assert _sections(aloaded) == _sections(loaded)
+    assert aloaded._signatures == loaded._signatures
+    assert aloaded.consistency.ok and loaded.consistency.ok
+
+
+def test_aload_runs_loaders_on_the_given_executor(brain_root, monkeypatch):
+    threads = set()
+    for name, loader in SECTION_LOADERS.items():
+        def recording(loader=loader):
+            threads.add(threading.current_thread().name)
+            return loader()
+        monkeypatch.setitem(SECTION_LOADERS, name, recording)
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix='brain-load') as executor:
+        aloaded = asyncio.run(Brain.aload(executor=executor))
+
+    assert threads and all(name.startswith('brain-load') for name in threads)
+    assert _sections(aloaded) == _sections(Brain.load())
+
+
+def _rewrite(root, relative, text):
+    """Rewrite a brain file and move its mtime forward, so the change shows even on coarse clocks."""
+    path = root / relative
+    mtime_ns = path.stat().st_mtime_ns + 10**9
+    path.write_text(text if isinstance(text, str) else yaml.safe_dump(text, sort_keys=False))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def warm_brain(brain_root):
+    """A fully loaded brain with every derived index built."""
+    brain = Brain.load()
+    brain.warm()
+    return brain
+
+
+@pytest.fixture
+def loader_calls(warm_brain, monkeypatch):
+    """Names of the sections loaded after warm_brain, in order."""
+    calls = []
+    for name, loader in SECTION_LOADERS.items():
+        def recording(name=name, loader=loader):
+            calls.append(name)
+            return loader()
+        monkeypatch.setitem(SECTION_LOADERS, name, recording)
+    return calls
+
+
+def _kept(before, brain):
+    return {name for name, index in before.items() if brain._indexes.get(name) is index}
+
+
+def test_refresh_reloads_only_the_changed_section(warm_brain, loader_calls, brain_root):
+    brain = warm_brain
+    before = dict(brain._indexes)
+    sections = dict(brain._sections)
+    _rewrite(brain_root, 'human/network.yaml', {'connections': [{'id': 'bea', 'name': 'Bea'}]})
+
+    assert brain.refresh() == ['network']
+
+    assert loader_calls == ['network']
+    assert [name for name in sections if brain._section(name) is not sections[name]] == ['network']
+    assert _kept(before, brain) == set(before) - {'network'}
+    assert brain.network.get('bea') is not None
+    assert brain.refresh() == []
+
+
+def test_refresh_drops_only_the_dependent_indexes(warm_brain, loader_calls, brain_root):
+    brain = warm_brain
+    before = dict(brain._indexes)
+    _rewrite(brain_root, 'graph/relationships.yaml', {'relationships': [
+        {'id': 'r2', 'type': 'contradicts', 'from': 'b', 'to': 'a'},
+    ]})
+
+    assert brain.refresh() == ['relationships']
+
+    dependent = {name for name, inputs in INDEX_SECTIONS.items() if 'relationships' in inputs}
+    assert dependent == {'relationships_by_entity', 'relationships_to', 'graph', 'consistency'}
+    # Incremental indexes are updated in place of a rebuild
+    assert set(INCREMENTAL_INDEXES) <= set(brain._indexes)
+    assert _kept(before, brain) == set(before) - dependent - set(INCREMENTAL_INDEXES)
+    assert loader_calls == ['relationships']
+    assert [r['id'] for r in brain.relationships] == ['r2']
+    assert brain.graph.neighbors('b') == ['a']
+
+
+def test_failed_refresh_keeps_the_old_data_and_retries(warm_brain, brain_root):
+    brain = warm_brain
+    before = dict(brain._indexes)
+    _rewrite(brain_root, 'agenda.yaml', 'priorities: [unclosed')
+
+    with pytest.raises(yaml.YAMLError):
+        brain.refresh()
+    assert brain.agenda == {'priorities': ['ship']}
+    assert _kept(before, brain) == set(before)
+
+    _rewrite(brain_root, 'agenda.yaml', {'priorities': ['rest']})
+    assert brain.refresh() == ['agenda']
+    assert brain.agenda == {'priorities': ['rest']}
+
+
+def test_refresh_skips_sections_not_loaded_yet(brain_root):
+    brain = Brain.load(lazy=True)
+    assert brain.agenda == {'priorities': ['ship']}
+    _rewrite(brain_root, 'human/network.yaml', {'connections': []})
+
+    assert brain.refresh() == []
+    assert brain.loaded_sections == ['agenda']
+
+
+def test_watcher_refreshes_in_the_background(warm_brain, loader_calls, brain_root):
+    brain = warm_brain
+    before = dict(brain._indexes)
+    changes = []
+    changed = threading.Event()
+
+    def on_change(names):
+        changes.append(names)
+        changed.set()
+
+    with brain.watch(interval=0.01, on_change=on_change) as watcher:
+        assert watcher.running
+        _rewrite(brain_root, 'human/network.yaml', {'connections': [{'id': 'bea', 'name': 'Bea'}]})
+        assert changed.wait(5)
+    assert not watcher.running
+
+    assert changes == [['network']]
+    assert loader_calls == ['network']
+    assert _kept(before, brain) == set(before) - {'network'}
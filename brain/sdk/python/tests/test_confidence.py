@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+from brain.confidence import LEVEL_PRIORS, ConfidenceEngine, score_level
+
+LEVELS = list(LEVEL_PRIORS) + [None]
+TYPES = ['supports', 'validates', 'contradicts', 'challenges', 'relates_to']
+STRENGTHS = ['strong', 'moderate', 'weak', 3, 8, None]
+
+
+def _entity(rng, i):
+    return {'id': f'e.{i}', 'confidence': rng.choice(LEVELS)}
+
+
+def _relationship(rng, n):
+    return {
+        'type': rng.choice(TYPES),
+        'from': f'e.{rng.randrange(n)}',
+        'to': f'e.{rng.randrange(n)}',
+        'strength': rng.choice(STRENGTHS),
+    }
+
+
+def _random_brain(rng, n):
+    entities = [_entity(rng, i) for i in range(n)]
+    relationships = [_relationship(rng, n) for _ in range(n * 2)]
+    return entities, relationships
+
+
+def _edit(rng, entities, relationships, n):
+    """A copy of the lists with a few random edits."""
+    entities, relationships = list(entities), list(relationships)
+    for _ in range(rng.randint(1, 4)):
+        action = rng.randrange(5)
+        if action == 0:
+            entities[rng.randrange(len(entities))] = _entity(rng, rng.randrange(n))
+        elif action == 1 and entities:
+            entities.pop(rng.randrange(len(entities)))
+        elif action == 2:
+            entities.append(_entity(rng, n + rng.randrange(5)))
+        elif action == 3 and relationships:
+            relationships.pop(rng.randrange(len(relationships)))
+        else:
+            relationships.append(_relationship(rng, n + 5))
+    return entities, relationships
+
+
+def _assert_same(engine, rebuilt):
+    assert engine.scores.keys() == rebuilt.scores.keys()
+    for entity_id, score in rebuilt.scores.items():
+        assert engine.score(entity_id) == pytest.approx(score, abs=1e-5)
+
+
+def test_priors_map_back_to_their_level():
+    for level, prior in LEVEL_PRIORS.items():
+        assert score_level(prior) == level
+
+
+def test_evidence_moves_the_target():
+    entities = [{'id': 'a', 'confidence': 'hardened'}, {'id': 'b', 'confidence': 'tentative'}, {'id': 'c'}]
+    engine = ConfidenceEngine(entities, [{'type': 'validates', 'from': 'a', 'to': 'b', 'strength': 'strong'}])
+    assert engine.score('b') > LEVEL_PRIORS['tentative']
+    assert engine.level('a') == 'hardened'  # no evidence: stated level
+    assert engine.score('missing') is None
+
+    engine.add_relationship({'type': 'challenges', 'from': 'a', 'to': 'c', 'strength': 'strong'})
+    assert engine.score('c') < 0.5
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_updated_matches_a_rebuild(seed):
+    rng = random.Random(seed)
+    n = 40
+    entities, relationships = _random_brain(rng, n)
+    engine = ConfidenceEngine(entities, relationships)
+
+    for _ in range(10):
+        entities, relationships = _edit(rng, entities, relationships, n)
+        previous = engine.scores
+        updated = engine.updated(entities, relationships)
+        _assert_same(updated, ConfidenceEngine(entities, relationships))
+        assert engine.scores == previous  # the old engine is left untouched
+        engine = updated
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_in_place_updates_match_a_rebuild(seed):
+    rng = random.Random(seed)
+    n = 30
+    entities, relationships = _random_brain(rng, n)
+    engine = ConfidenceEngine(entities, relationships)
+
+    for _ in range(20):
+        relationship = _relationship(rng, n)
+        relationships.append(relationship)
+        engine.add_relationship(relationship)
+        removed = relationships.pop(rng.randrange(len(relationships)))
+        engine.remove_relationship(removed)
+        entity = _entity(rng, rng.randrange(n))
+        entities = [e for e in entities if e['id'] != entity['id']] + [entity]
+        engine.set_entity(entity)
+    _assert_same(engine, ConfidenceEngine(entities, relationships))
+
+
+def test_updated_rebuilds_when_most_edges_change():
+    rng = random.Random(0)
+    entities, relationships = _random_brain(rng, 40)
+    engine = ConfidenceEngine(entities, relationships)
+    replacement = [_relationship(rng, 40) for _ in range(80)]
+    _assert_same(engine.updated(entities, replacement), ConfidenceEngine(entities, replacement))
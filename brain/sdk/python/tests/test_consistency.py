@@ -0,0 +1,152 @@
+import logging
+import random
+
+import pytest
+import yaml
+
+from brain import Brain, loaders
+from brain.consistency import cached_check, check_consistency, strongly_connected_components
+
+
+def _edge(kind, source, target, rel_id=None):
+    return {'id': rel_id or f'{source}-{kind}-{target}', 'type': kind, 'from': source, 'to': target}
+
+
+def _entities(*ids):
+    return [{'id': entity_id, 'type': 'belief'} for entity_id in ids]
+
+
+def test_tarjan_finds_every_component():
+    successors = {'a': ['b'], 'b': ['c'], 'c': ['a', 'd'], 'd': ['e'], 'e': ['d'], 'f': []}
+    components = strongly_connected_components(successors, successors)
+    assert sorted(sorted(c) for c in components) == [['a', 'b', 'c'], ['d', 'e'], ['f']]
+
+
+def test_tarjan_handles_deep_chains():
+    n = 50_000
+    successors = {str(i): [str(i + 1)] for i in range(n)}
+    successors[str(n)] = ['0']
+    assert len(strongly_connected_components(successors, successors)) == 1
+
+
+def test_support_cycles_and_dangling_edges():
+    report = check_consistency(_entities('a', 'b', 'c', 'd'), [
+        _edge('supports', 'a', 'b'),
+        _edge('validates', 'b', 'a'),
+        _edge('supports', 'c', 'c'),
+        _edge('supports', 'c', 'd'),
+        _edge('supports', 'd', 'ghost'),
+        {'id': 'open', 'type': 'supports', 'from': 'a', 'to': None},
+    ])
+    assert sorted(sorted(cycle) for cycle in report.cycles) == [['a', 'b'], ['c']]
+    assert report.dangling == [{'relationship': 'd-supports-ghost', 'from': 'd', 'to': 'ghost', 'missing': ['ghost']}]
+
+
+@pytest.mark.parametrize('contradiction, looped', [
+    (_edge('contradicts', 'c', 'a'), True),  # against a support chain
+    (_edge('challenges', 'a', 'c'), True),  # along it
+    (_edge('contradicts', 'b', 'a'), True),  # against a direct support edge
+    (_edge('contradicts', 'a', 'a'), True),
+    (_edge('contradicts', 'a', 'x'), False),  # support the same entity only
+    (_edge('contradicts', 'x', 'b'), False),
+])
+def test_contradiction_loops(contradiction, looped):
+    report = check_consistency(_entities('a', 'b', 'c', 'x'), [
+        _edge('supports', 'a', 'b'),
+        _edge('validates', 'b', 'c'),
+        _edge('supports', 'x', 'c'),
+        contradiction,
+    ])
+    assert [loop['relationship'] for loop in report.contradiction_loops] == ([contradiction['id']] if looped else [])
+
+
+def _reachable(start, supports):
+    seen, stack = set(), [start]
+    while stack:
+        for successor in supports.get(stack.pop(), ()):
+            if successor not in seen:
+                seen.add(successor)
+                stack.append(successor)
+    return seen
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_contradiction_loops_match_plain_reachability(seed):
+    rng = random.Random(seed)
+    n = rng.randint(2, 15)
+    kinds = ['supports', 'validates', 'contradicts', 'challenges']
+    relationships = [
+        _edge(rng.choice(kinds), str(rng.randrange(n)), str(rng.randrange(n)), str(i))
+        for i in range(rng.randint(1, 30))
+    ]
+    supports = {}
+    for r in relationships:
+        if r['type'] in ('supports', 'validates'):
+            supports.setdefault(r['from'], []).append(r['to'])
+
+    expected = [
+        r['id'] for r in relationships
+        if r['type'] in ('contradicts', 'challenges') and (
+            r['from'] == r['to']
+            or r['to'] in _reachable(r['from'], supports)
+            or r['from'] in _reachable(r['to'], supports)
+        )
+    ]
+    report = check_consistency(_entities(*map(str, range(n))), relationships)
+    assert [loop['relationship'] for loop in report.contradiction_loops] == expected
+
+
+def test_contradiction_inside_a_support_cycle():
+    report = check_consistency(_entities('a', 'b', 'c'), [
+        _edge('supports', 'a', 'b'), _edge('supports', 'b', 'c'), _edge('supports', 'c', 'a'),
+        _edge('contradicts', 'b', 'a'),
+    ])
+    assert len(report.cycles) == 1
+    assert [loop['relationship'] for loop in report.contradiction_loops] == ['b-contradicts-a']
+
+
+@pytest.fixture
+def brain_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(loaders, 'BRAIN_ROOT', tmp_path)
+    monkeypatch.setattr(loaders, 'SNAPSHOT_DIR', tmp_path / '.cache')
+    monkeypatch.setattr(loaders, 'SNAPSHOTS_ENABLED', True)
+    return tmp_path
+
+
+def _write_graph(root, entities, relationships):
+    (root / 'graph').mkdir(exist_ok=True)
+    (root / 'graph' / 'entities.yaml').write_text(yaml.safe_dump({'entities': entities}))
+    (root / 'graph' / 'relationships.yaml').write_text(yaml.safe_dump({'relationships': relationships}))
+
+
+def _stamps():
+    return {name: loaders.file_signature(loaders.SECTION_FILES[name]) for name in ('entities', 'relationships')}
+
+
+def test_cached_check_ignores_edits_made_after_parsing(brain_root):
+    entities, looped = _entities('a', 'b'), [_edge('supports', 'a', 'b'), _edge('contradicts', 'b', 'a')]
+    _write_graph(brain_root, entities, looped)
+    stamps = _stamps()
+
+    # Fixed while the old content was being checked
+    _write_graph(brain_root, entities, looped[:1])
+    assert not cached_check(entities, looped, stamps).ok
+
+    assert cached_check(entities, looped[:1], _stamps()).ok
+    assert cached_check(entities, looped[:1], _stamps()).ok  # served from the cache
+
+
+def test_lazy_brain_checks_once_both_sections_load(caplog):
+    brain = Brain.__new__(Brain)
+    brain._init({}, {
+        'entities': lambda: _entities('a'),
+        'relationships': lambda: [_edge('supports', 'a', 'missing')],
+    }, store=object())
+
+    with caplog.at_level(logging.WARNING, logger='brain.brain'):
+        brain.entities
+        assert not caplog.records
+        brain.relationships
+    assert len(caplog.records) == 1
+    assert 'dangling' in caplog.text
+    assert len(brain.consistency.dangling) == 1
@@ -0,0 +1,113 @@
+import pytest
+
+from brain.graph import RelationshipGraph, edge_weight
+
+
+def _edge(rel_id, kind, source, target, strength=None):
+    edge = {'id': rel_id, 'type': kind, 'from': source, 'to': target}
+    if strength is not None:
+        edge['strength'] = strength
+    return edge
+
+
+# a -> b -> c -> a is a supports cycle; the direct a -> c is weaker than a -> b -> c
+RELATIONSHIPS = [
+    _edge('ab', 'supports', 'a', 'b', 'strong'),
+    _edge('ac', 'supports', 'a', 'c', 'weak'),
+    _edge('af', 'relates_to', 'a', 'f'),
+    _edge('bc', 'supports', 'b', 'c', 'strong'),
+    _edge('ca', 'supports', 'c', 'a', 'moderate'),
+    _edge('cd', 'contradicts', 'c', 'd'),
+    _edge('de', 'supports', 'd', 'e', 8),
+    {'id': 'dangling', 'type': 'supports', 'from': 'a'},
+]
+
+
+@pytest.fixture
+def graph():
+    return RelationshipGraph(RELATIONSHIPS)
+
+
+def _ids(path):
+    return None if path is None else [r['id'] for r in path]
+
+
+def test_edges_without_both_ends_are_skipped(graph):
+    assert graph.nodes == {'a', 'b', 'c', 'd', 'e', 'f'}
+    assert 'a' in graph and 'z' not in graph
+    assert [r['id'] for _, r in graph.edges('a')] == ['ab', 'ac', 'af']
+
+
+def test_neighbors_and_endpoints(graph):
+    assert graph.neighbors('a', types='supports') == ['b', 'c']
+    assert graph.neighbors('c', direction='in') == ['a', 'b']
+    assert graph.neighbors('c', direction='both') == ['a', 'd', 'b']
+    assert graph.endpoints(('contradicts',)) == {'c', 'd'}
+
+
+def test_unknown_direction_is_rejected(graph):
+    with pytest.raises(ValueError, match='Unknown direction'):
+        graph.neighbors('a', direction='up')
+
+
+def test_bfs_reports_hop_counts_in_visit_order(graph):
+    assert list(graph.bfs('a').items()) == [('a', 0), ('b', 1), ('c', 1), ('f', 1), ('d', 2), ('e', 3)]
+    assert graph.bfs('a', types=('supports',)) == {'a': 0, 'b': 1, 'c': 1}
+    assert graph.bfs('a', max_depth=1) == {'a': 0, 'b': 1, 'c': 1, 'f': 1}
+    assert graph.bfs('a', max_depth=0) == {'a': 0}
+
+
+def test_bfs_from_several_starts_and_backwards(graph):
+    assert list(graph.bfs(['d', 'b'])) == ['d', 'b', 'e', 'c', 'a', 'f']
+    assert graph.bfs('e', direction='in') == {'e': 0, 'd': 1, 'c': 2, 'b': 3, 'a': 3}
+    assert graph.bfs('d', types='contradicts', direction='both') == {'d': 0, 'c': 1}
+
+
+def test_dfs_is_depth_first_preorder(graph):
+    assert graph.dfs('a') == ['a', 'b', 'c', 'd', 'e', 'f']
+    assert graph.dfs('a', types=('supports',)) == ['a', 'b', 'c']
+    assert graph.dfs('e', direction='in') == ['e', 'd', 'c', 'a', 'b']
+    assert graph.dfs('z') == ['z']
+
+
+def test_dfs_handles_deep_chains():
+    n = 50_000
+    chain = RelationshipGraph([_edge(str(i), 'supports', str(i), str(i + 1)) for i in range(n)])
+    assert len(chain.dfs('0')) == n + 1
+
+
+def test_transitive_closure(graph):
+    # a is on the supports cycle, e is not on any
+    assert graph.transitive_closure('a') == {'a', 'b', 'c'}
+    assert graph.transitive_closure('d') == {'e'}
+    assert graph.transitive_closure('e') == frozenset()
+    assert graph.transitive_closure('e', direction='in') == {'d'}
+    assert graph.transitive_closure('e', types=None, direction='in') == {'a', 'b', 'c', 'd'}
+
+
+def test_transitive_closure_is_cached_per_query(graph):
+    closure = graph.transitive_closure('a')
+    assert graph.transitive_closure('a', types=['supports']) is closure
+    assert graph.transitive_closure('a', types=None) is not closure
+
+
+def test_shortest_path_prefers_strong_chains(graph):
+    # a -> b -> c costs 1 + 1, the weak direct a -> c costs 1 / 0.3
+    assert _ids(graph.shortest_path('a', 'c', types='supports')) == ['ab', 'bc']
+    assert _ids(graph.shortest_path('a', 'e')) == ['ab', 'bc', 'cd', 'de']
+    assert _ids(graph.shortest_path('e', 'a', direction='in')) == ['de', 'cd', 'bc', 'ab']
+
+
+def test_shortest_path_edge_cases(graph):
+    assert graph.shortest_path('a', 'a') == []
+    assert graph.shortest_path('e', 'a') is None
+    assert graph.shortest_path('a', 'e', types='supports') is None
+    assert graph.shortest_path('a', 'z') is None
+
+
+@pytest.mark.parametrize('strength, weight', [
+    ('strong', 1.0), ('weak', 0.3), ('unheard-of', 0.5), (None, 0.5), (True, 0.5),
+    (5, 0.5), (20, 1.0), (0, 0.1),
+])
+def test_edge_weight(strength, weight):
+    assert edge_weight({'strength': strength}) == weight
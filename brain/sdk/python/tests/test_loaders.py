@@ -0,0 +1,154 @@
+import importlib
+import json
+import os
+import pickle
+
+import pytest
+
+from brain import loaders
+
+
+@pytest.fixture
+def reload_loaders(monkeypatch):
+    """Re-read the BRAIN_SNAPSHOT* settings from the environment; restores them afterwards."""
+    yield lambda: importlib.reload(loaders)
+    monkeypatch.undo()
+    importlib.reload(loaders)
+
+
+@pytest.fixture
+def brain_root(tmp_path, monkeypatch, reload_loaders):
+    monkeypatch.setenv('BRAIN_SNAPSHOT_DIR', str(tmp_path / 'snapshots'))
+    monkeypatch.delenv('BRAIN_SNAPSHOTS', raising=False)
+    reload_loaders()
+    monkeypatch.setattr(loaders, 'BRAIN_ROOT', tmp_path)
+    (tmp_path / 'state.json').write_text(json.dumps({'session_count': 1}))
+    return tmp_path
+
+
+class CountingParser:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, raw):
+        self.calls += 1
+        return json.loads(raw)
+
+
+def _load(parse):
+    return loaders.load_cached('state.json', parse)
+
+
+def _snapshot(root):
+    with open(root / 'snapshots' / 'state.json.pickle', 'rb') as f:
+        return pickle.load(f)
+
+
+def _touch(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_snapshot_dir_comes_from_the_environment(brain_root):
+    assert loaders.SNAPSHOT_DIR == brain_root / 'snapshots'
+    assert loaders.SNAPSHOTS_ENABLED
+
+    _load(CountingParser())
+
+    record = _snapshot(brain_root)
+    stat = (brain_root / 'state.json').stat()
+    assert record['data'] == {'session_count': 1}
+    assert (record['mtime_ns'], record['size']) == (stat.st_mtime_ns, stat.st_size)
+
+
+def test_unchanged_file_is_served_from_the_snapshot(brain_root):
+    parse = CountingParser()
+
+    assert _load(parse) == _load(parse) == {'session_count': 1}
+    assert parse.calls == 1
+
+
+def test_fast_path_trusts_mtime_and_size(brain_root):
+    path = brain_root / 'state.json'
+    _load(CountingParser())
+    mtime_ns = path.stat().st_mtime_ns
+
+    # Same size, same mtime: the edit is not noticed (documented trade-off)
+    path.write_text(json.dumps({'session_count': 2}))
+    _touch(path, mtime_ns)
+
+    parse = CountingParser()
+    assert _load(parse) == {'session_count': 1}
+    assert parse.calls == 0
+
+
+def test_touched_but_unchanged_file_is_restamped_not_parsed(brain_root):
+    path = brain_root / 'state.json'
+    _load(CountingParser())
+    _touch(path, path.stat().st_mtime_ns + 10**9)
+
+    parse = CountingParser()
+    assert _load(parse) == {'session_count': 1}
+    assert parse.calls == 0
+    assert _snapshot(brain_root)['mtime_ns'] == path.stat().st_mtime_ns
+
+    # The re-stamped snapshot serves the fast path again
+    _load(parse)
+    assert parse.calls == 0
+
+
+def test_changed_file_is_parsed_again(brain_root):
+    path = brain_root / 'state.json'
+    _load(CountingParser())
+    mtime_ns = path.stat().st_mtime_ns
+    path.write_text(json.dumps({'session_count': 2}))
+    _touch(path, mtime_ns + 10**9)
+
+    parse = CountingParser()
+    assert _load(parse) == {'session_count': 2}
+    assert parse.calls == 1
+    assert _snapshot(brain_root)['data'] == {'session_count': 2}
+
+
+@pytest.mark.parametrize('content', [
+    b'not a pickle',
+    b'',
+    pickle.dumps(['not', 'a', 'record']),
+    pickle.dumps({'version': loaders.SNAPSHOT_VERSION + 1, 'data': 'stale'}),
+])
+def test_corrupt_snapshot_falls_back_to_parsing(brain_root, content):
+    _load(CountingParser())
+    (brain_root / 'snapshots' / 'state.json.pickle').write_bytes(content)
+
+    parse = CountingParser()
+    assert _load(parse) == {'session_count': 1}
+    assert parse.calls == 1
+    assert _snapshot(brain_root)['version'] == loaders.SNAPSHOT_VERSION
+
+
+def test_brain_snapshots_0_always_parses(brain_root, monkeypatch, reload_loaders):
+    monkeypatch.setenv('BRAIN_SNAPSHOTS', '0')
+    reload_loaders()
+    monkeypatch.setattr(loaders, 'BRAIN_ROOT', brain_root)
+    assert not loaders.SNAPSHOTS_ENABLED
+
+    parse = CountingParser()
+    _load(parse)
+    _load(parse)
+
+    assert parse.calls == 2
+    assert not (brain_root / 'snapshots').exists()
+
+
+def test_use_snapshot_overrides_the_setting(brain_root):
+    parse = CountingParser()
+    loaders.load_cached('state.json', parse, use_snapshot=False)
+
+    assert parse.calls == 1
+    assert not (brain_root / 'snapshots').exists()
+
+
+def test_clear_snapshots(brain_root):
+    _load(CountingParser())
+
+    assert loaders.clear_snapshots() == 1
+    assert not list((brain_root / 'snapshots').glob('*.pickle'))
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+from brain.brain import NetworkAccessor
+from brain.search import SubstringIndex
+from brain.store import BrainStore
+
+WORDS = ['AI', 'ai ops', 'Sales', 'saas', 'fund', 'Acme', 'acme labs', '', 'é', 'ÉTÉ']
+
+
+def _text(rng):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(0, 3)))
+
+
+def _queries(rng, texts):
+    queries = ['', 'a', 'ai', 'xyz', 'ACME', 'acme l', 'été']
+    for text in texts:
+        if text and rng.random() < 0.3:
+            start = rng.randrange(len(text))
+            queries.append(text[start:start + rng.randint(1, 6)])
+    return queries
+
+
+def _connection(rng, i):
+    conn = {'id': f'p{i}'}
+    for name in ('name', 'company'):
+        if rng.random() < 0.8:
+            conn[name] = _text(rng)
+    if rng.random() < 0.7:
+        conn['domains'] = [_text(rng) for _ in range(rng.randint(0, 3))]
+    for name, values in (('relationship_strength', ['close', 'warm', 'cold']),
+                         ('trust_level', ['high', 'low']), ('energy', ['energizing', 'draining'])):
+        if rng.random() < 0.8:
+            conn[name] = rng.choice(values)
+    return conn
+
+
+# The linear scans NetworkAccessor's indexes replaced
+def _domain_matches(connections, domain):
+    return [c for c in connections if any(domain.lower() in d.lower() for d in c.get('domains', []))]
+
+
+def _search(connections, query):
+    query = query.lower()
+    return [
+        c for c in connections
+        if query in c.get('name', '').lower() or query in (c.get('company') or '').lower()
+    ]
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_substring_index_matches_a_linear_scan(seed):
+    rng = random.Random(seed)
+    texts = [None if rng.random() < 0.1 else _text(rng) for _ in range(100)]
+    index = SubstringIndex(texts)
+    assert len(index) == len(texts)
+    for query in _queries(rng, texts):
+        expected = [i for i, text in enumerate(texts) if text is not None and query.lower() in text.lower()]
+        assert index.find(query) == expected, query
+
+
+def test_missing_and_empty_domains_never_match():
+    connections = [{'id': 'a', 'domains': ['ai']}, {'id': 'b'}, {'id': 'c', 'domains': []}]
+    network = NetworkAccessor(_connections=connections)
+    assert [c['id'] for c in network.domain_matches('')] == ['a']
+    assert [c['id'] for c in network.domain_matches('AI')] == ['a']
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_network_accessor_matches_the_linear_scans(seed):
+    rng = random.Random(seed)
+    connections = [_connection(rng, i) for i in range(80)]
+    network = NetworkAccessor(_connections=connections)
+    texts = [c.get('name') for c in connections] + [d for c in connections for d in c.get('domains', [])]
+
+    for query in _queries(rng, texts):
+        assert network.domain_matches(query) == _domain_matches(connections, query), query
+        assert network.search(query) == _search(connections, query), query
+    for strength in ('close', 'warm', 'cold'):
+        assert network.by_strength(strength) == [c for c in connections if c.get('relationship_strength') == strength]
+    assert network.high_trust() == [c for c in connections if c.get('trust_level') == 'high']
+    assert network.energizing() == [c for c in connections if c.get('energy') == 'energizing']
+    assert network.draining() == [c for c in connections if c.get('energy') == 'draining']
+    assert network.get('p7') is connections[7]
+    assert network.get('missing') is None
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_store_network_matches_the_linear_scans(seed, write_brain, tmp_path):
+    rng = random.Random(seed)
+    connections = [_connection(rng, i) for i in range(60)]
+    root = write_brain({'human/network.yaml': {'connections': connections}})
+    texts = [c.get('name') for c in connections] + [d for c in connections for d in c.get('domains', [])]
+
+    with BrainStore(tmp_path / 'brain.db') as store:
+        store.import_yaml(root)
+        network = store.network()
+        for query in _queries(rng, texts):
+            assert network.domain_matches(query) == _domain_matches(connections, query), query
+            assert network.search(query) == _search(connections, query), query
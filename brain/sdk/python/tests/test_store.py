@@ -0,0 +1,78 @@
+import json
+import threading
+
+import pytest
+
+from brain import Brain
+from brain.store import BrainStore
+
+
+def _relationships(n, tag):
+    return {'relationships': [
+        {'id': f'rel.{tag}-{i}', 'type': 'supports', 'from': f'e.{i}', 'to': 'e.hub'} for i in range(n)
+    ]}
+
+
+def _network(n):
+    return {'connections': [
+        {'id': f'conn.p-{i}', 'name': f'Person {i}', 'domains': ['sales'], 'energy': 'draining' if i % 2 else None}
+        for i in range(n)
+    ], 'stats': {'total': n}}
+
+
+def test_network_queries(write_brain, tmp_path):
+    root = write_brain({'human/network.yaml': _network(10)})
+    with BrainStore(tmp_path / 'brain.db') as store:
+        store.import_yaml(root)
+        network = store.network()
+        assert len(network.connections) == 10
+        assert len(network.draining()) == 5
+        assert network.get('conn.p-3')['name'] == 'Person 3'
+        assert network.get('conn.missing') is None
+        assert len(network.domain_matches('SAL')) == 10
+        assert network.stats == {'total': 10}
+        assert store.connection_positions(energy=None) == [0, 2, 4, 6, 8]
+
+
+def test_readers_never_see_a_half_imported_table(write_brain, tmp_path):
+    root = write_brain({'graph/relationships.yaml': _relationships(300, 'a')})
+    store = BrainStore(tmp_path / 'brain.db')
+    store.import_yaml(root)
+
+    seen = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            seen.append(len(store.relationships_to('e.hub', 'supports')))
+
+    readers = [threading.Thread(target=read) for _ in range(3)]
+    for reader in readers:
+        reader.start()
+    for i in range(10):
+        write_brain({'graph/relationships.yaml': _relationships(300, f'b{i}')})
+        assert store.import_yaml(root) == ['relationships']
+    done.set()
+    for reader in readers:
+        reader.join()
+    store.close()
+
+    assert seen and set(seen) == {300}
+
+
+def test_opening_an_empty_store_fails_clearly(tmp_path):
+    with BrainStore(tmp_path / 'brain.db') as store:
+        with pytest.raises(LookupError, match='import the brain files first'):
+            Brain.from_store(store)
+
+
+def test_brain_from_an_imported_store(write_brain, tmp_path):
+    root = write_brain({'human/network.yaml': _network(3)})
+    (root / 'state.json').write_text(json.dumps({'version': '2.1'}))
+    with BrainStore(tmp_path / 'brain.db') as store:
+        store.import_yaml(root)
+        brain = Brain.from_store(store)
+        assert brain.version == '2.1'
+        assert brain.loaded_sections == ['state']
+        assert brain.entities == []
+        assert len(brain.network.connections) == 3